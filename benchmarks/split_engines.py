@@ -0,0 +1,230 @@
+"""
+分割引擎基准测试：生成可复现的合成语料（英文日志、GBK 中文、超长行、大量短行、正则分隔的记录），
+对每种语料运行各分割模式，报告吞吐量和内存峰值，并与保存的基准结果比较
+每个用例在全新的子进程中通过命令行版（python -m core）运行，内存峰值只属于该次运行；
+耗时和各阶段数据取自命令行结果中的 metrics
+用法：python benchmarks/split_engines.py [--size MB] [--corpus 名称 ...] [--mode 模式 ...]
+                                        [-r 次数] [--save-baseline] [--baseline 文件]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "filesplitter_bench")
+
+# 各模式的默认参数：每个文件的字符数/行数/字节数，或份数
+MODE_SIZES = {
+    "chars": 1000000,
+    "strict": 1000000,
+    "flexible": 1000000,
+    "lines": 20000,
+    "parts": 16,
+    "line_parts": 16,
+    "bytes": 4 * 1024 * 1024,
+    "line_bytes": 4 * 1024 * 1024,
+}
+
+LOG_LEVELS = ["INFO"] * 8 + ["DEBUG", "WARN", "ERROR"]
+LOG_PATHS = ["/api/users", "/api/orders", "/static/app.js", "/login", "/api/search?q=split"]
+PUNCTUATION = "，。、；：？！"
+
+
+def _ascii_log_lines(rng):
+    second = 0
+    while True:
+        second += rng.randint(0, 2)
+        hours, rest = divmod(second, 3600)
+        yield (f"2024-05-{1 + hours // 24 % 28:02d} {hours % 24:02d}:{rest // 60:02d}:{rest % 60:02d}"
+               f".{rng.randint(0, 999):03d} {rng.choice(LOG_LEVELS)} [worker-{rng.randint(1, 16)}] "
+               f"id={rng.getrandbits(64):016x} path={rng.choice(LOG_PATHS)} "
+               f"status={rng.choice((200, 200, 200, 304, 404, 500))} took={rng.randint(1, 900)}ms\n")
+
+
+def _chinese_lines(rng):
+    # 先生成一批“词”再组合成句，比逐字随机快得多
+    words = ["".join(chr(rng.randint(0x4E00, 0x9FA5)) for _ in range(rng.randint(2, 6)))
+             for _ in range(5000)]
+    while True:
+        clauses = ("".join(rng.choices(words, k=rng.randint(2, 5))) + rng.choice(PUNCTUATION)
+                   for _ in range(rng.randint(1, 6)))
+        yield "".join(clauses) + "\n"
+
+
+def _long_lines(rng):
+    while True:
+        length = rng.randint(512 * 1024, 2 * 1024 * 1024)
+        piece = "".join(rng.choice("abcdefghij klmnopqrst 中文字符，") for _ in range(4096))
+        yield piece * (length // len(piece)) + "\n"
+
+
+def _tiny_lines(rng):
+    while True:
+        yield f"{rng.getrandbits(28):07x}"[:rng.randint(0, 7)] + "\n"
+
+
+def _record_lines(rng):
+    number = 0
+    lines = _ascii_log_lines(rng)
+    while True:
+        number += 1
+        yield f"=== RECORD {number} ===\n"
+        for _ in range(rng.randint(1, 200)):
+            yield next(lines)
+
+
+# 语料名称: (生成每一行的函数, 文件编码, 正则模式)；正则模式为 None 的语料不运行 regex 模式
+CORPORA = {
+    "ascii_log": (_ascii_log_lines, "utf-8", None),
+    "gbk_text": (_chinese_lines, "gbk", None),
+    "long_lines": (_long_lines, "utf-8", None),
+    "tiny_lines": (_tiny_lines, "utf-8", None),
+    "records": (_record_lines, "utf-8", r"^=== RECORD \d+ ===$"),
+}
+
+
+def generate_corpus(name, size, data_dir, seed=0):
+    """生成（已存在且大小一致时直接使用）约 size 字节的语料文件，同样的参数总是生成同样的内容"""
+    lines, encoding, _ = CORPORA[name]
+    path = os.path.join(data_dir, f"{name}_{size}.txt")
+    if os.path.isfile(path) and os.path.getsize(path) >= size:
+        return path
+    os.makedirs(data_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    written = 0
+    with open(tmp_path, "wb") as f:
+        batch = []
+        for line in lines(random.Random(f"{name}:{seed}")):
+            batch.append(line)
+            if len(batch) >= 1000 or len(line) > 64 * 1024:
+                data = "".join(batch).encode(encoding)
+                f.write(data)
+                written += len(data)
+                batch = []
+                if written >= size:
+                    break
+    os.replace(tmp_path, path)
+    return path
+
+
+def run_case(path, encoding, mode, value, output_encoding, workers):
+    """在子进程中运行一次分割，返回命令行结果中的 metrics"""
+    out_dir = tempfile.mkdtemp(prefix="filesplitter_bench_out_")
+    try:
+        cmd = [sys.executable, "-m", "core", path, out_dir, "-m", mode, "-q",
+               "--no-index-cache", "-i", encoding, "-o", output_encoding]
+        cmd += ["-p", value] if mode == "regex" else ["-n", str(value)]
+        if workers:
+            cmd += ["-j", str(workers)]
+        result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{mode} 运行失败: {result.stderr.strip().splitlines()[-1:]}")
+        return json.loads(result.stdout.splitlines()[-1])["metrics"][0]
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def measure(path, encoding, mode, value, output_encoding, workers, runs):
+    """
+    多次运行取中位数
+    :return: {"mb_per_s", "elapsed", "peak_memory", "parts", "engine", "phases"}，耗时取中位数，内存取最大值
+    """
+    samples = [run_case(path, encoding, mode, value, output_encoding, workers)
+               for _ in range(runs)]
+    elapsed = statistics.median(sample["elapsed"] for sample in samples)
+    phases = {name: round(statistics.median(sample["phases"].get(name, 0.0) for sample in samples), 4)
+              for name in samples[0]["phases"]}
+    return {
+        "mb_per_s": round(samples[0]["bytes_read"] / elapsed / (1024 * 1024), 2) if elapsed else 0.0,
+        "elapsed": round(elapsed, 4),
+        "peak_memory": max(sample["peak_memory"] or 0 for sample in samples) or None,
+        "parts": samples[0]["parts"],
+        "engine": samples[0]["engine"],
+        "phases": phases,
+    }
+
+
+def compare(result, baseline, threshold):
+    """与基准比较吞吐量，返回 (显示文字, 是否退化)"""
+    if not baseline or not baseline.get("mb_per_s"):
+        return "", False
+    change = result["mb_per_s"] / baseline["mb_per_s"] - 1
+    return f"{change:+7.1%}", change < -threshold
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="分割引擎基准测试")
+    parser.add_argument("--size", type=float, default=32, help="每种语料的大小（MB），默认 32")
+    parser.add_argument("--corpus", nargs="+", choices=CORPORA, default=list(CORPORA),
+                        help="要测试的语料，默认全部")
+    parser.add_argument("--mode", nargs="+", choices=list(MODE_SIZES) + ["regex"],
+                        default=list(MODE_SIZES) + ["regex"], help="要测试的分割模式，默认全部")
+    parser.add_argument("-o", "--output-encoding", default="same",
+                        help="输出编码，same（默认）表示与输入相同，可走按字节复制的快速路径")
+    parser.add_argument("-j", "--workers", type=int,
+                        help="并行进程数，默认使用全部 CPU，1 表示禁用并行")
+    parser.add_argument("-r", "--runs", type=int, default=3, help="每个用例的运行次数，取中位数")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="语料文件的存放目录")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基准结果文件")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果保存为基准")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="吞吐量比基准低多少（比例）算作退化，默认 0.1")
+    parser.add_argument("--json", help="把本次结果保存为 JSON")
+    args = parser.parse_args(argv)
+
+    size = int(args.size * 1024 * 1024)
+    baseline = {}
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("size") != size:
+            print(f"基准的语料大小为 {baseline.get('size')} 字节，与本次不同，吞吐量仅供参考")
+
+    results = {}
+    regressions = []
+    print(f"{'用例':<24} {'MB/s':>9} {'用时(s)':>9} {'内存(MB)':>9} {'文件数':>7}  {'引擎':<9} 对比基准")
+    for corpus in args.corpus:
+        path = generate_corpus(corpus, size, args.data_dir)
+        _, encoding, pattern = CORPORA[corpus]
+        for mode in args.mode:
+            value = pattern if mode == "regex" else MODE_SIZES[mode]
+            if value is None:
+                continue
+            case = f"{corpus}/{mode}"
+            result = measure(path, encoding, mode, value, args.output_encoding, args.workers,
+                             args.runs)
+            results[case] = result
+            change, regressed = compare(result, baseline.get("cases", {}).get(case), args.threshold)
+            if regressed:
+                regressions.append(case)
+            memory = (result["peak_memory"] or 0) / (1024 * 1024)
+            print(f"{case:<24} {result['mb_per_s']:9.1f} {result['elapsed']:9.3f} {memory:9.0f} "
+                  f"{result['parts']:7d}  {result['engine']:<9} {change}{' 退化' if regressed else ''}",
+                  flush=True)
+
+    report = {"size": size, "runs": args.runs, "output_encoding": args.output_encoding,
+              "workers": args.workers, "python": platform.python_version(),
+              "platform": platform.platform(), "cases": results}
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"已保存基准: {args.baseline}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if regressions:
+        print(f"吞吐量比基准低 {args.threshold:.0%} 以上: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
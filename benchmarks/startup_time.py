@@ -0,0 +1,76 @@
+"""
+启动耗时测量：在全新的子进程中用 python -X importtime 导入 main（不打开窗口），
+重复多次取中位数，列出累计耗时最多的模块，便于发现拖慢启动的导入
+用法：python benchmarks/startup_time.py [-n 次数] [--top 条数] [--json 结果文件]
+打包后的程序无法使用 -X importtime，其启动耗时见程序日志中的“启动耗时”一行
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure_once(module):
+    """导入一次 module，返回 {模块名: (自身耗时, 累计耗时, 嵌套层级)}，单位微秒"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            times[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return times
+
+
+def measure(module, runs):
+    """
+    多次测量取中位数
+    :return: (总耗时, [(模块名, 自身耗时, 累计耗时, 嵌套层级)])，按累计耗时从大到小排列，单位毫秒
+    """
+    samples = [measure_once(module) for _ in range(runs)]
+    names = set.intersection(*(set(times) for times in samples))
+    modules = []
+    for name in names:
+        self_ms = statistics.median(times[name][0] for times in samples) / 1000
+        cumulative_ms = statistics.median(times[name][1] for times in samples) / 1000
+        modules.append((name, self_ms, cumulative_ms, samples[0][name][2]))
+    modules.sort(key=lambda item: item[2], reverse=True)
+    total = statistics.median(
+        sum(cumulative for _, cumulative, level in times.values() if level == 0)
+        for times in samples) / 1000
+    return total, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="测量程序启动时的模块导入耗时")
+    parser.add_argument("-m", "--module", default="main", help="要导入的模块，默认 main")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="测量次数，取中位数")
+    parser.add_argument("--top", type=int, default=20, help="列出累计耗时最多的模块数")
+    parser.add_argument("--json", help="把结果保存为 JSON，便于跟踪变化")
+    args = parser.parse_args(argv)
+
+    total, modules = measure(args.module, args.runs)
+    print(f"导入 {args.module} 共 {total:.1f} ms（{args.runs} 次的中位数）")
+    print(f"{'累计(ms)':>10} {'自身(ms)':>10}  模块")
+    for name, self_ms, cumulative_ms, level in modules[:args.top]:
+        print(f"{cumulative_ms:10.1f} {self_ms:10.1f}  {'  ' * level}{name}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"module": args.module, "runs": args.runs, "total_ms": round(total, 2),
+                       "modules": {name: round(cumulative_ms, 2)
+                                   for name, _, cumulative_ms, _ in modules}},
+                      f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+命令行入口：python -m core 输入文件 [输入文件 ...] 输出目录 [选项]
+不导入任何 GUI 模块，可在无图形界面的服务器和定时任务中使用；多个输入文件时使用批量队列同时分割。
+进度、日志和结果以每行一个 JSON 对象的形式写到 stderr，最终结果另外以一行 JSON 写到 stdout，
+其中 metrics 是每个文件的性能指标（读取字节数、解码字符数、各阶段耗时、内存峰值、MB/s），便于比较不同版本的运行。
+退出码：0 成功，1 出错（批量时任一文件失败），2 参数错误，130 被中断（Ctrl+C / SIGTERM）
+"""
+import argparse
+import json
+import re
+import signal
+import sys
+import time
+from .batch import MODES, DONE, BatchQueue, SplitJob
+from .progress import ProgressReporter
+from .cancel import CancelToken, SplitCancelled
+from .compression import OUTPUT_LEVELS
+
+
+def emit(event, **fields):
+    """向 stderr 输出一行 JSON 事件"""
+    sys.stderr.write(json.dumps(dict(event=event, **fields), ensure_ascii=False) + "\n")
+    sys.stderr.flush()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m core", description="文件分割工具（命令行版）")
+    parser.add_argument("inputs", nargs="+", metavar="input", help="输入文件路径，可以有多个")
+    parser.add_argument("output_dir", help="输出目录")
+    parser.add_argument("-m", "--mode", choices=MODES, default="chars",
+                        help="分割模式: " + ", ".join(f"{k}={v}" for k, v in MODES.items()))
+    parser.add_argument("-n", "--size", type=int,
+                        help="每个文件的字符数（chars/strict/flexible）、行数（lines）、份数（parts/line_parts）"
+                             "或字节数（bytes/line_bytes）")
+    parser.add_argument("-p", "--pattern", help="分隔符正则表达式（regex 模式）")
+    parser.add_argument("--include-delimiter", action="store_true", help="分割结果中保留分隔符")
+    parser.add_argument("--no-multiline", action="store_true", help="^/$ 只匹配文件开头/结尾")
+    parser.add_argument("--dotall", action="store_true", help=". 匹配换行")
+    parser.add_argument("-i", "--input-encoding", default="auto", help="输入编码，默认自动检测")
+    parser.add_argument("-o", "--output-encoding", default="same",
+                        help="输出编码，same 表示与输入相同，ansi 表示系统编码")
+    parser.add_argument("-z", "--compress", choices=OUTPUT_LEVELS,
+                        help="分割文件的压缩格式，文件名追加 .gz/.bz2/.xz/.zst")
+    parser.add_argument("--level", type=int,
+                        help="压缩级别，默认 " + ", ".join(
+                            f"{k}={v[0]}" for k, v in OUTPUT_LEVELS.items()))
+    parser.add_argument("-j", "--workers", type=int,
+                        help="并行进程数，默认使用全部 CPU，1 表示禁用并行")
+    parser.add_argument("--resume", action="store_true", help="写入检查点，并从已有检查点继续分割")
+    parser.add_argument("--keep-partial", action="store_true", help="中断时保留已完成的分割文件")
+    parser.add_argument("--no-index-cache", action="store_true",
+                        help="不读写文件索引缓存（编码检测结果、字符数、行数、行索引）")
+    parser.add_argument("-J", "--jobs", type=int, default=2, help="批量分割时同时处理的文件数")
+    parser.add_argument("--per-device", type=int, default=2,
+                        help="批量分割时同一磁盘上同时处理的文件数")
+    parser.add_argument("--max-rate", type=float, help="批量分割时整体读取速度上限（MB/s）")
+    parser.add_argument("--interval", type=float, default=0.5, help="进度事件的最小间隔（秒）")
+    parser.add_argument("-q", "--quiet", action="store_true", help="不输出日志事件")
+    parser.add_argument("--profile", action="store_true",
+                        help="用 cProfile 剖析分割，结果写到输出目录中的 <输入文件名>.prof，热点函数输出到日志")
+    return parser
+
+
+def progress_event(snapshot, **fields):
+    emit("progress", percent=round(snapshot.percent, 1), done=snapshot.done,
+         total=snapshot.total, rate=round(snapshot.rate),
+         eta=None if snapshot.eta is None else round(snapshot.eta, 1), **fields)
+
+
+def build_jobs(args):
+    if args.mode == "regex":
+        value = args.pattern
+        flags = (0 if args.no_multiline else re.MULTILINE) | (re.DOTALL if args.dotall else 0)
+        options = {"include_delimiter": args.include_delimiter, "regex_flags": flags}
+    else:
+        value = args.size
+        options = {"workers": args.workers}
+    output_encoding = "同输入编码" if args.output_encoding == "same" else args.output_encoding
+    return [SplitJob(path, args.output_dir, args.mode, value, args.input_encoding,
+                     output_encoding, keep_partial=args.keep_partial, resumable=args.resume,
+                     output_compression=args.compress, compression_level=args.level,
+                     index_cache=not args.no_index_cache, profile=args.profile, **options)
+            for path in args.inputs]
+
+
+def profile_result(jobs):
+    """启用剖析时结果中列出各文件的剖析结果路径"""
+    paths = [job.profile_path for job in jobs if job.profile_path]
+    return {"profiles": paths} if paths else {}
+
+
+def run(args):
+    """按参数执行分割，返回结果字典"""
+    token = CancelToken()
+    for sig in (signal.SIGINT, getattr(signal, "SIGTERM", None)):
+        if sig is not None:
+            signal.signal(sig, lambda *_: token.cancel())
+    log_callback = None if args.quiet else (lambda msg: emit("log", message=msg))
+    jobs = build_jobs(args)
+
+    if len(jobs) == 1:
+        reporter = ProgressReporter(progress_event, interval=args.interval, detailed=True)
+        parts = jobs[0].run(progress_callback=reporter, log_callback=log_callback,
+                            cancel_token=token)
+        return dict({"parts": parts, "metrics": [jobs[0].metrics.as_dict()]},
+                    **profile_result(jobs))
+
+    queue = BatchQueue(
+        concurrency=args.jobs, per_device=args.per_device,
+        max_rate=args.max_rate * 1024 * 1024 if args.max_rate else None,
+        progress_callback=lambda s: progress_event(s, files_done=queue.finished,
+                                                   files=len(jobs)),
+        log_callback=log_callback,
+        job_callback=lambda job: emit("job", file=job.input_path, status=job.status,
+                                      parts=job.parts, error=job.error),
+        cancel_token=token)
+    queue.reporter.interval = args.interval
+    for job in jobs:
+        queue.add(job)
+    queue.run()
+    if token.cancelled:
+        raise SplitCancelled("分割已取消")
+    return {
+        "parts": sum(job.parts or 0 for job in jobs),
+        "files": len(jobs),
+        "failed": [job.input_path for job in jobs if job.status != DONE],
+        "metrics": [job.metrics.as_dict() for job in jobs if job.metrics],
+        **profile_result(jobs),
+    }
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.mode == "regex":
+        if not args.pattern:
+            parser.error("regex 模式需要 --pattern")
+    elif args.size is None or args.size <= 0:
+        parser.error(f"{args.mode} 模式需要大于 0 的 --size")
+    if args.level is not None and not args.compress:
+        parser.error("--level 需要与 --compress 一起使用")
+
+    start = time.monotonic()
+    try:
+        result = run(args)
+    except SplitCancelled:
+        emit("cancelled")
+        return 130
+    except Exception as e:
+        emit("error", message=str(e), type=type(e).__name__)
+        return 1
+    result["elapsed"] = round(time.monotonic() - start, 3)
+    emit("done", **result)
+    print(json.dumps(result, ensure_ascii=False))
+    return 1 if result.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
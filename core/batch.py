@@ -0,0 +1,247 @@
+import os
+import threading
+import time
+from .splitter import (split_file, split_file_by_bytes, split_file_by_lines,
+                       split_file_by_line_parts, split_file_by_parts, split_file_by_regex)
+from .parallel import resolve_workers
+from .progress import ProgressReporter
+from .profiling import profile_path, profile_run
+from .cancel import CancelToken, SplitCancelled
+
+# 模式名与界面中的分割模式一一对应
+MODES = {
+    "chars": "按字符分割",
+    "lines": "按行分割",
+    "strict": "严格行分割",
+    "flexible": "灵活行分割",
+    "parts": "份数分割",
+    "line_parts": "整行份数分割",
+    "bytes": "按字节分割",
+    "line_bytes": "整行字节分割",
+    "regex": "按正则分割",
+}
+
+# 任务状态
+PENDING = "等待"
+RUNNING = "运行中"
+DONE = "完成"
+FAILED = "失败"
+CANCELLED = "已取消"
+
+
+class SplitJob:
+    """一个分割任务：输入文件、输出目录、分割模式及其参数"""
+
+    def __init__(self, input_path, output_dir, mode, value,
+                 input_encoding="auto", output_encoding="同输入编码", **options):
+        """
+        :param mode: MODES 中的模式名
+        :param value: 字符数/行数/份数/字节数，regex 模式为正则表达式
+        :param options: 传给分割函数的其他参数（include_delimiter、regex_flags、
+                        keep_partial、resumable、workers、output_compression、index_cache 等）；
+                        profile=True 时用 cProfile 剖析本次分割
+        """
+        if mode not in MODES:
+            raise ValueError(f"未知的分割模式: {mode}")
+        self.input_path = input_path
+        self.output_dir = output_dir
+        self.mode = mode
+        self.value = value
+        self.input_encoding = input_encoding
+        self.output_encoding = output_encoding
+        self.options = options
+        self.status = PENDING
+        self.parts = None
+        self.error = None
+        self.reporter = None
+        self.metrics = None   # 运行结束后的 RunMetrics
+        self.profile_path = None
+        try:
+            stat = os.stat(input_path)
+            self.size, self.device = stat.st_size, stat.st_dev
+        except OSError:
+            self.size, self.device = 0, None  # 运行时由分割函数报告文件不存在
+
+    @property
+    def name(self):
+        return os.path.basename(self.input_path)
+
+    @property
+    def done(self):
+        """已处理的字节数"""
+        return self.reporter.done if self.reporter else 0
+
+    def run(self, **kwargs):
+        """
+        执行分割，kwargs 覆盖构造时的参数（progress_callback、log_callback、cancel_token 等）
+        运行结束后的性能指标保存在 self.metrics 中
+        :return: 创建的文件数量
+        """
+        options = dict(self.options, **kwargs)
+        if options.pop("profile", False):
+            self.profile_path = profile_path(self.output_dir, self.input_path)
+            with profile_run(self.profile_path, options.get("log_callback")):
+                return self._run(options)
+        return self._run(options)
+
+    def _run(self, options):
+        metrics_callback = options.pop("metrics_callback", None)
+
+        def on_metrics(metrics):
+            self.metrics = metrics
+            if metrics_callback:
+                metrics_callback(metrics)
+
+        options["metrics_callback"] = on_metrics
+        args = (self.input_path, self.output_dir, self.value,
+                self.input_encoding, self.output_encoding)
+        if self.mode == "regex":
+            options.pop("workers", None)
+            return split_file_by_regex(*args, **options)
+        if self.mode == "parts":
+            options.pop("workers", None)
+            return split_file_by_parts(*args, **options)
+        if self.mode in ("bytes", "line_bytes"):
+            options.pop("workers", None)
+            return split_file_by_bytes(*args, keep_lines=self.mode == "line_bytes", **options)
+        if self.mode == "line_parts":
+            return split_file_by_line_parts(*args, **options)
+        if self.mode == "lines":
+            return split_file_by_lines(*args, **options)
+        return split_file(*args, split_by_line=self.mode != "chars",
+                          line_split_mode="flexible" if self.mode == "flexible" else "strict",
+                          **options)
+
+
+class BatchQueue:
+    """
+    批量分割队列：多个文件同时分割，汇总整体进度和吞吐量
+    同一磁盘上同时运行的任务数受 per_device 限制，避免多个任务争抢同一块磁盘的寻道；
+    设置 max_rate 时按整体读取速度限速
+    """
+
+    def __init__(self, concurrency=2, per_device=2, max_rate=None, progress_callback=None,
+                 log_callback=None, job_callback=None, cancel_token=None):
+        """
+        :param concurrency: 同时运行的任务数
+        :param per_device: 同一设备（磁盘）上同时运行的任务数
+        :param max_rate: 整体读取速度上限（字节/秒），None 表示不限
+        :param progress_callback: 整体进度回调，传入 ProgressSnapshot
+        :param log_callback: 日志回调函数，消息带有文件名前缀
+        :param job_callback: 任务状态变化时回调，传入 SplitJob（进度可从 job.done / job.size 读取）
+        :param cancel_token: CancelToken，所有任务共用
+        """
+        self.concurrency = max(1, concurrency)
+        self.per_device = max(1, per_device)
+        self.max_rate = max_rate
+        self.log_callback = log_callback
+        self.job_callback = job_callback
+        self.token = cancel_token or CancelToken()
+        self.reporter = ProgressReporter(progress_callback, detailed=True)
+        self.jobs = []
+        self._cond = threading.Condition()
+        self._progress_lock = threading.Lock()
+        self._device_load = {}
+        self._running = 0
+
+    def add(self, job):
+        self.jobs.append(job)
+        return job
+
+    @property
+    def finished(self):
+        """已结束（完成、失败或取消）的任务数"""
+        return sum(job.status in (DONE, FAILED, CANCELLED) for job in self.jobs)
+
+    def run(self):
+        """
+        运行队列中的全部任务，阻塞到所有任务结束
+        单个任务失败不影响其他任务；取消后尚未开始的任务标记为已取消
+        :return: 任务列表
+        """
+        self.reporter.start(sum(job.size for job in self.jobs))
+        # 每个任务内部的并行引擎分摊 CPU，避免进程数成倍增加
+        workers = max(1, resolve_workers() // self.concurrency)
+        pending = list(self.jobs)
+        if self.log_callback:
+            self.log_callback(f"批量分割 {len(pending)} 个文件，同时运行 {self.concurrency} 个任务")
+
+        with self._cond:
+            while pending or self._running:
+                if self.token.cancelled:
+                    for job in pending:
+                        self._set_status(job, CANCELLED)
+                    pending = []
+                job = self._next_job(pending)
+                if job is None:
+                    self._cond.wait()
+                    continue
+                pending.remove(job)
+                self._running += 1
+                self._device_load[job.device] = self._device_load.get(job.device, 0) + 1
+                threading.Thread(target=self._run_job, args=(job, workers), daemon=True).start()
+
+        self.reporter.finish()
+        self._log_summary()
+        return self.jobs
+
+    def _next_job(self, pending):
+        """取出下一个可以开始的任务：总数和所在设备的并发数都未达上限"""
+        if self._running >= self.concurrency:
+            return None
+        for job in pending:
+            if self._device_load.get(job.device, 0) < self.per_device:
+                return job
+        return None
+
+    def _run_job(self, job, workers):
+        job.reporter = ProgressReporter(lambda _: self._on_progress(), job.size)
+        self._set_status(job, RUNNING)
+
+        def log(msg):
+            if self.log_callback:
+                self.log_callback(f"[{job.name}] {msg}")
+
+        try:
+            job.parts = job.run(progress_callback=job.reporter, log_callback=log,
+                                cancel_token=self.token, workers=workers)
+            self._set_status(job, DONE)
+        except SplitCancelled:
+            self._set_status(job, CANCELLED)
+        except Exception as e:
+            job.error = str(e)
+            self._set_status(job, FAILED)
+            log(f"分割失败: {e}")
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._device_load[job.device] -= 1
+                self._cond.notify()
+            self._on_progress()
+
+    def _set_status(self, job, status):
+        job.status = status
+        if self.job_callback:
+            self.job_callback(job)
+
+    def _on_progress(self):
+        """任务进度回调（在任务线程中调用）：汇总整体进度，必要时限速"""
+        with self._progress_lock:
+            done = sum(j.done for j in self.jobs)
+            self.reporter.update(done)
+        if self.max_rate:
+            # 读取超前于限速时让当前任务线程等待，等待期间任务不会继续读取
+            ahead = done / self.max_rate - (time.monotonic() - self.reporter.start_time)
+            if ahead > 0:
+                time.sleep(min(ahead, 1.0))
+
+    def _log_summary(self):
+        if not self.log_callback:
+            return
+        elapsed = time.monotonic() - self.reporter.start_time
+        done = sum(job.status == DONE for job in self.jobs)
+        failed = sum(job.status == FAILED for job in self.jobs)
+        total_mb = sum(job.size for job in self.jobs if job.status == DONE) / (1024 * 1024)
+        rate = total_mb / elapsed if elapsed > 0 else 0.0
+        self.log_callback(f"批量分割结束: 完成 {done}/{len(self.jobs)} 个文件，失败 {failed} 个，"
+                          f"共 {total_mb:.1f} MB，用时 {elapsed:.1f} 秒，平均 {rate:.1f} MB/s")
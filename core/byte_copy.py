@@ -0,0 +1,278 @@
+import codecs
+import os
+from .file_utils import (copy_byte_range, codec_name, is_single_byte, read_safe_blocks,
+                         keep_cr_tail, keep_utf8_tail)
+from .parallel import UnsupportedInput, is_char_countable, is_line_safe
+from .cancel import CancelToken, PartTracker
+from .checkpoint import ResumePoint
+from .compression import output_suffix
+from .part_writer import PartWriter, WRITE_BUFFER_CHARS
+
+SCAN_WINDOW_SIZE = 4096  # 定位字符边界时逐字节扫描的最大窗口
+
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))  # UTF-8 后续字节
+
+
+def can_copy_bytes(input_encoding, output_encoding):
+    """输入输出编码相同且能在字节中直接定位换行时，可以跳过解码直接复制字节"""
+    return (codec_name(input_encoding) == codec_name(output_encoding)
+            and is_line_safe(input_encoding))
+
+
+def _count_chars(block, start, end, single_byte):
+    """不解码直接按字节统计字符数（UTF-8 只统计首字节），\\r\\n 计为一个字符"""
+    if single_byte:
+        chars = end - start
+    else:
+        chars = len(block[start:end].translate(None, CONTINUATION_BYTES))
+    return chars - block.count(b"\r\n", start, end)
+
+
+def count_chars(input_path, encoding):
+    """
+    不解码统计文件字符数，仅支持 UTF-8 和单字节编码
+    对合法的输入与文本模式读取得到的字符数一致
+    """
+    if not is_char_countable(encoding):
+        raise UnsupportedInput(f"编码不支持按字节统计字符: {encoding}")
+    codec = codec_name(encoding)
+    single_byte = is_single_byte(codec)
+    total = 0
+    with open(input_path, "rb") as f:
+        for base, block, _ in read_safe_blocks(f, keep_cr_tail):
+            if base == 0 and codec == "utf-8-sig" and block.startswith(codecs.BOM_UTF8):
+                block = block[3:]
+            total += _count_chars(block, 0, len(block), single_byte)
+    return total
+
+
+def count_newlines(input_path):
+    """
+    不解码统计文件中的换行字节，仅适用于换行可在字节中直接定位的编码（is_line_safe）
+    :return: {"lf": \\n 的个数, "cr": \\r 的个数, "crlf": \\r\\n 的个数}
+    """
+    counts = {"lf": 0, "cr": 0, "crlf": 0}
+    with open(input_path, "rb") as f:
+        for _, block, _ in read_safe_blocks(f, keep_cr_tail):
+            counts["lf"] += block.count(b"\n")
+            counts["cr"] += block.count(b"\r")
+            counts["crlf"] += block.count(b"\r\n")
+    return counts
+
+
+def has_native_newlines(counts):
+    """
+    文件中的换行符是否都已是系统换行符 os.linesep：解码的引擎以文本模式读写，
+    把 \\r\\n、\\r、\\n 统一写成 os.linesep，只有换行符本来就是它时直接复制字节的结果才与之一致
+    :param counts: count_newlines() 的结果
+    """
+    if os.linesep == "\n":
+        return counts["cr"] == 0
+    return counts["lf"] == counts["cr"] == counts["crlf"]
+
+
+def _locate_char(block, start, need, single_byte):
+    """从 block[start] 开始逐字节数出 need 个字符，返回其后的字节下标"""
+    j = start
+    if not single_byte:
+        # 窗口可能从多字节字符中间开始，这些后续字节已计入前一个字符
+        while j < len(block) and 0x80 <= block[j] < 0xC0:
+            j += 1
+    while need > 0:
+        byte = block[j]
+        j += 1
+        if byte == 0x0D and j < len(block) and block[j] == 0x0A:
+            j += 1
+        elif not single_byte:
+            while j < len(block) and 0x80 <= block[j] < 0xC0:
+                j += 1
+        need -= 1
+    return j
+
+
+def iter_raw_char_ranges(input_path, chars_per_part, encoding, start=0):
+    """
+    不解码扫描文件，生成每 chars_per_part 个字符一份的字节范围 (start, end)
+    :param input_path: 输入文件路径
+    :param chars_per_part: 每份字符数
+    :param encoding: 输入编码（UTF-8 或单字节编码）
+    :param start: 开始扫描的字节偏移（必须位于字符边界）
+    """
+    if not is_char_countable(encoding):
+        raise UnsupportedInput(f"编码不支持按字节定位字符: {encoding}")
+    codec = codec_name(encoding)
+    single_byte = is_single_byte(codec)
+    keep_tail = keep_cr_tail if single_byte else keep_utf8_tail
+
+    file_size = os.path.getsize(input_path)
+    need = chars_per_part
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        for base, block, _ in read_safe_blocks(f, keep_tail):
+            j = 0
+            if base == 0 and codec == "utf-8-sig" and block.startswith(codecs.BOM_UTF8):
+                j = 3
+            while j < len(block):
+                window_end = min(j + SCAN_WINDOW_SIZE, len(block))
+                if block[window_end - 1] == 0x0D:
+                    window_end = min(window_end + 1, len(block))
+                found = _count_chars(block, j, window_end, single_byte)
+                if found < need:
+                    need -= found
+                    j = window_end
+                    continue
+                j = _locate_char(block, j, need, single_byte)
+                yield start, base + j
+                start = base + j
+                need = chars_per_part
+    if start < file_size:
+        yield start, file_size
+
+
+def _last_line_start(f, start, end):
+    """(start, end] 中最后一个行首（\\n、\\r\\n 或单独的 \\r 之后），没有时返回 None"""
+    limit = end
+    while limit > start:
+        base = max(start, limit - SCAN_WINDOW_SIZE)
+        f.seek(base)
+        window = f.read(limit - base + 1)  # 多读一个字节，判断末尾的 \r 之后是否为 \n
+        last = limit - base
+        while last > 0:
+            i = max(window.rfind(b"\n", 0, last), window.rfind(b"\r", 0, last))
+            if i < 0:
+                break
+            if window[i] == 0x0D and window[i + 1:i + 2] == b"\n":
+                last = i  # 分割点会落在 \r\n 之间
+                continue
+            return base + i + 1
+        limit = base
+    return None
+
+
+def _char_boundary(f, start, end, single_byte):
+    """不超过 end 的最后一个字符边界，不会拆开 \\r\\n；一个字符都放不下时返回第一个字符之后"""
+    base = max(start, end - 4)
+    f.seek(base)
+    window = f.read(end - base + 1)
+    cut = end - base
+    if not single_byte:
+        while 0 < cut < len(window) and 0x80 <= window[cut] < 0xC0:
+            cut -= 1
+    if cut > 0 and window[cut - 1:cut + 1] == b"\r\n":
+        cut -= 1
+    if base + cut > start:
+        return base + cut
+    f.seek(start)
+    return start + _locate_char(f.read(SCAN_WINDOW_SIZE), 0, 1, single_byte)
+
+
+def iter_byte_ranges(input_path, bytes_per_part, encoding, keep_lines=False, start=0):
+    """
+    不解码扫描文件，生成每份不超过 bytes_per_part 字节的字节范围 (start, end)，
+    分割点不会落在多字节字符或 \\r\\n 中间；utf-8-sig 在后续分割文件开头补上的 BOM 也计入大小
+    :param input_path: 输入文件路径
+    :param bytes_per_part: 每份字节数上限
+    :param encoding: 输入编码；按字符定位时只支持 UTF-8 和单字节编码
+    :param keep_lines: 是否在行首分割；比一份还长的行按字符截断
+    :param start: 开始扫描的字节偏移（必须位于字符边界）
+    """
+    if not is_line_safe(encoding) or not (keep_lines or is_char_countable(encoding)):
+        raise UnsupportedInput(f"编码不支持按字节定位字符: {encoding}")
+    codec = codec_name(encoding)
+    single_byte = is_single_byte(codec)
+    bom = len(codecs.BOM_UTF8) if codec == "utf-8-sig" else 0
+
+    file_size = os.path.getsize(input_path)
+    with open(input_path, "rb") as f:
+        while start < file_size:
+            end = max(start, start + bytes_per_part - (bom if start > 0 else 0))
+            if end >= file_size:
+                yield start, file_size
+                return
+            cut = _last_line_start(f, start, end) if keep_lines else None
+            if cut is None:
+                if not is_char_countable(encoding):
+                    raise UnsupportedInput(f"行长超过每份字节数，编码不支持按字节定位字符: {encoding}")
+                cut = _char_boundary(f, start, end, single_byte)
+            yield start, cut
+            start = cut
+
+
+def split_ranges_copy(input_path, output_dir, ranges, encoding,
+                      reporter=None, log_callback=None, cancel_token=None, tracker=None,
+                      first_part=1, compression=None, level=None):
+    """
+    按字节范围直接复制出各个 _partN 文件，全程不解码；
+    启用输出压缩时读出的字节交给 PartWriter 在后台线程中压缩，压缩与读取同时进行
+    :param ranges: (start, end) 字节范围的迭代器，可能抛出 UnsupportedInput
+    :param encoding: 输入（同时也是输出）编码
+    :param reporter: ProgressReporter 进度汇报器
+    :param cancel_token: CancelToken 取消/暂停令牌
+    :param tracker: PartTracker，登记已写完的文件
+    :param first_part: 第一个范围对应的分割文件序号（断点续分时大于 1）
+    :param compression: 输出压缩格式，None 表示不压缩
+    :param level: 压缩级别
+    :return: 创建的文件总数（含续分前已完成的）；输入不支持时返回 None，由调用方回退
+    """
+    filename = os.path.basename(input_path)
+    base_name, ext = os.path.splitext(filename)
+    ext += output_suffix(compression)
+    # 文本模式写出 utf-8-sig 时每个文件开头都有 BOM，这里保持一致
+    bom = codecs.BOM_UTF8 if codec_name(encoding) == "utf-8-sig" else b""
+
+    if log_callback:
+        log_callback("输入输出编码相同，直接按字节复制")
+
+    token = cancel_token or CancelToken()
+    tracker = tracker or PartTracker()
+    part_no = first_part - 1
+    try:
+        with open(input_path, "rb") as in_f:
+            if compression:
+                return _compress_ranges(in_f, output_dir, base_name, ext, ranges, bom,
+                                        compression, level, reporter, log_callback, token,
+                                        tracker, first_part)
+            for start, end in ranges:
+                token.check()
+                part_no += 1
+                out_path = os.path.join(output_dir, f"{base_name}_part{part_no}{ext}")
+                with open(out_path, "wb") as out_f:
+                    tracker.begin(out_path)
+                    if bom and start > 0:
+                        out_f.write(bom)
+                    copy_byte_range(in_f, out_f, start, end - start, check=token.check)
+                tracker.end(part_no, ResumePoint(end, 0, ""))
+                if log_callback:
+                    log_callback(f"已创建分割文件: {os.path.basename(out_path)} ({end - start} 字节)")
+                if reporter:
+                    reporter.update(end)
+    except UnsupportedInput as e:
+        tracker.rollback()
+        if log_callback:
+            log_callback(f"无法按字节复制（{e}），回退到逐行解码分割")
+        return None
+    return part_no
+
+
+def _compress_ranges(in_f, output_dir, base_name, ext, ranges, bom, compression, level,
+                     reporter, log_callback, token, tracker, first_part):
+    """按字节范围读出各份并压缩写出，返回创建的文件总数"""
+    with PartWriter(output_dir, base_name, ext, None, tracker, compression, level,
+                    log_callback, first_part) as writer:
+        for start, end in ranges:
+            token.check()
+            if start > 0:
+                writer.write(bom)
+            in_f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                token.check()
+                block = in_f.read(min(WRITE_BUFFER_CHARS, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                writer.write(block)
+            writer.end_part(ResumePoint(end, 0, ""))
+            if reporter:
+                reporter.update(end)
+    return writer.last_part
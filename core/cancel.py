@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+import threading
+from contextlib import contextmanager
+
+
+class SplitCancelled(Exception):
+    """分割任务被用户取消"""
+
+
+class CancelToken:
+    """
+    分割任务的取消/暂停令牌，由 UI 线程控制，分割函数在工作循环中调用 check()
+    并行引擎的工作进程通过 process_events() 取得的进程间事件同步状态
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+        self._interrupted = False  # 快速路径：未暂停也未取消时 check() 只读一个属性
+        self._process_events = None
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._resumed.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._resumed.set()
+        self._interrupted = True
+        if self._process_events:
+            self._process_events[0].set()
+            self._process_events[1].set()
+
+    def pause(self):
+        if self.cancelled:
+            return
+        self._resumed.clear()
+        self._interrupted = True
+        if self._process_events:
+            self._process_events[1].clear()
+
+    def resume(self):
+        self._resumed.set()
+        self._interrupted = self.cancelled
+        if self._process_events:
+            self._process_events[1].set()
+
+    def check(self):
+        """暂停时阻塞直到继续；已取消时抛出 SplitCancelled"""
+        if not self._interrupted:
+            return
+        self._resumed.wait()
+        if self._cancelled.is_set():
+            raise SplitCancelled("分割已取消")
+
+    def process_events(self):
+        """返回 (取消事件, 继续事件)，可传给工作进程"""
+        if self._process_events is None:
+            cancelled, resumed = multiprocessing.Event(), multiprocessing.Event()
+            if self.cancelled:
+                cancelled.set()
+            if not self.paused:
+                resumed.set()
+            self._process_events = (cancelled, resumed)
+        return self._process_events
+
+
+def check_process_events(events):
+    """工作进程中使用的 check()"""
+    if events is None:
+        return
+    cancelled, resumed = events
+    resumed.wait()
+    if cancelled.is_set():
+        raise SplitCancelled("分割已取消")
+
+
+class PartTracker:
+    """记录本次分割写出的文件，任务取消时据此清理；启用断点续分时同时写入检查点"""
+
+    def __init__(self, checkpoint=None):
+        """
+        :param checkpoint: Checkpoint 检查点，续分时其中已完成的文件也归入本次任务
+        """
+        self.checkpoint = checkpoint
+        self.completed = checkpoint.part_paths() if checkpoint else []
+        self.current = None       # 正在写入的文件路径
+        self.current_file = None  # 正在写入的文件对象（清理前需要先关闭）
+
+    def add(self, path, part_no=None, resume=None, checksum=None):
+        """
+        登记一个已写完的文件
+        :param part_no: 分割文件序号
+        :param resume: 该文件之后的续分位置 ResumePoint，提供时写入检查点
+        :param checksum: 已算好的 (字节数, CRC32)
+        """
+        self.completed.append(path)
+        if self.checkpoint and resume is not None:
+            self.checkpoint.record(part_no, path, resume, checksum)
+
+    def begin(self, path, file=None):
+        """开始写入一个文件"""
+        self.current, self.current_file = path, file
+
+    def end(self, part_no=None, resume=None):
+        """当前文件写完"""
+        if self.current:
+            self.add(self.current, part_no, resume)
+        self.current = self.current_file = None
+
+    def rollback(self):
+        """引擎中途放弃、改用其他引擎重新分割前调用，撤销本次写入的检查点记录"""
+        if self.checkpoint:
+            self.checkpoint.rollback()
+
+    def finish(self):
+        """分割全部完成，删除检查点"""
+        if self.checkpoint:
+            self.checkpoint.finish()
+
+    @contextmanager
+    def cleanup_on_cancel(self, keep_partial=False, log_callback=None):
+        """
+        任务取消时删除写到一半的文件；keep_partial 为 False 时连同已写完的文件和检查点一起删除
+        """
+        try:
+            yield self
+        except SplitCancelled:
+            if self.current_file:
+                self.current_file.close()
+            _remove(self.current)
+            if keep_partial:
+                if log_callback:
+                    log_callback(f"已取消，保留已完成的 {len(self.completed)} 个分割文件")
+            else:
+                for path in self.completed:
+                    _remove(path)
+                if self.checkpoint:
+                    self.checkpoint.discard()
+                if log_callback:
+                    log_callback(f"已取消，已删除 {len(self.completed)} 个分割文件")
+            raise
+        finally:
+            if self.checkpoint:
+                self.checkpoint.close()
+
+
+def _remove(path):
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
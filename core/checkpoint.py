@@ -0,0 +1,187 @@
+import json
+import os
+import zlib
+from collections import namedtuple
+
+MANIFEST_VERSION = 1
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+# 续分位置：
+#   offset - 输入文件的定位值（文本模式 tell() 的返回值；字节引擎中即字节偏移）
+#   skip   - 定位后还需跳过的字符数
+#   carry  - 已读出但属于下一个分割文件开头的文本
+ResumePoint = namedtuple("ResumePoint", "offset skip carry")
+START = ResumePoint(0, 0, "")
+
+
+def manifest_path(input_path, output_dir):
+    """检查点清单保存在输出目录中，按输入文件名区分"""
+    return os.path.join(output_dir, os.path.basename(input_path) + ".checkpoint.json")
+
+
+def file_checksum(path):
+    """返回文件的 (字节数, CRC32)"""
+    size = 0
+    crc = 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(CHECKSUM_BLOCK_SIZE)
+            if not block:
+                break
+            size += len(block)
+            crc = zlib.crc32(block, crc)
+    return size, crc
+
+
+def byte_offset(point, file_size):
+    """续分位置能否直接交给按字节工作的引擎，可以时返回字节偏移，否则返回 None"""
+    if point.skip or point.carry or point.offset > file_size:
+        # 文本模式的 tell() 在解码器有未决状态时会编码额外信息，数值大于文件大小
+        return None
+    return point.offset
+
+
+def seek_resume_point(f, point):
+    """把文本文件对象定位到续分位置，返回跳过的文本（供需要上文的正则分割使用）"""
+    if point.offset:
+        f.seek(point.offset)
+    return f.read(point.skip) if point.skip else ""
+
+
+class Checkpoint:
+    """
+    断点续分的检查点清单（JSON Lines）：
+    第一行记录输入文件大小、修改时间和分割参数，之后每写完一个分割文件追加一行，
+    包含文件名、字节数、CRC32 以及之后的续分位置
+    """
+
+    def __init__(self, path, output_dir, header):
+        self.path = path
+        self.output_dir = output_dir
+        self.header = header
+        self.records = []   # 已校验通过的连续记录（第 1 ~ N 个分割文件）
+        self._file = None
+
+    @classmethod
+    def open(cls, input_path, output_dir, mode, params, log_callback=None):
+        """
+        读取并校验已有的检查点，然后重写清单，只保留校验通过的记录
+        :param mode: 分割方式（分割函数名）
+        :param params: 影响分割结果的参数，与检查点中的不一致时从头开始
+        """
+        stat = os.stat(input_path)
+        header = {
+            "version": MANIFEST_VERSION,
+            "input": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+            "mode": mode,
+            "params": params,
+        }
+        checkpoint = cls(manifest_path(input_path, output_dir), output_dir, header)
+        checkpoint._load(log_callback)
+        checkpoint._rewrite()
+        return checkpoint
+
+    @property
+    def completed(self):
+        """已完成的分割文件数"""
+        return len(self.records)
+
+    @property
+    def resume_point(self):
+        if not self.records:
+            return START
+        return ResumePoint(*self.records[-1]["resume"])
+
+    def part_paths(self):
+        return [os.path.join(self.output_dir, record["file"]) for record in self.records]
+
+    def record(self, part_no, path, resume_point, checksum=None):
+        """
+        登记一个写完的分割文件
+        :param checksum: 已算好的 (字节数, CRC32)，省略时读取文件计算
+        """
+        size, crc = checksum or file_checksum(path)
+        record = {
+            "part": part_no,
+            "file": os.path.basename(path),
+            "size": size,
+            "crc32": crc,
+            "resume": list(resume_point),
+        }
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def rollback(self):
+        """撤销本次运行追加的记录（切换分割引擎前调用）"""
+        self._rewrite()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """分割全部完成，删除清单"""
+        self.discard()
+
+    def discard(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _load(self, log_callback):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            if log_callback:
+                log_callback(f"无法读取检查点，从头开始分割: {e}")
+            return
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break  # 中断时最后一行可能没有写完
+        if not entries or entries[0] != self.header:
+            if entries and log_callback:
+                log_callback("检查点与当前输入文件或分割参数不一致，从头开始分割")
+            return
+
+        # 并行引擎的分割文件可能乱序完成，同一文件以最后一次记录为准
+        by_part = {}
+        for entry in entries[1:]:
+            if isinstance(entry, dict) and "part" in entry:
+                by_part[entry["part"]] = entry
+        part_no = 1
+        while part_no in by_part:
+            record = by_part[part_no]
+            path = os.path.join(self.output_dir, record["file"])
+            try:
+                valid = file_checksum(path) == (record["size"], record["crc32"])
+            except OSError:
+                valid = False
+            if not valid:
+                if log_callback:
+                    log_callback(f"分割文件校验失败，从此处重新分割: {record['file']}")
+                break
+            self.records.append(record)
+            part_no += 1
+        if log_callback:
+            log_callback(f"发现检查点，已校验 {self.completed} 个分割文件，"
+                         f"从第 {self.completed + 1} 个继续")
+
+    def _rewrite(self):
+        self.close()
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for entry in [self.header] + self.records:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.path)
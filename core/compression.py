@@ -0,0 +1,255 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+
+try:
+    from compression import zstd as _zstd_stdlib  # Python 3.14+
+except ImportError:
+    _zstd_stdlib = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DECOMPRESS_CHUNK_SIZE = 1024 * 1024  # 后台线程每次解压出的数据量
+DECOMPRESS_QUEUE_CHUNKS = 8          # 解压线程最多领先的块数
+
+# 按文件头识别压缩格式，不依赖扩展名
+MAGIC_NUMBERS = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+EXTENSIONS = {
+    "gzip": (".gz", ".gzip"),
+    "bz2": (".bz2",),
+    "xz": (".xz",),
+    "zstd": (".zst", ".zstd"),
+}
+
+# 输出压缩：格式 -> (默认级别, 最低级别, 最高级别)
+OUTPUT_LEVELS = {
+    "gzip": (6, 1, 9),
+    "bz2": (9, 1, 9),
+    "xz": (6, 0, 9),
+    "zstd": (3, 1, 22),
+}
+
+
+def detect_compression(path):
+    """返回文件的压缩格式（gzip/bz2/xz/zstd），未压缩时返回 None"""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, codec in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def output_name(input_path):
+    """
+    分割文件名的 (主文件名, 扩展名)
+    压缩输入先去掉压缩扩展名：a.log.gz 的分割文件为 a_part1.log
+    """
+    filename = os.path.basename(input_path)
+    codec = detect_compression(input_path) if os.path.isfile(input_path) else None
+    if codec and filename.lower().endswith(EXTENSIONS[codec]):
+        filename = os.path.splitext(filename)[0]
+    return os.path.splitext(filename)
+
+
+def open_input(path, encoding=None, errors="replace"):
+    """
+    打开输入文件，压缩文件透明地边读边解压
+    :param encoding: 文本编码，为 None 时以二进制方式打开
+    """
+    codec = detect_compression(path)
+    if codec is None:
+        if encoding is None:
+            return open(path, "rb")
+        return open(path, "r", encoding=encoding, errors=errors)
+    stream = io.BufferedReader(DecompressReader(path, codec), DECOMPRESS_CHUNK_SIZE)
+    if encoding is None:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, errors=errors)
+
+
+def position_reader(f):
+    """
+    返回获取已读取输入字节数的函数，用于进度显示
+    压缩文件按已读取的压缩字节数计算，与 os.path.getsize() 得到的总量一致；
+    自带 position() 方法的读取器（如内存映射读取器）直接使用该方法
+    """
+    if callable(getattr(f, "position", None)):
+        return f.position
+    buffer = getattr(f, "buffer", f)
+    raw = getattr(buffer, "raw", None)
+    if isinstance(raw, DecompressReader):
+        return lambda: raw.position
+    return buffer.tell
+
+
+def output_suffix(compression):
+    """压缩输出的分割文件追加的扩展名，不压缩时为空"""
+    return EXTENSIONS[compression][0] if compression else ""
+
+
+def resolve_level(compression, level=None):
+    """
+    校验输出压缩格式和级别
+    :return: 压缩级别，未指定时使用该格式的默认级别；不压缩时返回 None
+    """
+    if not compression:
+        return None
+    if compression not in OUTPUT_LEVELS:
+        raise ValueError(f"不支持的压缩格式: {compression}")
+    if compression == "zstd" and not (_zstd_stdlib or zstandard):
+        raise ValueError("写出 .zst 文件需要安装 zstandard: pip install zstandard")
+    default, low, high = OUTPUT_LEVELS[compression]
+    if level is None:
+        return default
+    if not low <= level <= high:
+        raise ValueError(f"{compression} 压缩级别应在 {low}~{high} 之间")
+    return level
+
+
+def open_output(path, encoding, compression=None, level=None):
+    """
+    打开分割文件用于写出，compression 不为空时边写边压缩
+    :param encoding: 文本编码，为 None 时以二进制方式打开
+    """
+    if not compression:
+        if encoding is None:
+            return open(path, "wb")
+        return open(path, "w", encoding=encoding, errors="replace")
+    level = resolve_level(compression, level)
+    if compression == "gzip":
+        stream = gzip.GzipFile(path, "wb", compresslevel=level)
+    elif compression == "bz2":
+        stream = bz2.BZ2File(path, "wb", compresslevel=level)
+    elif compression == "xz":
+        stream = lzma.LZMAFile(path, "wb", preset=level)
+    elif _zstd_stdlib:
+        stream = _zstd_stdlib.ZstdFile(path, "wb", level=level)
+    else:
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(open(path, "wb"))
+    if encoding is None:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, errors="replace")
+
+
+def _open_decompressor(codec, raw):
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if codec == "bz2":
+        return bz2.BZ2File(raw)
+    if codec == "xz":
+        return lzma.LZMAFile(raw)
+    if _zstd_stdlib:
+        return _zstd_stdlib.ZstdFile(raw)
+    if zstandard:
+        return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+    raise ValueError("读取 .zst 文件需要安装 zstandard: pip install zstandard")
+
+
+class DecompressReader(io.RawIOBase):
+    """
+    压缩文件的只读流：后台线程解压（zlib/bz2/lzma/zstd 解压时释放 GIL），
+    解压与主线程的解码、分割、写出同时进行；多成员 gzip、多帧 zstd 依次解压
+    position 为已读出数据对应的压缩字节数；
+    支持 seek（向前跳读，向后重新解压），供文本模式的 tell()/seek() 及断点续分使用
+    """
+
+    def __init__(self, path, codec):
+        super().__init__()
+        self.path = path
+        self.codec = codec
+        self._start()
+
+    def _start(self):
+        self.position = 0
+        self._offset = 0        # 已读出的解压后字节数
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._raw = open(self.path, "rb")
+        self._queue = queue.Queue(DECOMPRESS_QUEUE_CHUNKS)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """解压线程：把 (解压数据, 已读取的压缩字节数) 放入队列，出错时放入异常"""
+        try:
+            reader = _open_decompressor(self.codec, self._raw)
+            while not self._stop.is_set():
+                data = reader.read(DECOMPRESS_CHUNK_SIZE)
+                self._put((data, self._raw.tell()))
+                if not data:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _shutdown(self):
+        self._stop.set()
+        self._thread.join()
+        self._raw.close()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                raise item
+            data, self.position = item
+            if not data:
+                self._eof = True
+                return 0
+            self._pending = memoryview(data)
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        self._offset += n
+        return n
+
+    def tell(self):
+        return self._offset
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._offset
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("压缩文件不支持从末尾定位")
+        if offset < self._offset:
+            self._shutdown()
+            self._start()
+        skip = bytearray(DECOMPRESS_CHUNK_SIZE)
+        while self._offset < offset:
+            view = memoryview(skip)[:min(len(skip), offset - self._offset)]
+            if not self.readinto(view):
+                break
+        return self._offset
+
+    def close(self):
+        if not self.closed:
+            self._shutdown()
+        super().close()
@@ -1,32 +1,51 @@
 import os
 import configparser
 import platform
+import threading
+from contextlib import contextmanager
+
+SAVE_DELAY = 1.0  # 修改设置后延迟写盘的秒数，期间的多次修改合并为一次写入
+
+def get_config_path():
+    """获取配置文件路径"""
+    system = platform.system()
+    
+    if system == "Windows":
+        # Windows: 用户AppData目录
+        appdata = os.getenv('APPDATA')
+        if appdata:
+            return os.path.join(appdata, "FileSplitter", "settings.ini")
+        return "settings.ini"
+    elif system == "Darwin":
+        # macOS: 用户Library/Preferences目录
+        home = os.path.expanduser("~")
+        return os.path.join(home, "Library", "Preferences", "FileSplitter", "settings.ini")
+    else:
+        # Linux/Unix: 用户.config目录
+        home = os.path.expanduser("~")
+        return os.path.join(home, ".config", "FileSplitter", "settings.ini")
 
 class ConfigManager:
-    def __init__(self):
+    """
+    配置管理器：set_setting() 只修改内存中的配置并标记为已修改，
+    SAVE_DELAY 秒内没有新的修改时由后台定时器写盘；batch() 中的修改在退出时统一安排写盘；
+    程序退出前调用 flush() 立即写入。写盘先写临时文件再替换，中途崩溃不会留下损坏的配置文件
+    """
+
+    def __init__(self, save_delay=SAVE_DELAY):
         self.config = configparser.ConfigParser()
         self.config_file = self._get_config_path()
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer = None
         self._ensure_config_file()
         self.load_config()
 
     def _get_config_path(self):
         """获取配置文件路径"""
-        system = platform.system()
-        
-        if system == "Windows":
-            # Windows: 用户AppData目录
-            appdata = os.getenv('APPDATA')
-            if appdata:
-                return os.path.join(appdata, "FileSplitter", "settings.ini")
-            return "settings.ini"
-        elif system == "Darwin":
-            # macOS: 用户Library/Preferences目录
-            home = os.path.expanduser("~")
-            return os.path.join(home, "Library", "Preferences", "FileSplitter", "settings.ini")
-        else:
-            # Linux/Unix: 用户.config目录
-            home = os.path.expanduser("~")
-            return os.path.join(home, ".config", "FileSplitter", "settings.ini")
+        return get_config_path()
 
     def _ensure_config_file(self):
         """确保配置文件和目录存在"""
@@ -46,7 +65,17 @@ class ConfigManager:
                 'split_mode': '按字符分割',
                 'arts_per_file': '4',
                 'regex_pattern': '',  # 新增正则表达式模式
-                'include_delimiter': 'False'  # 是否包含分隔符
+                'include_delimiter': 'False',  # 是否包含分隔符
+                'regex_multiline': 'True',  # ^/$ 匹配每行行首行尾
+                'regex_dotall': 'False',  # . 匹配换行
+                'keep_partial': 'False',  # 取消时保留已完成的分割文件
+                'resumable': 'False',  # 写入检查点，可从中断处继续分割
+                'batch_concurrency': '2',  # 批量分割时同时处理的文件数
+                'batch_max_rate': '0',  # 批量分割的整体读取速度上限（MB/s），0 表示不限
+                'output_compression': '不压缩',  # 分割文件的压缩格式
+                'compression_level': '',  # 压缩级别，留空使用默认级别
+                'log_file': '',  # 完整日志保存路径，留空则不保存
+                'profile': 'False'  # 用 cProfile 剖析分割，热点函数写入日志
             }
             self.save_config()
 
@@ -55,9 +84,53 @@ class ConfigManager:
         self.config.read(self.config_file, encoding='utf-8')
 
     def save_config(self):
-        """保存配置文件"""
-        with open(self.config_file, 'w', encoding='utf-8') as configfile:
-            self.config.write(configfile)
+        """立即保存配置文件：先写临时文件，再原子地替换原文件"""
+        with self._lock:
+            tmp_path = self.config_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as configfile:
+                self.config.write(configfile)
+            os.replace(tmp_path, self.config_file)
+            self._dirty = False
+
+    def flush(self):
+        """取消等待中的延迟写盘，有未保存的修改时立即写入（程序退出前调用）"""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self.save_config()
+
+    @contextmanager
+    def batch(self):
+        """批量修改：其中的多次 set_setting() 在退出时合并为一次延迟写盘"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                self._schedule_save()
+
+    def _schedule_save(self):
+        """有未保存的修改时重新开始计时，SAVE_DELAY 秒后在后台线程中写盘"""
+        if not self._dirty or self._batch_depth:
+            return
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.save_delay, self._save_later)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _save_later(self):
+        with self._lock:
+            self._timer = None
+            if self._dirty:
+                try:
+                    self.save_config()
+                except OSError:
+                    pass  # 写盘失败时保留修改标记，退出时 flush() 再试一次
 
     def get_setting(self, section, key, default=None):
         """获取配置值"""
@@ -67,8 +140,12 @@ class ConfigManager:
             return default
 
     def set_setting(self, section, key, value):
-        """设置配置值"""
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, key, str(value))
-        self.save_config()
\ No newline at end of file
+        """设置配置值，值有变化时安排延迟写盘"""
+        with self._lock:
+            if self.get_setting(section, key) == str(value):
+                return
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            self.config.set(section, key, str(value))
+            self._dirty = True
+            self._schedule_save()
\ No newline at end of file
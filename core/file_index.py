@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+from .config_manager import get_config_path
+
+CACHE_DIR_NAME = "index_cache"        # 位于配置文件所在目录
+CACHE_MAX_BYTES = 64 * 1024 * 1024    # 缓存目录的总大小上限，超出时淘汰最久未使用的条目
+LINE_INDEX_STRIDE = 4096              # 稀疏行索引每隔这么多行记录一个行首偏移
+
+
+def default_cache_dir():
+    return os.path.join(os.path.dirname(get_config_path()), CACHE_DIR_NAME)
+
+
+class FileIndex:
+    """
+    输入文件的持久索引：自动检测到的编码、字符数、行数以及稀疏行索引
+    以 (绝对路径, 大小, 修改时间) 标识文件，文件变化后旧条目自动作废；
+    每个文件一个 JSON 文件，缓存目录按总大小做 LRU 淘汰。缓存只用于加速，读写失败时静默忽略
+    """
+
+    def __init__(self, input_path, cache_dir=None):
+        self.input_path = os.path.abspath(input_path)
+        self.cache_dir = cache_dir or default_cache_dir()
+        stat = os.stat(input_path)
+        self.identity = {"path": self.input_path, "size": stat.st_size,
+                         "mtime_ns": stat.st_mtime_ns}
+        digest = hashlib.sha1(self.input_path.encode("utf-8", "surrogatepass")).hexdigest()
+        self.path = os.path.join(self.cache_dir, digest + ".json")
+        self.entries = self._load()
+
+    @classmethod
+    def open(cls, input_path, enabled=True, cache_dir=None):
+        """启用缓存且输入文件存在时返回 FileIndex，否则返回 None"""
+        if not enabled:
+            return None
+        try:
+            return cls(input_path, cache_dir)
+        except OSError:
+            return None
+
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+
+    def put(self, key, value):
+        """记录一项并立即写入磁盘"""
+        self.entries[key] = value
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"identity": self.identity, "entries": self.entries}, f)
+            os.replace(tmp_path, self.path)
+            _evict(self.cache_dir, CACHE_MAX_BYTES, keep=self.path)
+        except OSError:
+            pass
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("identity") != self.identity:
+            return {}
+        try:
+            os.utime(self.path)  # 以修改时间作为最近使用时间
+        except OSError:
+            pass
+        return data.get("entries", {})
+
+
+def _evict(cache_dir, max_bytes, keep=None):
+    """缓存目录超过 max_bytes 时按最近使用时间从旧到新删除条目"""
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if not name.endswith(".json") or path == keep:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+    if keep and os.path.exists(keep):
+        total += os.path.getsize(keep)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
@@ -1,22 +1,138 @@
-import chardet
+import codecs
+import io
 import locale
+import mmap
 import os
+import re
+from .compression import detect_compression, open_input
 
-def determine_encodings(input_path, input_encoding, output_encoding, log_callback=None):
+DETECT_SAMPLE_SIZE = 64 * 1024     # 编码检测每个样本块的字节数
+DETECT_SAMPLES = 8                 # 均匀分布在整个文件中的样本块数
+DETECT_LIBRARY_BYTES = 64 * 1024   # 交给检测库的字节数上限（优先含非 ASCII 字节的样本）
+
+# 先匹配 UTF-32，它的 BOM 以 UTF-16 LE 的 BOM 开头
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# 检测库给出的编码换成兼容的超集：纯 ASCII 按 UTF-8 读，GB2312 按 GBK 读
+ENCODING_SUPERSETS = {"ascii": "utf-8", "gb2312": "gbk"}
+NON_ASCII_BYTE = re.compile(rb"[\x80-\xff]")
+
+
+def _read_samples(input_path, sample_size, samples):
+    """
+    读取均匀分布在整个文件中的样本块，第一块从文件开头开始
+    :return: [(样本块, 是否读到文件末尾)]；压缩文件无法定位，只读取开头
+    """
+    if detect_compression(input_path):
+        with open_input(input_path) as f:
+            data = f.read(sample_size * samples)
+        return [(data, len(data) < sample_size * samples)]
+    size = os.path.getsize(input_path)
+    with open(input_path, "rb") as f:
+        if samples <= 1 or size <= sample_size * samples:
+            data = f.read(sample_size * max(1, samples))
+            return [(data, f.tell() >= size)]
+        step = (size - sample_size) // (samples - 1)
+        blocks = []
+        for i in range(samples):
+            # step 向下取整，最后一块直接从 size - sample_size 开始，保证读到文件末尾
+            f.seek(size - sample_size if i == samples - 1 else i * step)
+            blocks.append((f.read(sample_size), f.tell() >= size))
+        return blocks
+
+
+def _is_utf8(block, at_start, at_end):
+    """样本块是否是合法的 UTF-8；从文件中间截取的块忽略两端被截断的字符"""
+    if not at_start:
+        skip = 0
+        while skip < min(3, len(block)) and 0x80 <= block[skip] < 0xC0:
+            skip += 1
+        block = block[skip:]
+    if not at_end:
+        tail = keep_utf8_tail(block)
+        if tail:
+            block = block[:-tail]
+    try:
+        block.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _detect_with_library(data):
+    """
+    依次尝试 charset_normalizer、cchardet（已安装时）和 chardet
+    检测库导入较慢（chardet 约 0.07 秒），只在需要检测时才导入，指定了编码时不会导入
+    """
+    try:
+        import charset_normalizer
+    except ImportError:
+        pass
+    else:
+        best = charset_normalizer.from_bytes(data).best()
+        return best.encoding if best else None
+    try:
+        import cchardet
+    except ImportError:
+        import chardet
+        return chardet.detect(data)["encoding"]
+    return cchardet.detect(data)["encoding"]
+
+
+def detect_encoding(input_path, sample_size=DETECT_SAMPLE_SIZE, samples=DETECT_SAMPLES):
+    """
+    检测输入文件编码：先看 BOM；再把分布在整个文件中的样本块按 UTF-8 严格校验，
+    开头全是 ASCII、后面才出现中文的文件也能正确判断；都不是 UTF-8 时才交给检测库
+    :param sample_size: 每个样本块的字节数
+    :param samples: 样本块数，越多越不容易漏掉只出现在文件中间的非 ASCII 内容
+    """
+    blocks = _read_samples(input_path, sample_size, samples)
+    head = blocks[0][0]
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    # 含 NUL 的通常是没有 BOM 的 UTF-16/32，NUL 本身却是合法的 UTF-8
+    wide = any(b"\x00" in block for block, _ in blocks)
+    if not wide and all(
+            _is_utf8(block, i == 0, at_end) for i, (block, at_end) in enumerate(blocks)):
+        return "utf-8"
+    data = b"".join(sorted((block for block, _ in blocks), key=bytes.isascii))
+    # 从第一个非 ASCII 字节所在行开始截取，开头大段 ASCII 不占用检测库的字节数；
+    # UTF-16/32 按字节截取会错位，保留开头
+    first = None if wide else NON_ASCII_BYTE.search(data)
+    start = data.rfind(b"\n", 0, first.start()) + 1 if first else 0
+    encoding = _detect_with_library(data[start:start + DETECT_LIBRARY_BYTES])
+    try:
+        encoding = codecs.lookup(encoding or "utf-8").name
+    except LookupError:
+        return "utf-8"  # 检测库给出了 Python 不支持的编码名
+    return ENCODING_SUPERSETS.get(encoding, encoding)
+
+def determine_encodings(input_path, input_encoding, output_encoding, log_callback=None,
+                        index=None):
     """
     判断并返回最终的输入编码和输出编码
     :param input_path: 输入文件路径
     :param input_encoding: 输入文件编码（可为'auto'）
     :param output_encoding: 输出文件编码（可为'同输入编码'或'ansi'）
     :param log_callback: 日志回调函数
+    :param index: FileIndex，缓存自动检测的结果
     :return: (input_encoding, output_encoding)
     """
     # 输入编码判断
-    if input_encoding == "auto":
-        with open(input_path, "rb") as f:
-            raw_data = f.read(4096)
-            result = chardet.detect(raw_data)
-            input_encoding = result['encoding'] or 'utf-8'
+    if input_encoding == "auto" and index and index.get("encoding"):
+        input_encoding = index.get("encoding")
+        if log_callback:
+            log_callback(f"使用缓存的编码检测结果: {input_encoding}")
+    elif input_encoding == "auto":
+        input_encoding = detect_encoding(input_path)
+        if index:
+            index.put("encoding", input_encoding)
         if log_callback:
             log_callback(f"自动检测到输入编码: {input_encoding}")
 
@@ -31,12 +147,316 @@ def determine_encodings(input_path, input_encoding, output_encoding, log_callbac
             log_callback(f"系统ANSI编码: {output_encoding}")
     return input_encoding, output_encoding
 
+READ_BLOCK_SIZE = 1024 * 1024  # 1MB读取块
+SCAN_BLOCK_SIZE = 4 * 1024 * 1024  # 按字节扫描时每次读取 4MB
+COPY_STEP_SIZE = 64 * 1024 * 1024  # 零拷贝每次最多复制 64MB，之间可响应取消
+MAP_SLICE_SIZE = 64 * 1024  # 内存映射读取时每次解码的字节数（小段解码时数据留在 CPU 缓存中）
+# tell() 返回值与文本模式一致：低 64 位为字节偏移，第 256 位以上为之后需要跳过的字符数
+COOKIE_OFFSET_MASK = (1 << 64) - 1
+COOKIE_CHARS_SHIFT = 256
+
+# 多字节字符的后续字节不可能是 0x0A/0x0D 的编码，可以直接在字节中定位换行
+MULTIBYTE_LINE_SAFE_ENCODINGS = {
+    "utf-8", "utf-8-sig", "gbk", "gb2312", "gb18030", "big5", "big5hkscs",
+    "cp950", "shift_jis", "cp932", "euc_jp", "euc_kr", "cp949",
+}
+NEWLINE_BYTES = re.compile(rb"\r\n?|\n")
+
 def calculate_total_chars(file_path, encoding):
     total_chars = 0
-    with open(file_path, "r", encoding=encoding, errors="replace") as f:
+    with open_input(file_path, encoding) as f:
         while True:
-            chunk = f.read(4096)  # 4KB块
+            chunk = f.read(READ_BLOCK_SIZE)
             if not chunk:
                 break
             total_chars += len(chunk)
-    return total_chars
\ No newline at end of file
+    return total_chars
+
+def count_lines(file_path, encoding):
+    """统计文本行数（通用换行），末尾没有换行符的最后一行也计入"""
+    total_lines = 0
+    last = ""
+    with open_input(file_path, encoding) as f:
+        while True:
+            chunk = f.read(READ_BLOCK_SIZE)
+            if not chunk:
+                break
+            total_lines += chunk.count("\n")
+            last = chunk[-1]
+    if last and last != "\n":
+        total_lines += 1
+    return total_lines
+
+_zero_copy_supported = True
+
+def copy_byte_range(src_f, dst_f, offset, count, check=None):
+    """
+    把 src_f 中 [offset, offset + count) 的字节追加写入 dst_f（均为二进制文件对象）
+    优先使用 copy_file_range / sendfile 在内核中直接复制，不支持时回退到普通读写
+    :param check: 每复制一段后调用一次（用于响应取消/暂停）
+    """
+    global _zero_copy_supported
+    dst_f.flush()
+    src_fd, dst_fd = src_f.fileno(), dst_f.fileno()
+    if _zero_copy_supported:
+        try:
+            while count > 0:
+                if check:
+                    check()
+                step = min(count, COPY_STEP_SIZE)
+                if hasattr(os, "copy_file_range"):
+                    copied = os.copy_file_range(src_fd, dst_fd, step, offset_src=offset)
+                else:
+                    copied = os.sendfile(dst_fd, src_fd, offset, step)
+                if copied == 0:
+                    return
+                offset += copied
+                count -= copied
+            return
+        except (AttributeError, OSError):
+            # Windows 没有这两个调用；跨文件系统或旧内核会报错，之后一律走普通读写
+            _zero_copy_supported = False
+    src_f.seek(offset)
+    while count > 0:
+        if check:
+            check()
+        block = src_f.read(min(READ_BLOCK_SIZE, count))
+        if not block:
+            return
+        dst_f.write(block)
+        count -= len(block)
+
+
+def codec_name(encoding):
+    return codecs.lookup(encoding).name
+
+
+def is_single_byte(codec):
+    """每个字节恰好解码为一个字符的编码"""
+    return (codec in ("ascii", "tis-620", "cp437", "cp850", "cp866")
+            or codec.startswith(("iso8859-", "cp125", "koi8-", "mac-")))
+
+
+def is_line_safe(encoding):
+    codec = codec_name(encoding)
+    return codec in MULTIBYTE_LINE_SAFE_ENCODINGS or is_single_byte(codec)
+
+
+def read_safe_blocks(f, keep_tail):
+    """
+    逐块读取原始字节，keep_tail(block) 返回块末尾需要留到下一块的字节数，
+    保证每块都在安全位置结束。生成 (块起始偏移, 块内容, 是否最后一块)
+    """
+    pos = f.tell()
+    carry = b""
+    while True:
+        data = f.read(SCAN_BLOCK_SIZE)
+        block = carry + data
+        if not data:
+            if block:
+                yield pos, block, True
+            return
+        tail = keep_tail(block)
+        if tail:
+            carry = block[-tail:]
+            block = block[:-tail]
+        else:
+            carry = b""
+        if block:
+            yield pos, block, False
+            pos += len(block)
+
+
+def keep_cr_tail(block):
+    """块以 \\r 结尾时留到下一块，避免把 \\r\\n 拆到两个块中"""
+    return 1 if block.endswith(b"\r") else 0
+
+
+def keep_utf8_tail(block):
+    """保留块末尾不完整的 UTF-8 多字节序列以及结尾的 \\r"""
+    for back in range(1, min(4, len(block)) + 1):
+        byte = block[-back]
+        if byte < 0x80:
+            break
+        if byte >= 0xC0:
+            length = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            if length > back:
+                return back
+            break
+    return keep_cr_tail(block)
+
+
+def open_text_input(path, encoding):
+    """
+    以文本方式打开输入文件：未压缩、非空且能在字节中定位换行的文件使用内存映射读取器，
+    其他情况（压缩文件、UTF-16/32、无法映射的文件）使用 open_input
+    """
+    if (detect_compression(path) is None and is_line_safe(encoding)
+            and os.path.getsize(path) > 0):
+        try:
+            return MappedTextReader(path, encoding)
+        except (OSError, ValueError, OverflowError):
+            pass  # 网络文件系统、32 位进程中的超大文件等无法映射
+    return open_input(path, encoding)
+
+
+class MappedTextReader:
+    """
+    基于内存映射的只读文本流，接口与文本模式的文件对象相同（read/readline/逐行迭代/tell/seek）
+    按段增量解码映射区域（通用换行），没有逐块 read() 的系统调用和缓冲区复制；
+    分段尽量切在换行符之后，这里解码器没有未决状态：tell() 在行尾返回精确的字节偏移，
+    其他位置返回“最近的干净位置 + 之后的字符数”组合值，同样可以交给 seek()
+    """
+
+    def __init__(self, path, encoding):
+        self.name = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+        self._size = len(self._map)
+        self._start_at(0)
+
+    def _start_at(self, offset):
+        """从干净位置 offset 开始重新解码"""
+        codec = codec_name(self.encoding)
+        if offset and codec == "utf-8-sig":
+            codec = "utf-8"  # 与文本模式一致，只去掉文件开头的 BOM
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(codec)(errors="replace"), translate=True)
+        self._anchor = offset         # 最近的干净位置
+        self._anchor_chars = 0        # 从 _anchor 到当前段开头的字符数
+        self._slice_start = self._slice_end = offset
+        self._slice_clean = True      # 当前段是否结束在干净位置
+        self._eof = False
+        self._text = ""               # 当前段解码后的文本
+        self._i = 0                   # 当前段中下一个要读出的字符下标
+        self._line_mark = (0, offset)  # tell() 缓存：(行尾下标, 对应的字节偏移)
+
+    def _next_slice(self):
+        """解码下一段，已到文件末尾时返回 False"""
+        while not self._eof:
+            start = self._slice_end
+            end = min(start + MAP_SLICE_SIZE, self._size)
+            final = end == self._size
+            clean = True
+            if not final:
+                cut = self._map.rfind(b"\n", start, end)
+                if cut >= 0:
+                    end = cut + 1
+                else:
+                    # 超长的行只能在行中切开，解码器会保留未完成的多字节字符
+                    clean = False
+                    if self._map[end - 1] == 0x0D:
+                        end -= 1  # 不把 \r\n 拆到两段
+            text = self._decoder.decode(self._map[start:end], final)
+            if self._slice_clean:
+                self._anchor, self._anchor_chars = start, 0
+            else:
+                self._anchor_chars += len(self._text)
+            self._text, self._i = text, 0
+            self._slice_start, self._slice_end = start, end
+            self._slice_clean = clean
+            self._eof = final
+            self._line_mark = (0, start)
+            if text:
+                return True
+        return False
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+        pieces = []
+        while size != 0:
+            if self._i >= len(self._text) and not self._next_slice():
+                break
+            i = self._i
+            end = len(self._text) if size < 0 else min(len(self._text), i + size)
+            pieces.append(self._text[i:end])
+            if size > 0:
+                size -= end - i
+            self._i = end
+        return "".join(pieces)
+
+    def readline(self, size=-1):
+        if size is None:
+            size = -1
+        pieces = []
+        while size != 0:
+            if self._i >= len(self._text) and not self._next_slice():
+                break
+            text, i = self._text, self._i
+            end = len(text) if size < 0 else min(len(text), i + size)
+            newline = text.find("\n", i, end)
+            if newline >= 0:
+                end = newline + 1
+            self._i = end
+            pieces.append(text[i:end])
+            if newline >= 0:
+                break
+            if size > 0:
+                size -= end - i
+        return "".join(pieces)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def tell(self):
+        i = self._i
+        if i and self._text[i - 1] == "\n":
+            return self._line_offset(i)
+        chars = self._anchor_chars + i
+        return self._anchor | (chars << COOKIE_CHARS_SHIFT) if chars else self._anchor
+
+    def _line_offset(self, i):
+        """当前段中下标 i（刚好在换行之后）对应的字节偏移：数出之前的换行符序列"""
+        index, offset = self._line_mark
+        if index > i:
+            index, offset = 0, self._slice_start
+        for _ in range(self._text.count("\n", index, i)):
+            offset = NEWLINE_BYTES.search(self._map, offset, self._slice_end).end()
+        self._line_mark = (i, offset)
+        return offset
+
+    def seek(self, cookie, whence=io.SEEK_SET):
+        if whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("只支持定位到 tell() 返回的位置")
+        self._start_at(cookie & COOKIE_OFFSET_MASK)
+        chars = cookie >> COOKIE_CHARS_SHIFT
+        while chars > 0:
+            skipped = len(self.read(min(chars, READ_BLOCK_SIZE)))
+            if not skipped:
+                break
+            chars -= skipped
+        return cookie
+
+    def position(self):
+        """已解码的字节数，用于进度显示"""
+        return self._slice_end
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def close(self):
+        if not self._file.closed:
+            self._map.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,154 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# 各阶段的显示名称，按日志中的输出顺序排列
+PHASE_NAMES = {
+    "detect": "检测编码",
+    "count": "统计",
+    "copy": "字节复制",
+    "parallel": "并行分割",
+    "decode": "读取解码",
+    "encode": "编码",
+    "wait": "等待写出",
+    "write": "后台写出",
+}
+
+# 分割引擎的显示名称
+ENGINE_NAMES = {"text": "单进程", "copy": "字节复制", "parallel": "多进程并行"}
+
+
+class RunMetrics:
+    """
+    一次分割运行的性能指标：读取字节数、解码字符数、分割文件数、各阶段耗时、内存峰值和吞吐量
+    主线程中的阶段用 phase() 计时，嵌套在其中的阶段不重复计入外层；
+    后台线程（PartWriter 写出、压缩）的耗时用 add() 累加，与主线程的阶段同时进行，
+    文本输出时编码在后台写出中完成，计入 write
+    """
+
+    def __init__(self, mode, input_path):
+        self.mode = mode
+        self.input_path = input_path
+        self.engine = "text"
+        self.bytes_read = 0
+        self.chars = 0          # 解码的字符数，直接复制字节时为 0
+        self.parts = 0          # 本次运行写出的分割文件数（续分前已完成的不计）
+        self.phases = {}
+        self.elapsed = None
+        self.peak_memory = None
+        self._started = time.perf_counter()
+        self._nested = 0.0      # 当前阶段中嵌套阶段的累计耗时
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        """累加一个阶段的耗时（可在后台线程中调用）"""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        """在主线程中为一个阶段计时"""
+        began = time.perf_counter()
+        outer, self._nested = self._nested, 0.0
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - began
+            self.add(name, elapsed - self._nested)
+            self._nested = outer + elapsed
+
+    def finish(self, parts, bytes_read):
+        """运行结束：记录分割文件数、读取字节数、总耗时和内存峰值"""
+        self.parts = parts
+        self.bytes_read = bytes_read
+        self.elapsed = time.perf_counter() - self._started
+        self.peak_memory = peak_memory()
+        return self
+
+    @property
+    def rate(self):
+        """平均吞吐量（MB/s）"""
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_read / self.elapsed / (1024 * 1024)
+
+    def as_dict(self):
+        """可序列化为 JSON 的字典，时间单位为秒"""
+        return {
+            "mode": self.mode,
+            "input": self.input_path,
+            "engine": self.engine,
+            "parts": self.parts,
+            "bytes_read": self.bytes_read,
+            "chars": self.chars,
+            "elapsed": round(self.elapsed or 0.0, 4),
+            "mb_per_s": round(self.rate, 2),
+            "peak_memory": self.peak_memory,
+            "phases": {name: round(self.phases[name], 4)
+                       for name in sorted(self.phases, key=_phase_order)},
+        }
+
+
+def _phase_order(name):
+    return list(PHASE_NAMES).index(name) if name in PHASE_NAMES else len(PHASE_NAMES)
+
+
+def phase(metrics, name):
+    """metrics 为 None 时不计时的 metrics.phase(name)"""
+    return metrics.phase(name) if metrics else nullcontext()
+
+
+def format_metrics(metrics):
+    """把 RunMetrics 格式化为一行日志摘要"""
+    text = (f"运行指标: {ENGINE_NAMES.get(metrics.engine, metrics.engine)}，"
+            f"写出 {metrics.parts} 个文件，读取 {metrics.bytes_read / (1024 * 1024):.1f} MB，"
+            f"解码 {metrics.chars} 字符，用时 {metrics.elapsed:.2f} 秒，{metrics.rate:.1f} MB/s")
+    if metrics.peak_memory:
+        text += f"，内存峰值 {metrics.peak_memory / (1024 * 1024):.0f} MB"
+    phases = "，".join(f"{PHASE_NAMES.get(name, name)} {seconds:.2f}"
+                      for name, seconds in sorted(metrics.phases.items(),
+                                                  key=lambda item: _phase_order(item[0])))
+    if phases:
+        text += f"（各阶段秒数: {phases}）"
+    return text
+
+
+def peak_memory():
+    """本进程自启动以来的物理内存峰值（字节），无法获取时返回 None"""
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_memory()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux 单位为 KB，macOS 为字节
+
+
+def _windows_peak_memory():
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                "PagefileUsage", "PeakPagefileUsage")]
+
+    try:
+        kernel32 = ctypes.WinDLL("kernel32")
+        psapi = ctypes.WinDLL("psapi")
+    except (AttributeError, OSError):
+        return None
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    psapi.GetProcessMemoryInfo.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters),
+                                      counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
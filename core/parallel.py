@@ -0,0 +1,432 @@
+import codecs
+import io
+import os
+from bisect import bisect_right
+from concurrent.futures import wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import accumulate
+from .file_utils import (NEWLINE_BYTES, codec_name, is_line_safe, is_single_byte,
+                         read_safe_blocks, keep_cr_tail, keep_utf8_tail)
+from .cancel import CancelToken, PartTracker, SplitCancelled, check_process_events
+from .checkpoint import ResumePoint, file_checksum
+from .compression import open_output, output_suffix
+from .file_index import LINE_INDEX_STRIDE
+
+SCAN_WINDOW_SIZE = 64 * 1024         # 定位第 N 个换行符时的计数窗口
+WRITE_BLOCK_SIZE = 1024 * 1024       # 工作进程解码/写出的块大小
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024 # 小于该大小的文件不值得启动进程池
+
+UTF8_ENCODINGS = {"utf-8", "utf-8-sig"}
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """第一次定位行尾时才导入 NumPy（导入需要约 0.1 秒，拖慢程序启动），未安装时返回 None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class UnsupportedInput(Exception):
+    """输入不适合按字节定位边界（编码不支持、存在单独的 \\r 换行等），需要回退到单进程引擎"""
+
+
+def is_char_countable(encoding):
+    codec = codec_name(encoding)
+    return codec in UTF8_ENCODINGS or is_single_byte(codec)
+
+
+def resolve_workers(workers=None):
+    """解析并行进程数，None 表示使用全部 CPU"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def should_use_parallel(input_path, workers=None):
+    """文件足够大且可用进程数大于 1 时才使用并行引擎"""
+    return (resolve_workers(workers) > 1
+            and os.path.getsize(input_path) >= PARALLEL_MIN_SIZE)
+
+
+def _check_line_endings(block, is_last):
+    """单独的 \\r 在文本模式下也是换行符，字节计数无法与之保持一致"""
+    if is_last and block.endswith(b"\r"):
+        block = block[:-1]
+    if block.count(b"\r") != block.count(b"\r\n"):
+        raise UnsupportedInput("文件包含单独的 \\r 换行符")
+
+
+def _line_ends(block, need, lines_per_part):
+    """
+    block 中第 need 个换行符之后、以及此后每 lines_per_part 个换行符之后的下标
+    安装了 NumPy 时一次求出块内全部换行符的位置；否则逐个窗口计数，
+    窗口内有分割点时用 split + accumulate 求出各行行尾，都不需要逐行执行 Python 代码
+    :return: (下标列表, 到下一个分割点还差的行数)
+    """
+    numpy = _numpy()
+    if numpy is not None:
+        count = block.count(b"\n")
+        if count < need:
+            return [], need - count
+        newlines = numpy.flatnonzero(numpy.frombuffer(block, numpy.uint8) == 0x0A)
+        ends = (newlines[need - 1::lines_per_part] + 1).tolist()
+        return ends, lines_per_part - (count - need) % lines_per_part
+
+    ends = []
+    for base in range(0, len(block), SCAN_WINDOW_SIZE):
+        window = block[base:base + SCAN_WINDOW_SIZE]
+        count = window.count(b"\n")
+        if count < need:
+            need -= count
+            continue
+        line_ends = list(accumulate(map((1).__add__, map(len, window.split(b"\n")))))
+        ends.extend(base + end for end in line_ends[need - 1:count:lines_per_part])
+        need = lines_per_part - (count - need) % lines_per_part
+    return ends, need
+
+
+def iter_line_ranges(input_path, lines_per_part, encoding, start=0, index=None):
+    """
+    扫描原始字节，生成每 lines_per_part 行一份的字节范围 (start, end)
+    :param input_path: 输入文件路径
+    :param lines_per_part: 每份行数
+    :param encoding: 输入编码（必须能在字节中直接定位换行符）
+    :param start: 开始扫描的字节偏移（必须位于行首）
+    :param index: FileIndex；已有稀疏行索引且每份不少于索引间隔行数时只扫描每个分割点前的一小段，
+                  没有索引时从头完整扫描一遍并顺便建立索引
+    """
+    if not is_line_safe(encoding):
+        raise UnsupportedInput(f"编码不支持按字节定位换行: {encoding}")
+
+    file_size = os.path.getsize(input_path)
+    line_index = index.get("line_index") if index else None
+    if line_index and lines_per_part >= line_index["stride"]:
+        yield from _iter_indexed_line_ranges(input_path, lines_per_part, line_index,
+                                             start, file_size)
+        return
+
+    record = index is not None and line_index is None and start == 0
+    offsets, index_need, newlines = [0], LINE_INDEX_STRIDE, 0
+    need = lines_per_part
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        for base, block, is_last in read_safe_blocks(f, keep_cr_tail):
+            _check_line_endings(block, is_last)
+            if record:
+                index_ends, index_need = _line_ends(block, index_need, LINE_INDEX_STRIDE)
+                offsets.extend(base + end for end in index_ends)
+                newlines += block.count(b"\n")
+            ends, need = _line_ends(block, need, lines_per_part)
+            for end in ends:
+                yield start, base + end
+                start = base + end
+    if record:
+        index.put("line_index", {"stride": LINE_INDEX_STRIDE, "offsets": offsets,
+                                 "newlines": newlines})
+    if start < file_size:
+        yield start, file_size
+
+
+def _iter_indexed_line_ranges(input_path, lines_per_part, line_index, start, file_size):
+    """
+    利用稀疏行索引生成字节范围：每个分割点从索引中最近的行首开始，最多扫描 stride 行
+    line_index["offsets"][i] 为第 i * stride 行的行首偏移，newlines 为文件中的换行符总数
+    """
+    stride, offsets = line_index["stride"], line_index["offsets"]
+    with open(input_path, "rb") as f:
+        i = bisect_right(offsets, start) - 1
+        line = i * stride + _count_newlines(f, offsets[i], start)
+        while line + lines_per_part <= line_index["newlines"]:
+            line += lines_per_part
+            i = line // stride
+            end = _skip_lines(f, offsets[i], line - i * stride)
+            yield start, end
+            start = end
+    if start < file_size:
+        yield start, file_size
+
+
+def _count_newlines(f, start, end):
+    """[start, end) 中的换行符个数"""
+    f.seek(start)
+    count = 0
+    while start < end:
+        block = f.read(min(SCAN_WINDOW_SIZE, end - start))
+        if not block:
+            break
+        count += block.count(b"\n")
+        start += len(block)
+    return count
+
+
+def _skip_lines(f, offset, lines):
+    """从行首 offset 开始跳过 lines 行，返回之后的行首偏移"""
+    if not lines:
+        return offset
+    f.seek(offset)
+    while True:
+        block = f.read(SCAN_WINDOW_SIZE)
+        if not block:
+            return offset
+        ends, lines = _line_ends(block, lines, lines)
+        if ends:
+            return offset + ends[0]
+        offset += len(block)
+
+
+def _next_line_start(f, offset, file_size):
+    """offset 处或之后的第一个行首（\n、\r\n 或单独的 \r 之后）"""
+    if offset <= 0:
+        return 0
+    # 从前一个字节开始找：前一个字节就是换行符时 offset 已经位于行首
+    pos = offset - 1
+    while True:
+        f.seek(pos)
+        window = f.read(SCAN_WINDOW_SIZE)
+        if not window:
+            return file_size
+        match = NEWLINE_BYTES.search(window)
+        if match:
+            end = pos + match.end()
+            # \r 恰好是窗口的最后一个字节时，看下一个字节是否为 \n
+            if match.group() == b"\r" and match.end() == len(window) and f.read(1) == b"\n":
+                end += 1
+            return end
+        pos += len(window)
+
+
+def iter_balanced_line_ranges(input_path, total_parts, encoding, start=0):
+    """
+    把文件按字节均分为 total_parts 份，每个分割点推到其后的第一个行首，生成各份的字节范围
+    只需 total_parts - 1 次定位，不读取整个文件；超长的行可能使实际份数少于 total_parts
+    :param input_path: 输入文件路径
+    :param total_parts: 份数
+    :param encoding: 输入编码（必须能在字节中直接定位换行符）
+    :param start: 断点续分时已完成部分的结束偏移，只生成此后的范围
+    """
+    if not is_line_safe(encoding):
+        raise UnsupportedInput(f"编码不支持按字节定位换行: {encoding}")
+
+    file_size = os.path.getsize(input_path)
+    prev = 0
+    with open(input_path, "rb") as f:
+        for i in range(1, total_parts + 1):
+            if i < total_parts:
+                boundary = _next_line_start(f, max(file_size * i // total_parts, prev), file_size)
+            else:
+                boundary = file_size
+            if boundary > prev:
+                if prev >= start:
+                    yield prev, boundary
+                prev = boundary
+
+
+def iter_decoded_range(in_f, start, end, encoding, check=None):
+    """
+    逐块解码二进制文件中 [start, end) 的字节（通用换行），生成文本块
+    :param check: 每读取一块前调用一次（用于响应取消/暂停）
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors="replace"), translate=True)
+    in_f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        if check:
+            check()
+        block = in_f.read(min(WRITE_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        remaining -= len(block)
+        yield decoder.decode(block)
+    yield decoder.decode(b"", final=True)
+
+
+def _translated_length(text, start, end):
+    """文本模式下 \\r\\n 会被转换为 \\n，按转换后的字符数计数"""
+    return end - start - text.count("\r\n", start, end)
+
+
+def _locate_char(text, start, need):
+    """在 text[start:] 中找到转换后第 need 个字符之后的原始下标"""
+    r = start + need
+    while True:
+        moved = start + need + text.count("\r\n", start, r)
+        if moved == r:
+            break
+        r = moved
+    if 0 < r < len(text) and text[r - 1] == "\r" and text[r] == "\n":
+        r += 1
+    return r
+
+
+def iter_char_ranges(input_path, chars_per_part, encoding, start=0):
+    """
+    扫描文件，生成每 chars_per_part 个字符一份的字节范围 (start, end)，
+    字符数与文本模式读取（errors="replace"、通用换行）完全一致
+    :param input_path: 输入文件路径
+    :param chars_per_part: 每份字符数
+    :param encoding: 输入编码（UTF-8 或单字节编码）
+    :param start: 开始扫描的字节偏移（必须位于字符边界）
+    """
+    if not is_char_countable(encoding):
+        raise UnsupportedInput(f"编码不支持按字节定位字符: {encoding}")
+
+    codec = codec_name(encoding)
+    single_byte = is_single_byte(codec)
+    file_size = os.path.getsize(input_path)
+    keep_tail = keep_cr_tail if single_byte else keep_utf8_tail
+    need = chars_per_part
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        for base, block, _ in read_safe_blocks(f, keep_tail):
+            # utf-8-sig 只在文件开头去掉 BOM，BOM 字节仍归入第一份
+            block_codec = codec
+            if base == 0 and codec == "utf-8-sig" and block.startswith(codecs.BOM_UTF8):
+                base, block, block_codec = 3, block[3:], "utf-8"
+            elif codec == "utf-8-sig":
+                block_codec = "utf-8"
+            text = block.decode(block_codec, errors="replace")
+            if not single_byte and "\ufffd" in text:
+                # 替换字符无法精确映射回字节偏移，只接受合法的 UTF-8
+                try:
+                    block.decode(block_codec)
+                except UnicodeDecodeError:
+                    raise UnsupportedInput("文件包含无效的 UTF-8 字节序列")
+
+            i = 0
+            byte_pos = base
+            while True:
+                available = _translated_length(text, i, len(text))
+                if available < need:
+                    need -= available
+                    break
+                r = _locate_char(text, i, need)
+                if single_byte:
+                    byte_pos += r - i
+                else:
+                    byte_pos += len(text[i:r].encode("utf-8"))
+                yield start, byte_pos
+                start = byte_pos
+                need = chars_per_part
+                i = r
+    if start < file_size:
+        yield start, file_size
+
+
+_worker_events = None
+
+
+def _init_worker(events):
+    """工作进程初始化：保存取消/继续事件"""
+    global _worker_events
+    _worker_events = events
+
+
+def write_range(input_path, start, end, input_encoding, output_encoding, out_path,
+                checksum=False, compression=None, level=None):
+    """
+    工作进程：解码 [start, end) 字节范围并以输出编码写出，压缩也在工作进程中完成
+    :param checksum: 是否同时计算输出文件的 (字节数, CRC32)，供检查点使用
+    :param compression: 输出压缩格式，None 表示不压缩
+    :param level: 压缩级别
+    :return: (写出的字符数, 校验值或 None)
+    """
+    chars = 0
+    try:
+        with open(input_path, "rb") as in_f, \
+                open_output(out_path, output_encoding, compression, level) as out_f:
+            for text in iter_decoded_range(in_f, start, end, input_encoding,
+                                           lambda: check_process_events(_worker_events)):
+                out_f.write(text)
+                chars += len(text)
+    except SplitCancelled:
+        os.remove(out_path)
+        raise
+    return chars, file_checksum(out_path) if checksum else None
+
+
+def split_ranges_parallel(input_path, output_dir, ranges, input_encoding, output_encoding,
+                          workers=None, reporter=None, log_callback=None,
+                          cancel_token=None, tracker=None, first_part=1,
+                          compression=None, level=None, metrics=None):
+    """
+    边扫描边分发：每得到一个字节范围就交给进程池写出对应的 _partN 文件
+    :param ranges: (start, end) 字节范围的迭代器，可能抛出 UnsupportedInput
+    :param reporter: ProgressReporter 进度汇报器
+    :param cancel_token: CancelToken 取消/暂停令牌，同步到各工作进程
+    :param tracker: PartTracker，登记已写完的文件
+    :param first_part: 第一个范围对应的分割文件序号（断点续分时大于 1）
+    :param compression: 输出压缩格式，None 表示不压缩
+    :param level: 压缩级别
+    :param metrics: RunMetrics，累加各工作进程解码的字符数
+    :return: 创建的文件总数（含续分前已完成的）；输入不支持并行时返回 None，由调用方回退
+    """
+    filename = os.path.basename(input_path)
+    base_name, ext = os.path.splitext(filename)
+    ext += output_suffix(compression)
+    workers = resolve_workers(workers)
+    max_pending = workers * 2
+    token = cancel_token or CancelToken()
+    tracker = tracker or PartTracker()
+
+    if log_callback:
+        log_callback(f"使用 {workers} 个进程并行分割")
+
+    part_no = first_part - 1
+    done_bytes = reporter.done if reporter else 0
+    pending = {}
+    checksum = tracker.checkpoint is not None
+
+    def collect(futures):
+        nonlocal done_bytes
+        for future in futures:
+            path, number, start, end = pending.pop(future)
+            chars, part_checksum = future.result()
+            tracker.add(path, number, ResumePoint(end, 0, ""), part_checksum)
+            done_bytes += end - start
+            if metrics:
+                metrics.chars += chars
+            if log_callback:
+                log_callback(f"已创建分割文件: {os.path.basename(path)} ({chars} 字符)")
+            if reporter:
+                reporter.update(done_bytes)
+
+    def abandon():
+        """取消尚未开始的分片，等待进行中的分片结束，登记其中已写完的文件"""
+        for future in pending:
+            future.cancel()
+        wait(pending)
+        for future, (path, *_) in pending.items():
+            if not future.cancelled() and future.exception() is None:
+                tracker.add(path)
+
+    from concurrent.futures import ProcessPoolExecutor  # 导入 multiprocessing 的进程池较慢，用到时才导入
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(token.process_events(),)) as executor:
+        try:
+            for start, end in ranges:
+                token.check()
+                part_no += 1
+                out_path = os.path.join(output_dir, f"{base_name}_part{part_no}{ext}")
+                future = executor.submit(write_range, input_path, start, end,
+                                         input_encoding, output_encoding, out_path, checksum,
+                                         compression, level)
+                pending[future] = (out_path, part_no, start, end)
+                if len(pending) >= max_pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(finished)
+            collect(wait(pending).done)
+        except UnsupportedInput as e:
+            abandon()
+            tracker.rollback()
+            if log_callback:
+                log_callback(f"无法并行分割（{e}），回退到单进程分割")
+            return None
+        except SplitCancelled:
+            abandon()
+            raise
+
+    return part_no
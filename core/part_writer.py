@@ -0,0 +1,259 @@
+import os
+import queue
+import threading
+import time
+from .checkpoint import file_checksum
+from .compression import open_output
+from .metrics import phase
+
+WRITE_BUFFER_CHARS = 1024 * 1024  # 主线程攒够这么多字符（字节）再交给后台线程
+WRITE_QUEUE_BLOCKS = 16           # 所有分割文件中等待写出的块数上限
+QUEUE_POLL_INTERVAL = 0.1         # 等待队列空位时检查后台错误的间隔（秒）
+DIRECT_WRITE_CHARS = 64 * 1024    # 压缩时不超过这么多字符（字节）的小文件由主线程直接写出
+
+_OPEN = object()   # 开始一个分割文件
+_END = object()    # 分割文件结束
+_ABORT = object()  # 放弃写出当前分割文件
+_STOP = object()   # 后台线程退出
+
+
+class PartWriter:
+    """
+    分割文件写出器：主线程不断 write() 文本，end_part() 结束当前文件，下次写入时自动开始下一个文件
+    写入的内容先在缓冲区中攒成大块，再经有界队列交给后台线程编码（压缩）并写盘，
+    读取和解码不会因磁盘写入而阻塞；队列满时 write() 等待，内存占用有上限
+    后台线程在整个运行期间常驻，每个线程一个队列：不压缩时只用一个线程按顺序写出；
+    压缩时按 CPU 核数启动多个线程，各分割文件轮流交给它们，多个文件同时压缩
+    （zlib/bz2/lzma/zstd 压缩时释放 GIL）；内容全部还在缓冲区中的小文件（压缩时不超过
+    DIRECT_WRITE_CHARS）由主线程直接写出，大量很小的分割文件不必经过队列和线程切换
+    写完的文件在后台线程中登记到 PartTracker（可能乱序完成，检查点能正确续分）；
+    作为上下文管理器使用，正常退出时等待全部文件写完；取消时已经 end_part() 的文件照常写完，
+    只删除尚未结束的当前文件；后台写出出错时删除所有未写完的文件
+    """
+
+    def __init__(self, output_dir, base_name, ext, encoding, tracker, compression=None,
+                 level=None, log_callback=None, first_part=1, metrics=None):
+        """
+        :param output_dir: 输出目录
+        :param base_name: 分割文件名前缀，文件名为 {base_name}_part{N}{ext}
+        :param ext: 扩展名（含压缩扩展名）
+        :param encoding: 输出编码，为 None 时写入的是字节
+        :param tracker: PartTracker，登记已写完的文件
+        :param compression: 压缩格式，None 表示不压缩
+        :param level: 压缩级别
+        :param log_callback: 日志回调函数
+        :param first_part: 第一个分割文件的序号（断点续分时大于 1）
+        :param metrics: RunMetrics，记录主线程等待写出（wait）和后台写出（write）的耗时
+        """
+        self.output_dir = output_dir
+        self.base_name = base_name
+        self.ext = ext
+        self.encoding = encoding
+        self.tracker = tracker
+        self.compression = compression
+        self.level = level
+        self.log_callback = log_callback
+        self.last_part = first_part - 1   # 已结束的最后一个分割文件序号
+        self.part_chars = 0               # 当前分割文件已写入的字符（字节）数
+        self.total_chars = 0              # 本次共写入的字符（字节）数
+        self.metrics = metrics
+        self._max_threads = (os.cpu_count() or 1) if compression else 1
+        self._queues = []     # 各后台线程的块队列，用到时才启动线程
+        self._threads = []
+        self._next_queue = 0
+        self._slots = threading.Semaphore(WRITE_QUEUE_BLOCKS)
+        self._lock = threading.Lock()
+        self._blocks = None   # 当前分割文件所在的块队列
+        self._buffer = []
+        self._buffered = 0
+        self._aborted = False  # 后台写出出错，放弃所有未写完的文件
+        self._error = None
+
+    @property
+    def in_part(self):
+        """当前分割文件是否已写入内容"""
+        return self.part_chars > 0
+
+    @property
+    def current_path(self):
+        """当前（或下一个）分割文件的路径"""
+        return self.path(self.last_part + 1)
+
+    def path(self, part_no):
+        return os.path.join(self.output_dir, f"{self.base_name}_part{part_no}{self.ext}")
+
+    def write(self, data):
+        """向当前分割文件写入内容，空内容不会开始新文件"""
+        if not data:
+            return
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self.part_chars += len(data)
+        self.total_chars += len(data)
+        if self._buffered >= WRITE_BUFFER_CHARS:
+            self._flush()
+
+    def end_part(self, resume=None):
+        """
+        结束当前分割文件，之后的写入进入下一个文件
+        :param resume: 该文件之后的续分位置 ResumePoint，写完后随文件一起登记到检查点
+        :return: 结束的文件序号；当前文件没有内容时不创建文件，返回 None
+        """
+        if not self.in_part:
+            return None
+        if self._blocks is None and (not self.compression
+                                     or self.part_chars <= DIRECT_WRITE_CHARS):
+            self.last_part += 1
+            self._write_small(self.last_part, resume)
+        else:
+            # 先写出缓冲区：第一块交给后台线程时按 current_path 打开文件，此时序号尚未增加
+            self._flush()
+            self.last_part += 1
+            self._blocks.put((_END, self.last_part, resume, self.part_chars))
+            self._blocks = None
+        self.part_chars = 0
+        return self.last_part
+
+    def close(self):
+        """等待全部分割文件写完，后台写出出错时抛出该异常"""
+        with phase(self.metrics, "wait"):
+            self._stop()
+        self._raise_error()
+
+    def abort(self):
+        """取消写出：已经结束的文件照常写完并登记，删除尚未结束的当前文件"""
+        if self._blocks is not None:
+            self._blocks.put((_ABORT,))
+            self._blocks = None
+        self._buffer = []
+        self._buffered = 0
+        self._stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _assign_queue(self):
+        """轮流选择一个后台线程写下一个文件，线程在第一次用到时启动"""
+        index = self._next_queue
+        self._next_queue = (index + 1) % self._max_threads
+        if index == len(self._queues):
+            blocks = queue.Queue()
+            thread = threading.Thread(target=self._run_worker, args=(blocks,), daemon=True)
+            thread.start()
+            self._queues.append(blocks)
+            self._threads.append(thread)
+        return self._queues[index]
+
+    def _stop(self):
+        """通知后台线程处理完队列中的内容后退出，并等待它们结束"""
+        for blocks in self._queues:
+            blocks.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._queues, self._threads = [], []
+
+    def _flush(self):
+        """把缓冲区作为一块放入队列，队列已满时等待后台线程写出"""
+        self._raise_error()
+        if not self._buffer:
+            return
+        block = ("" if self.encoding else b"").join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        if not self._slots.acquire(blocking=False):
+            with phase(self.metrics, "wait"):
+                while not self._slots.acquire(timeout=QUEUE_POLL_INTERVAL):
+                    self._raise_error()
+        if self._blocks is None:
+            self._blocks = self._assign_queue()
+            self._blocks.put((_OPEN, self.current_path))
+        self._blocks.put(block)
+
+    def _write_small(self, part_no, resume):
+        """文件内容全部还在缓冲区中时，由主线程直接写出并登记"""
+        self._raise_error()
+        path = self.path(part_no)
+        block = ("" if self.encoding else b"").join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        began = time.perf_counter()
+        try:
+            with open_output(path, self.encoding, self.compression, self.level) as out_f:
+                out_f.write(block)
+        except Exception:
+            _remove(path)
+            raise
+        if self.metrics:
+            self.metrics.add("write", time.perf_counter() - began)
+        self._register(path, part_no, resume, self.part_chars)
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _run_worker(self, blocks):
+        """后台线程：依次写出分到这个线程的分割文件，直到收到退出通知"""
+        while True:
+            item = blocks.get()
+            if item is _STOP:
+                return
+            if isinstance(item, tuple):
+                if item[0] is _OPEN:
+                    self._write_part(item[1], blocks)
+            else:
+                self._slots.release()  # 出错后不再写出的块
+
+    def _write_part(self, path, blocks):
+        """写出一个分割文件的全部块，写完后登记"""
+        end = None
+        began = time.perf_counter()
+        idle = 0.0  # 等待主线程交来数据的时间，不计入写出耗时
+        try:
+            with open_output(path, self.encoding, self.compression, self.level) as out_f:
+                while True:
+                    waited = time.perf_counter()
+                    block = blocks.get()
+                    idle += time.perf_counter() - waited
+                    if isinstance(block, tuple):
+                        end = block if block[0] is _END else None
+                        break
+                    self._slots.release()
+                    if not self._aborted:
+                        out_f.write(block)
+            if self.metrics:
+                self.metrics.add("write", time.perf_counter() - began - idle)
+            if end is None or self._aborted:
+                _remove(path)
+                return
+            _, part_no, resume, size = end
+            self._register(path, part_no, resume, size)
+        except Exception as e:
+            _remove(path)
+            self._error = e
+            self._aborted = True
+            self._slots.release()  # 唤醒可能在等待队列空位的主线程
+
+    def _register(self, path, part_no, resume, size):
+        """把写完的文件登记到 PartTracker（主线程和后台线程都可能调用）"""
+        checksum = None
+        if self.tracker.checkpoint and resume is not None:
+            checksum = file_checksum(path)
+        with self._lock:
+            self.tracker.add(path, part_no, resume, checksum)
+            if self.log_callback:
+                unit = "字符" if self.encoding else "字节"
+                self.log_callback(f"已创建分割文件: {os.path.basename(path)} ({size} {unit})")
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
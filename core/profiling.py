@@ -0,0 +1,57 @@
+import os
+from contextlib import contextmanager
+
+PROFILE_TOP = 20  # 日志中列出的热点函数数
+
+
+def profile_path(output_dir, input_path):
+    """剖析结果文件的路径：输出目录中的 <输入文件名>.prof"""
+    return os.path.join(output_dir, os.path.basename(input_path) + ".prof")
+
+
+@contextmanager
+def profile_run(path, log_callback=None, top=PROFILE_TOP):
+    """
+    用 cProfile 剖析其中执行的分割，结束（包括出错或取消）后把结果保存到 path，
+    并在日志中列出自身耗时最多的 top 个函数；未启用剖析时调用方不进入此上下文，cProfile 不会被导入
+    剖析的是执行分割的线程：读取、解码、errors="replace" 的替换和正则查找都在其中；
+    PartWriter 后台线程的编码和写盘时间见运行指标中的“后台写出”，多进程并行的工作进程不在剖析范围内
+    """
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12 起同一时刻只能有一个剖析器（如批量分割时多个任务同时启用）
+        if log_callback:
+            log_callback("已有其他剖析正在进行，本次分割不剖析")
+        yield None
+        return
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        profiler.dump_stats(path)
+        if log_callback:
+            log_callback(f"剖析结果已保存: {path}（可用 python -m pstats 或 snakeviz 查看）")
+            for line in format_hotspots(profiler, top):
+                log_callback(line)
+
+
+def format_hotspots(profiler, top=PROFILE_TOP):
+    """按自身耗时从大到小列出前 top 个函数，返回日志行的列表"""
+    import pstats
+    stats = pstats.Stats(profiler).stats
+    total = sum(tottime for _, _, tottime, _, _ in stats.values())
+    rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    lines = [f"热点函数（共 {total:.2f} 秒，按自身耗时排序）:",
+             f"{'自身(s)':>9} {'占比':>6} {'累计(s)':>9} {'调用次数':>10}  函数"]
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in rows:
+        if filename == "~":
+            where = name  # 内置函数，如 <method 'decode' of 'bytes' objects>
+        else:
+            where = f"{name} ({os.path.basename(filename)}:{line})"
+        share = tottime / total if total else 0.0
+        lines.append(f"{tottime:9.3f} {share:6.1%} {cumtime:9.3f} {calls:10d}  {where}")
+    return lines
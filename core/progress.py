@@ -0,0 +1,110 @@
+import time
+from collections import namedtuple
+
+# 详细进度：百分比、已处理字节、总字节、吞吐量（字节/秒）、预计剩余秒数（未知时为 None）
+ProgressSnapshot = namedtuple("ProgressSnapshot", "percent done total rate eta")
+
+
+class ProgressReporter:
+    """
+    限频进度汇报器，所有分割函数共用
+    每隔 interval 秒或进度变化达到 min_step 个百分点时才回调一次，
+    避免逐行回调淹没 UI 事件队列
+    """
+
+    def __init__(self, callback=None, total=0, interval=0.1, min_step=1.0, detailed=False):
+        """
+        :param callback: 回调函数，detailed 为 False 时传入百分比，否则传入 ProgressSnapshot
+        :param total: 总字节数
+        :param interval: 两次回调之间的最小间隔（秒）
+        :param min_step: 进度变化达到该百分点时即使未到间隔也回调
+        :param detailed: 是否向回调传入包含吞吐量和剩余时间的 ProgressSnapshot
+        """
+        self.callback = callback
+        self.interval = interval
+        self.min_step = min_step
+        self.detailed = detailed
+        self.start(total)
+
+    @classmethod
+    def wrap(cls, progress_callback, total):
+        """把分割函数收到的 progress_callback（普通函数或 ProgressReporter）统一为汇报器"""
+        if isinstance(progress_callback, cls):
+            progress_callback.start(total)
+            return progress_callback
+        return cls(progress_callback, total)
+
+    def start(self, total):
+        """开始一次新的计时"""
+        self.total = max(0, total)
+        self.done = 0
+        self.start_time = time.monotonic()
+        self._last_time = self.start_time
+        self._last_percent = 0.0
+        # 已处理量每增加约千分之一才检查一次时间，逐行调用 update 时开销很小
+        self._check_step = max(1, self.total // 1000)
+        self._next_check = self._check_step
+
+    @property
+    def percent(self):
+        if self.total <= 0:
+            return 100.0
+        return min(100.0, self.done * 100 / self.total)
+
+    @property
+    def rate(self):
+        """平均吞吐量（字节/秒）"""
+        elapsed = time.monotonic() - self.start_time
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """预计剩余秒数，无法估计时为 None"""
+        rate = self.rate
+        if rate <= 0 or self.total <= 0:
+            return None
+        return max(0.0, (self.total - self.done) / rate)
+
+    def snapshot(self):
+        return ProgressSnapshot(self.percent, self.done, self.total, self.rate, self.eta)
+
+    def update(self, done):
+        """报告已处理的字节数（绝对值）"""
+        self.done = done
+        if done < self._next_check or not self.callback:
+            return
+        self._next_check = done + self._check_step
+        now = time.monotonic()
+        percent = self.percent
+        if percent <= self._last_percent:
+            return
+        if now - self._last_time >= self.interval or percent - self._last_percent >= self.min_step:
+            self._emit(now, percent)
+
+    def advance(self, amount):
+        """报告新增处理的字节数"""
+        self.update(self.done + amount)
+
+    def finish(self):
+        """处理结束，无论是否限频都回调一次 100%"""
+        self.done = max(self.done, self.total)
+        if self.callback:
+            self._emit(time.monotonic(), 100.0)
+
+    def _emit(self, now, percent):
+        self._last_time = now
+        self._last_percent = percent
+        if self.detailed:
+            self.callback(self.snapshot())
+        else:
+            self.callback(percent)
+
+
+def format_snapshot(snapshot):
+    """把 ProgressSnapshot 格式化为状态栏文字"""
+    text = f"{int(snapshot.percent)}% | {snapshot.rate / (1024 * 1024):.1f} MB/s"
+    if snapshot.eta is not None:
+        minutes, seconds = divmod(int(snapshot.eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        text += f" | 剩余 {hours:d}:{minutes:02d}:{seconds:02d}"
+    return text
@@ -1,10 +1,123 @@
+import codecs
 import os
 import re
-import math
-from .file_utils import calculate_total_chars, determine_encodings
+from functools import partial
+from itertools import chain
+from .file_utils import (calculate_total_chars, codec_name, count_lines, determine_encodings,
+                         open_text_input)
+from .file_index import FileIndex
+from .parallel import (should_use_parallel, split_ranges_parallel, is_char_countable,
+                       is_line_safe, iter_balanced_line_ranges, iter_char_ranges,
+                       iter_decoded_range, iter_line_ranges)
+from .byte_copy import (can_copy_bytes, count_chars, count_newlines, has_native_newlines,
+                        iter_byte_ranges, iter_raw_char_ranges, split_ranges_copy)
+from .progress import ProgressReporter
+from .metrics import RunMetrics, format_metrics
+from .cancel import CancelToken, PartTracker
+from .compression import (detect_compression, open_input, output_name, position_reader,
+                          output_suffix, resolve_level)
+from .part_writer import PartWriter
+from .checkpoint import Checkpoint, ResumePoint, START, byte_offset, seek_resume_point
+
+READ_BLOCK_CHARS = 1024 * 1024     # 按字符数分割时每次读取的字符数
+REGEX_BLOCK_CHARS = 1024 * 1024    # 正则分割每次读取的字符数
+REGEX_OVERLAP_CHARS = 64 * 1024    # 默认的匹配重叠区大小
+
+def _open_checkpoint(resumable, input_path, output_dir, mode, params, log_callback):
+    """启用断点续分时打开（必要时新建）检查点"""
+    if not resumable:
+        return None
+    return Checkpoint.open(input_path, output_dir, mode, params, log_callback)
+
+def read_line_pieces(f):
+    """
+    逐行读取文本文件，超过 READ_BLOCK_CHARS 的行分成多段返回（只有每行最后一段以换行结尾），
+    内存占用与行长无关；用 readline 读取，期间可以随时调用 tell() 记录续分位置
+    """
+    return iter(partial(f.readline, READ_BLOCK_CHARS), "")
+
+def _cached_count(index, key, count):
+    """从文件索引缓存中取出计数，没有时调用 count() 计算并记录"""
+    value = index.get(key) if index else None
+    if value is None:
+        value = count()
+        if index:
+            index.put(key, value)
+    return value
+
+def _copies_exactly(input_path, input_encoding, output_encoding, index, log_callback=None):
+    """
+    能否跳过解码直接复制字节：编码相同，且文件中的换行符已经是解码的引擎会写出的系统换行符；
+    否则（如 Linux 上的 \\r\\n 文件）改走解码的引擎，各引擎的输出保持一致
+    """
+    if not can_copy_bytes(input_encoding, output_encoding):
+        return False
+    counts = _cached_count(index, "newlines", partial(count_newlines, input_path))
+    if has_native_newlines(counts):
+        return True
+    if log_callback:
+        log_callback("文件的换行符与系统换行符不同，改为解码分割以统一换行符")
+    return False
+
+def _encode(encoder, text):
+    """与文本模式写出一致地编码：换行符换成系统换行符"""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return encoder.encode(text)
+
+def _reset_size(encoder):
+    """编码器在当前状态下结束时还要写出的字节数（如 ISO-2022-JP 切回 ASCII 的转义序列），状态不变"""
+    state = encoder.getstate()
+    size = len(encoder.encode("", final=True))
+    encoder.setstate(state)
+    return size
+
+def _fit_prefix(encoder, text, room, n, lines=False, check=None):
+    """
+    编码 text 开头最多 n 个字符，编码结果（含结束时的复位序列）超过 room 字节时
+    按实际的每字符字节数缩短后重新编码，只有跨越分割点的这一小段会被编码多次
+    :param lines: 为 True 时只在行尾截断（text 的最后一行可以没有换行符）
+    :param check: 每次重新编码前调用，如 CancelToken.check
+    :return: (字符数, 编码结果)；一个字符（一行）都放不下时返回 (0, b"")，编码器状态不变
+    """
+    if room <= 0:
+        return 0, b""
+    state = encoder.getstate()
+    low = (text.find("\n") + 1 or len(text)) if lines else 1
+    n = min(n, len(text))
+    while True:
+        if check:
+            check()
+        if lines and n < len(text):
+            n = text.rfind("\n", 0, n) + 1
+        n = max(n, low)
+        data = _encode(encoder, text[:n])
+        size = len(data) + _reset_size(encoder)
+        if size <= room:
+            return n, data
+        encoder.setstate(state)
+        if n == low:
+            return 0, b""
+        n = n * room // size
+
+def _report_metrics(metrics, engine, parts, bytes_read, log_callback, metrics_callback):
+    """运行结束：记录本次的性能指标，在日志中输出摘要并交给 metrics_callback"""
+    metrics.engine = engine
+    metrics.finish(parts, bytes_read)
+    if log_callback:
+        log_callback(format_metrics(metrics))
+    if metrics_callback:
+        metrics_callback(metrics)
+
+def _log_compression(output_compression, compression_level, log_callback):
+    if output_compression and log_callback:
+        log_callback(f"分割文件以 {output_compression} 压缩写出（级别 {compression_level}）")
 
 def split_file(input_path, output_dir, chars_per_file, input_encoding, output_encoding,
-              split_by_line=False, line_split_mode="strict", progress_callback=None, log_callback=None):
+              split_by_line=False, line_split_mode="strict", progress_callback=None, log_callback=None,
+              workers=None, cancel_token=None, keep_partial=False, resumable=False,
+              output_compression=None, compression_level=None, index_cache=True,
+              metrics_callback=None):
     """
     分割文件
     :param input_path: 输入文件路径
@@ -16,6 +129,15 @@ def split_file(input_path, output_dir, chars_per_file, input_encoding, output_en
     :param line_split_mode: 行分割模式 ("strict" 或 "flexible")
     :param progress_callback: 进度回调函数
     :param log_callback: 日志回调函数
+    :param workers: 并行进程数（None 为 CPU 核数，1 表示禁用并行）
+    :param cancel_token: CancelToken 取消/暂停令牌
+    :param keep_partial: 取消时是否保留已写完的分割文件
+    :param resumable: 是否写入检查点，并从输出目录中已有的检查点继续分割
+    :param output_compression: 分割文件的压缩格式（gzip/bz2/xz/zstd），None 表示不压缩
+    :param compression_level: 压缩级别，None 使用该格式的默认级别
+    :param index_cache: 是否使用文件索引缓存（编码检测结果、字符数、行数、稀疏行索引）
+    :param metrics_callback: 运行结束后传入本次的性能指标 RunMetrics，指标摘要同时写入日志
+    :return: 创建的文件数量
     """
     # 验证文件是否存在
     if not os.path.isfile(input_path):
@@ -25,269 +147,276 @@ def split_file(input_path, output_dir, chars_per_file, input_encoding, output_en
     os.makedirs(output_dir, exist_ok=True)
     
     # 获取文件信息
-    filename = os.path.basename(input_path)
-    base_name, ext = os.path.splitext(filename)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
     
+    metrics = RunMetrics("split_file", input_path)
     # 统一编码判断
-    input_encoding, output_encoding = determine_encodings(
-        input_path, input_encoding, output_encoding, log_callback=log_callback
-    )
-    
-    # 计算总字符数
-    if log_callback:
-        log_callback("正在计算文件总字符数...")
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
     
-    total_chars = calculate_total_chars(input_path, input_encoding)
-    
-    if log_callback:
-        log_callback(f"文件总字符数: {total_chars}")
+    # 单遍读取：进度按已读取的字节数计算，不再预先统计总字符数
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file",
+        {"chars_per_file": chars_per_file, "split_by_line": split_by_line,
+         "line_split_mode": line_split_mode, "input_encoding": input_encoding,
+         "output_encoding": output_encoding, "output_compression": output_compression,
+         "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    done_parts = checkpoint.completed if checkpoint else 0
+    point = checkpoint.resume_point if checkpoint else START
+    start = byte_offset(point, file_size)
     
-    # 计算需要分割的文件数量
-    num_files = math.ceil(total_chars / chars_per_file)
+    compression = detect_compression(input_path)
     
     if log_callback:
-        log_callback(f"将分割为 {num_files} 个文件")
+        log_callback(f"文件大小: {file_size} 字节")
+        if compression:
+            log_callback(f"输入为 {compression} 压缩文件，边解压边分割")
         log_callback("开始分割文件...")
         log_callback(f"输入编码: {input_encoding}, 输出编码: {output_encoding}")
         log_callback(f"分割方式: {'按行分割' if split_by_line else '按字符分割'}")
         if split_by_line:
             log_callback(f"行分割模式: {'严格行分割' if line_split_mode == 'strict' else '灵活行分割'}")
+    _log_compression(output_compression, compression_level, log_callback)
+    
+    # 大文件按字符分割时使用多进程并行引擎
+    if (not split_by_line and start is not None and compression is None
+            and is_char_countable(input_encoding) and should_use_parallel(input_path, workers)):
+        reporter.update(start)
+        with metrics.phase("parallel"), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = split_ranges_parallel(
+                input_path, output_dir,
+                iter_char_ranges(input_path, chars_per_file, input_encoding, start),
+                input_encoding, output_encoding, workers=workers,
+                reporter=reporter, log_callback=log_callback,
+                cancel_token=token, tracker=tracker, first_part=done_parts + 1,
+                compression=output_compression, level=compression_level,
+                metrics=metrics)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, "parallel", num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
     
-    # 实际分割文件
-    with open(input_path, "r", encoding=input_encoding, errors="replace") as f:
-        current_file = 1
-        current_chars = 0
-        current_chunk = []
+    # 实际分割文件：按字符读取大块文本时使用内存映射读取器，逐行读取时 C 实现的 readline 更快
+    opener = open_input if split_by_line else open_text_input
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            opener(input_path, input_encoding) as f, \
+            PartWriter(output_dir, base_name, ext, output_encoding, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        position = position_reader(f)
+        seek_resume_point(f, point)
+        writer.write(point.carry)
         
-        for line in f:
-            line_length = len(line)
-            
-            if split_by_line:
+        def write_part(carry=""):
+            """结束当前分割文件，carry 是已经读出但属于下一个文件开头的文本"""
+            writer.end_part(ResumePoint(f.tell(), 0, carry) if checkpoint else None)
+        
+        if split_by_line:
+            held = []          # 严格模式下尚未确定写入哪个文件的当前行片段
+            held_chars = 0
+            # 严格模式下当前行已确定写入当前文件；续分时 carry 不以换行结尾，
+            # 说明中断前超长的行已经开始写入这个文件，剩余部分也要写入其中
+            committed = bool(point.carry) and not point.carry.endswith("\n")
+            for piece in read_line_pieces(f):
+                reporter.update(position())
+                token.check()
+                line_end = piece.endswith("\n")
+                
                 if line_split_mode == "flexible":
-                    # 灵活行分割模式 - 优先保证行完整
-                    if current_chars + line_length > chars_per_file:
-                        # 即使超出限制也加入当前行
-                        current_chunk.append(line)
-                        current_chars += line_length
-                        
-                        # 写入当前块到文件
-                        chunk = ''.join(current_chunk)
-                        output_path = os.path.join(
-                            output_dir, 
-                            f"{base_name}_part{current_file}{ext}"
-                        )
-                        
-                        try:
-                            with open(output_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                                out_f.write(chunk)
-                            if log_callback:
-                                log_callback(f"已创建分割文件: {os.path.basename(output_path)} ({len(chunk)} 字符)")
-                        except Exception as e:
-                            if log_callback:
-                                log_callback(f"保存文件时出错: {str(e)}")
-                        
-                        # 更新进度
-                        if progress_callback:
-                            progress = (current_file / num_files) * 100
-                            progress_callback(progress)
-                        
-                        # 重置当前块
-                        current_file += 1
-                        current_chars = 0
-                        current_chunk = []
-                    else:
-                        # 当前行加入不会超出限制，正常添加
-                        current_chunk.append(line)
-                        current_chars += line_length
+                    # 灵活行分割模式 - 优先保证行完整，即使超出限制也加入当前行
+                    writer.write(piece)
+                    if line_end and writer.part_chars > chars_per_file:
+                        write_part()
+                
+                elif committed:
+                    # 严格行分割模式 - 超长的行已确定写入当前文件
+                    writer.write(piece)
+                
+                elif line_end and not held:
+                    # 严格行分割模式 - 整行一次读完
+                    if writer.part_chars + len(piece) > chars_per_file and writer.in_part:
+                        # 当前行会超出限制，先结束之前的文件，当前行写入新文件
+                        write_part(carry=piece)
+                    writer.write(piece)
                 
-                else:  # 严格行分割模式
-                    if current_chars + line_length > chars_per_file:
-                        # 当前行会超出限制，先保存之前的块
-                        if current_chunk:
-                            chunk = ''.join(current_chunk)
-                            output_path = os.path.join(
-                                output_dir, 
-                                f"{base_name}_part{current_file}{ext}"
-                            )
-                            
-                            try:
-                                with open(output_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                                    out_f.write(chunk)
-                                if log_callback:
-                                    log_callback(f"已创建分割文件: {os.path.basename(output_path)} ({len(chunk)} 字符)")
-                            except Exception as e:
-                                if log_callback:
-                                    log_callback(f"保存文件时出错: {str(e)}")
-                            
-                            # 更新进度
-                            if progress_callback:
-                                progress = (current_file / num_files) * 100
-                                progress_callback(progress)
-                            
-                            # 重置当前块
-                            current_file += 1
-                            current_chars = 0
-                            current_chunk = []
-                        
-                        # 将当前行放入新块
-                        current_chunk.append(line)
-                        current_chars = line_length
-                    else:
-                        # 当前行加入不会超出限制，正常添加
-                        current_chunk.append(line)
-                        current_chars += line_length
-            
-            else:
-                # 按字符分割模式
-                if current_chars + line_length > chars_per_file:
-                    # 找到可以拆分的位置
-                    available_space = chars_per_file - current_chars
-                    if available_space > 0:
-                        # 添加部分字符到当前块
-                        current_chunk.append(line[:available_space])
-                        current_chars += available_space
-                        
-                        # 写入当前块到文件
-                        chunk = ''.join(current_chunk)
-                        output_path = os.path.join(
-                            output_dir, 
-                            f"{base_name}_part{current_file}{ext}"
-                        )
-                        
-                        try:
-                            with open(output_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                                out_f.write(chunk)
-                            if log_callback:
-                                log_callback(f"已创建分割文件: {os.path.basename(output_path)} ({len(chunk)} 字符)")
-                        except Exception as e:
-                            if log_callback:
-                                log_callback(f"保存文件时出错: {str(e)}")
-                        
-                        # 更新进度
-                        if progress_callback:
-                            progress = (current_file / num_files) * 100
-                            progress_callback(progress)
-                        
-                        # 重置当前块
-                        current_file += 1
-                        current_chars = 0
-                        current_chunk = []
-                        
-                        # 剩余部分放到下一个块
-                        current_chunk.append(line[available_space:])
-                        current_chars += line_length - available_space
-                    else:
-                        # 当前行无法放入当前块，直接放到下一个块
-                        if current_chunk:
-                            chunk = ''.join(current_chunk)
-                            output_path = os.path.join(
-                                output_dir, 
-                                f"{base_name}_part{current_file}{ext}"
-                            )
-                            
-                            try:
-                                with open(output_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                                    out_f.write(chunk)
-                                if log_callback:
-                                    log_callback(f"已创建分割文件: {os.path.basename(output_path)} ({len(chunk)} 字符)")
-                            except Exception as e:
-                                if log_callback:
-                                    log_callback(f"保存文件时出错: {str(e)}")
-                            
-                            # 更新进度
-                            if progress_callback:
-                                progress = (current_file / num_files) * 100
-                                progress_callback(progress)
-                            
-                            current_file += 1
-                            current_chars = 0
-                            current_chunk = []
-                        
-                        current_chunk.append(line)
-                        current_chars += line_length
                 else:
-                    current_chunk.append(line)
-                    current_chars += line_length
+                    # 严格行分割模式 - 超长的行只暂存到超出剩余容量为止，暂存量不超过每个文件的字符数
+                    held.append(piece)
+                    held_chars += len(piece)
+                    if writer.in_part and writer.part_chars + held_chars > chars_per_file:
+                        write_part(carry="".join(held))
+                        committed = True
+                    elif not writer.in_part:
+                        committed = True
+                    if committed or line_end:
+                        for held_piece in held:
+                            writer.write(held_piece)
+                        held, held_chars = [], 0
+                
+                if line_end:
+                    committed = False
+            # 文件末尾没有换行符的最后一行
+            for held_piece in held:
+                writer.write(held_piece)
+        
+        else:
+            # 按字符分割模式 - 直接按字符数读取，一行可能跨越多个分割文件
+            while True:
+                token.check()
+                chunk = f.read(min(READ_BLOCK_CHARS, chars_per_file - writer.part_chars))
+                reporter.update(position())
+                if not chunk:
+                    break
+                writer.write(chunk)
+                if writer.part_chars >= chars_per_file:
+                    write_part()
         
         # 写入最后一个块
-        if current_chunk:
-            chunk = ''.join(current_chunk)
-            output_path = os.path.join(
-                output_dir, 
-                f"{base_name}_part{current_file}{ext}"
-            )
-            try:
-                with open(output_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                    out_f.write(chunk)
-                if log_callback:
-                    log_callback(f"已创建分割文件: {os.path.basename(output_path)} ({len(chunk)} 字符)")
-            except Exception as e:
-                if log_callback:
-                    log_callback(f"保存文件时出错: {str(e)}")
-            
-            # 更新进度
-            if progress_callback:
-                progress = (current_file / num_files) * 100
-                progress_callback(progress)
+        if writer.in_part:
+            write_part()
     
-    return current_file
+    tracker.finish()
+    reporter.finish()
+    metrics.chars = writer.total_chars
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
 
 def split_file_by_lines(input_path, output_dir, lines_per_file,
                         input_encoding, output_encoding,
-                        progress_callback=None, log_callback=None):
-    """纯粹按行数切分"""
+                        progress_callback=None, log_callback=None, workers=None,
+                        cancel_token=None, keep_partial=False, resumable=False,
+                        output_compression=None, compression_level=None, index_cache=True,
+                        metrics_callback=None):
+    """
+    纯粹按行数切分，大文件使用多进程并行引擎；resumable 为 True 时支持断点续分
+    output_compression 不为空时分割文件以该格式压缩写出
+    """
     if not os.path.isfile(input_path):
         raise FileNotFoundError(f"文件不存在: {input_path}")
 
     os.makedirs(output_dir, exist_ok=True)
-    filename = os.path.basename(input_path)
-    base_name, ext = os.path.splitext(filename)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
 
+    metrics = RunMetrics("split_file_by_lines", input_path)
     # 统一编码判断
-    input_encoding, output_encoding = determine_encodings(
-        input_path, input_encoding, output_encoding, log_callback=log_callback
-    )
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
 
-    # 总行数
-    with open(input_path, 'r', encoding=input_encoding, errors='replace') as f:
-        total_lines = sum(1 for _ in f)
+    # 单遍读取：进度按已读取的字节数计算，不再预先统计总行数
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file_by_lines",
+        {"lines_per_file": lines_per_file, "input_encoding": input_encoding,
+         "output_encoding": output_encoding, "output_compression": output_compression,
+         "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    done_parts = checkpoint.completed if checkpoint else 0
+    point = checkpoint.resume_point if checkpoint else START
+    start = byte_offset(point, file_size)
+    compression = detect_compression(input_path)
     if log_callback:
-        log_callback(f"文件总行数: {total_lines}")
+        log_callback(f"文件大小: {file_size} 字节")
+        if compression:
+            log_callback(f"输入为 {compression} 压缩文件，边解压边分割")
+    _log_compression(output_compression, compression_level, log_callback)
+
+    # 输入输出编码相同时直接复制字节，完全不解码（仅限未压缩的输入）
+    if (start is not None and compression is None
+            and _copies_exactly(input_path, input_encoding, output_encoding, index, log_callback)):
+        reporter.update(start)
+        with metrics.phase("copy"), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = split_ranges_copy(
+                input_path, output_dir,
+                iter_line_ranges(input_path, lines_per_file, input_encoding, start, index),
+                input_encoding, reporter=reporter, log_callback=log_callback,
+                cancel_token=token, tracker=tracker, first_part=done_parts + 1,
+                compression=output_compression, level=compression_level)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, "copy", num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
+
+    if (start is not None and compression is None and is_line_safe(input_encoding)
+            and should_use_parallel(input_path, workers)):
+        reporter.update(start)
+        with metrics.phase("parallel"), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = split_ranges_parallel(
+                input_path, output_dir,
+                iter_line_ranges(input_path, lines_per_file, input_encoding, start, index),
+                input_encoding, output_encoding, workers=workers,
+                reporter=reporter, log_callback=log_callback,
+                cancel_token=token, tracker=tracker, first_part=done_parts + 1,
+                compression=output_compression, level=compression_level,
+                metrics=metrics)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, "parallel", num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
+
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            open_input(input_path, input_encoding) as in_f, \
+            PartWriter(output_dir, base_name, ext, output_encoding, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        position = position_reader(in_f)
+        seek_resume_point(in_f, point)
+        written_lines = done_parts * lines_per_file
+        line_end = True
+        for piece in read_line_pieces(in_f):
+            token.check()
+            writer.write(piece)
+            reporter.update(position())
+            line_end = piece.endswith('\n')
+            if line_end:
+                written_lines += 1
+                if written_lines % lines_per_file == 0:
+                    writer.end_part(ResumePoint(in_f.tell(), 0, '') if checkpoint else None)
 
-    total_files = (total_lines + lines_per_file - 1) // lines_per_file
+        if not line_end:
+            written_lines += 1  # 文件末尾没有换行符的最后一行
+        writer.end_part(ResumePoint(in_f.tell(), 0, '') if checkpoint else None)
+    tracker.finish()
+    reporter.finish()
     if log_callback:
-        log_callback(f"将分割为 {total_files} 个文件")
-
-    with open(input_path, 'r', encoding=input_encoding, errors='replace') as in_f:
-        file_no = 1
-        written_lines = 0
-        out_f = None
-        for line_no, line in enumerate(in_f, 1):
-            if written_lines % lines_per_file == 0:
-                if out_f:
-                    out_f.close()
-                out_path = os.path.join(output_dir, f"{base_name}_part{file_no}{ext}")
-                out_f = open(out_path, 'w', encoding=output_encoding, errors='replace')
-                file_no += 1
-                if log_callback:
-                    log_callback(f"创建: {os.path.basename(out_path)}")
-
-            out_f.write(line)
-            written_lines += 1
-
-            if progress_callback:
-                progress = min(100, int(line_no * 100 / total_lines))
-                progress_callback(progress)
-
-        if out_f:
-            out_f.close()
-    return file_no - 1
+        log_callback(f"文件总行数: {written_lines}")
+    metrics.chars = writer.total_chars
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
 
 def split_file_by_parts(input_path, output_dir, total_parts,
                         input_encoding, output_encoding,
-                        progress_callback=None, log_callback=None):
+                        progress_callback=None, log_callback=None,
+                        cancel_token=None, keep_partial=False, resumable=False,
+                        output_compression=None, compression_level=None, index_cache=True,
+                        metrics_callback=None):
     """
     按指定份数 **严格按字符数** 均分文件（行可能被截断）
+    resumable 为 True 时写入检查点，并从已有的检查点继续分割
+    output_compression 不为空时分割文件以该格式压缩写出
     """
     if not os.path.isfile(input_path):
         raise FileNotFoundError(f"文件不存在: {input_path}")
@@ -295,50 +424,405 @@ def split_file_by_parts(input_path, output_dir, total_parts,
         raise ValueError("份数必须大于 0")
 
     os.makedirs(output_dir, exist_ok=True)
-    filename = os.path.basename(input_path)
-    base_name, ext = os.path.splitext(filename)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
 
+    metrics = RunMetrics("split_file_by_parts", input_path)
     # 统一编码判断
-    input_encoding, output_encoding = determine_encodings(
-        input_path, input_encoding, output_encoding, log_callback=log_callback
-    )
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
 
-    # 总字符数 & 每份字符数
-    total_chars = calculate_total_chars(input_path, input_encoding)
-    chars_per_part = total_chars // total_parts
+    # 总字符数 & 每份字符数（均分必须预先知道总字符数，这是份数模式唯一的额外读取）
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file_by_parts",
+        {"total_parts": total_parts, "input_encoding": input_encoding,
+         "output_encoding": output_encoding, "output_compression": output_compression,
+         "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    done_parts = checkpoint.completed if checkpoint else 0
+    point = checkpoint.resume_point if checkpoint else START
+    start = byte_offset(point, file_size)
+    compression = detect_compression(input_path)
+    if compression and log_callback:
+        log_callback(f"输入为 {compression} 压缩文件，边解压边分割")
+    copy_bytes = (compression is None and is_char_countable(input_encoding)
+                  and _copies_exactly(input_path, input_encoding, output_encoding, index,
+                                      log_callback))
+    codec = codec_name(input_encoding)
+    with metrics.phase("count"):
+        if copy_bytes:
+            total_chars = _cached_count(index, f"raw_chars:{codec}",
+                                        partial(count_chars, input_path, input_encoding))
+        else:
+            total_chars = _cached_count(index, f"chars:{codec}",
+                                        partial(calculate_total_chars, input_path, input_encoding))
     base_size = (total_chars + total_parts - 1) // total_parts
     if log_callback:
         log_callback(f"文件总字符数: {total_chars}")
         log_callback(f"将按 {total_parts} 份分割")
+    _log_compression(output_compression, compression_level, log_callback)
+
+    # 输入输出编码相同时直接复制字节，完全不解码
+    if copy_bytes and total_chars > 0 and start is not None:
+        reporter.update(start)
+        with metrics.phase("copy"), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = split_ranges_copy(
+                input_path, output_dir,
+                iter_raw_char_ranges(input_path, base_size, input_encoding, start),
+                input_encoding, reporter=reporter, log_callback=log_callback,
+                cancel_token=token, tracker=tracker, first_part=done_parts + 1,
+                compression=output_compression, level=compression_level)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, "copy", num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
 
     # 开始切块
-    with open(input_path, "r", encoding=input_encoding, errors="replace") as f:
-        for part_no in range(1, total_parts + 1):
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            open_text_input(input_path, input_encoding) as f, \
+            PartWriter(output_dir, base_name, ext, output_encoding, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        position = position_reader(f)
+        seek_resume_point(f, point)
+        for part_no in range(done_parts + 1, total_parts + 1):
             # 计算当前份大小
             if part_no < total_parts:
                 current_chunk_size = base_size
             else:
                 current_chunk_size = total_chars - (total_parts - 1) * base_size
-            chunk = f.read(current_chunk_size)
-            if not chunk:
+            while writer.part_chars < current_chunk_size:
+                token.check()
+                chunk = f.read(min(READ_BLOCK_CHARS, current_chunk_size - writer.part_chars))
+                reporter.update(position())
+                if not chunk:
+                    break
+                writer.write(chunk)
+            if not writer.in_part:
                 break
-            out_path = os.path.join(output_dir, f"{base_name}_part{part_no}{ext}")
-            with open(out_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                out_f.write(chunk)
-            if log_callback:
-                log_callback(f"已创建: {os.path.basename(out_path)} ({len(chunk)} 字符)")
-            if progress_callback:
-                progress = (part_no / total_parts) * 100
-                progress_callback(progress)
+            writer.end_part(ResumePoint(f.tell(), 0, "") if checkpoint else None)
 
-    return total_parts
+    tracker.finish()
+    reporter.finish()
+    metrics.chars = writer.total_chars
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
+
+def split_file_by_line_parts(input_path, output_dir, total_parts,
+                             input_encoding, output_encoding,
+                             progress_callback=None, log_callback=None, workers=None,
+                             cancel_token=None, keep_partial=False, resumable=False,
+                             output_compression=None, compression_level=None, index_cache=True,
+                             metrics_callback=None):
+    """
+    按指定份数均分文件并 **保持行完整**
+    按字节把文件均分为 total_parts 份，每个分割点推到其后的第一个行首，
+    只需 total_parts - 1 次定位，不预先统计字符数或行数；超长的行可能使实际份数变少
+    压缩输入或无法按字节定位换行的编码（UTF-16/32）先统计总行数，再按行数均分
+    resumable 为 True 时写入检查点，并从已有的检查点继续分割
+    """
+    if not os.path.isfile(input_path):
+        raise FileNotFoundError(f"文件不存在: {input_path}")
+    if total_parts <= 0:
+        raise ValueError("份数必须大于 0")
+
+    metrics = RunMetrics("split_file_by_line_parts", input_path)
+    # 统一编码判断
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
+
+    compression = detect_compression(input_path)
+    if compression or not is_line_safe(input_encoding):
+        total_lines = _cached_count(index, f"lines:{codec_name(input_encoding)}",
+                                    partial(count_lines, input_path, input_encoding))
+        lines_per_file = max(1, (total_lines + total_parts - 1) // total_parts)
+        if log_callback:
+            log_callback(f"无法按字节定位行首，改为按行数均分: 共 {total_lines} 行，"
+                         f"每份 {lines_per_file} 行")
+        return split_file_by_lines(
+            input_path, output_dir, lines_per_file, input_encoding, output_encoding,
+            progress_callback=progress_callback, log_callback=log_callback, workers=workers,
+            cancel_token=cancel_token, keep_partial=keep_partial, resumable=resumable,
+            output_compression=output_compression, compression_level=compression_level,
+            index_cache=index_cache, metrics_callback=metrics_callback)
+
+    os.makedirs(output_dir, exist_ok=True)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
+
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file_by_line_parts",
+        {"total_parts": total_parts, "input_encoding": input_encoding,
+         "output_encoding": output_encoding, "output_compression": output_compression,
+         "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    done_parts = checkpoint.completed if checkpoint else 0
+    start = byte_offset(checkpoint.resume_point if checkpoint else START, file_size)
+    # 分割点只取决于文件大小和份数，续分时重新规划并跳过已完成的部分
+    with metrics.phase("count"):
+        ranges = list(iter_balanced_line_ranges(input_path, total_parts, input_encoding, start))
+    if log_callback:
+        log_callback(f"文件大小: {file_size} 字节")
+        log_callback(f"将按 {total_parts} 份分割（按字节均分，分割点对齐到行首）")
+    _log_compression(output_compression, compression_level, log_callback)
+    reporter.update(start)
+
+    # 输入输出编码相同时直接复制字节；否则大文件用多进程并行转码
+    if _copies_exactly(input_path, input_encoding, output_encoding, index, log_callback):
+        engine_name = "copy"
+        engine = partial(split_ranges_copy, input_path, output_dir, ranges, input_encoding)
+    elif should_use_parallel(input_path, workers):
+        engine_name = "parallel"
+        engine = partial(split_ranges_parallel, input_path, output_dir, ranges,
+                         input_encoding, output_encoding, workers=workers, metrics=metrics)
+    else:
+        engine = None
+    if engine:
+        with metrics.phase(engine_name), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = engine(reporter=reporter, log_callback=log_callback, cancel_token=token,
+                         tracker=tracker, first_part=done_parts + 1,
+                         compression=output_compression, level=compression_level)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, engine_name, num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
+
+    # 逐个范围解码后写出
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            open(input_path, "rb") as in_f, \
+            PartWriter(output_dir, base_name, ext, output_encoding, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        for range_start, range_end in ranges:
+            for text in iter_decoded_range(in_f, range_start, range_end, input_encoding,
+                                           token.check):
+                writer.write(text)
+                reporter.update(in_f.tell())
+            writer.end_part(ResumePoint(range_end, 0, "") if checkpoint else None)
+
+    tracker.finish()
+    reporter.finish()
+    metrics.chars = writer.total_chars
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
+
+def split_file_by_bytes(input_path, output_dir, bytes_per_file,
+                        input_encoding, output_encoding, keep_lines=False,
+                        progress_callback=None, log_callback=None,
+                        cancel_token=None, keep_partial=False, resumable=False,
+                        output_compression=None, compression_level=None, index_cache=True,
+                        metrics_callback=None):
+    """
+    按输出字节数分割：每个分割文件按输出编码编码后（含 BOM）不超过 bytes_per_file 字节，
+    分割点不会落在多字节字符中间；keep_lines 为 True 时在行尾分割，比一个文件还长的行按字符截断
+    输入输出编码相同时直接按字节范围复制；否则每段文本只编码一次，编码结果直接写出
+    output_compression 不为空时限制的是压缩前的字节数
+    resumable 为 True 时写入检查点，并从已有的检查点继续分割
+    """
+    if not os.path.isfile(input_path):
+        raise FileNotFoundError(f"文件不存在: {input_path}")
+    if bytes_per_file <= 0:
+        raise ValueError("每个文件的字节数必须大于 0")
+
+    os.makedirs(output_dir, exist_ok=True)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
+
+    metrics = RunMetrics("split_file_by_bytes", input_path)
+    # 统一编码判断
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
+    # BOM 在每个文件开头单独写出，每个文件至少还要放得下一个字符
+    header = "".encode(output_encoding)
+    if bytes_per_file <= len(header):
+        raise ValueError(f"每个文件的字节数必须大于 {output_encoding} 的 BOM（{len(header)} 字节）")
+
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file_by_bytes",
+        {"bytes_per_file": bytes_per_file, "keep_lines": keep_lines,
+         "input_encoding": input_encoding, "output_encoding": output_encoding,
+         "output_compression": output_compression, "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    done_parts = checkpoint.completed if checkpoint else 0
+    point = checkpoint.resume_point if checkpoint else START
+    start = byte_offset(point, file_size)
+    compression = detect_compression(input_path)
+    if log_callback:
+        log_callback(f"文件大小: {file_size} 字节")
+        if compression:
+            log_callback(f"输入为 {compression} 压缩文件，边解压边分割")
+        log_callback(f"每个文件最多 {bytes_per_file} 字节（{output_encoding}）"
+                     + ("，保持整行" if keep_lines else ""))
+    _log_compression(output_compression, compression_level, log_callback)
+
+    # 输入输出编码相同时直接复制字节，完全不解码
+    if (start is not None and compression is None
+            and (keep_lines or is_char_countable(input_encoding))
+            and _copies_exactly(input_path, input_encoding, output_encoding, index, log_callback)):
+        reporter.update(start)
+        with metrics.phase("copy"), tracker.cleanup_on_cancel(keep_partial, log_callback):
+            num = split_ranges_copy(
+                input_path, output_dir,
+                iter_byte_ranges(input_path, bytes_per_file, input_encoding, keep_lines, start),
+                input_encoding, reporter=reporter, log_callback=log_callback,
+                cancel_token=token, tracker=tracker, first_part=done_parts + 1,
+                compression=output_compression, level=compression_level)
+        if num is not None:
+            tracker.finish()
+            reporter.finish()
+            _report_metrics(metrics, "copy", num - done_parts, file_size - start,
+                            log_callback, metrics_callback)
+            return num
+
+    # 在主线程中编码，PartWriter 直接写出字节
+    encoder = codecs.getincrementalencoder(output_encoding)("replace")
+    encoder.encode("")
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            open_text_input(input_path, input_encoding) as f, \
+            PartWriter(output_dir, base_name, ext, None, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        position = position_reader(f)
+        seek_resume_point(f, point)
+        seen_chars = seen_bytes = 0   # 已写出的字符数和字节数，用来估算分割点附近的字符数
+
+        def room():
+            """当前分割文件还能写入的字节数"""
+            return bytes_per_file - max(writer.part_chars, len(header))
+
+        def write(data):
+            nonlocal seen_bytes
+            if not writer.in_part:
+                writer.write(header)
+            writer.write(data)
+            seen_bytes += len(data)
+
+        def end_part(*carry):
+            """结束当前分割文件，carry 是已经读出但还没有写出的文本"""
+            write(encoder.encode("", final=True))  # 有移位状态的编码（如 ISO-2022-JP）复位
+            writer.end_part(ResumePoint(f.tell(), 0, "".join(carry)) if checkpoint else None)
+
+        def fill(text, held=(), lines=False, keep_rest=False):
+            """
+            把 text 写入当前及之后的分割文件，每个文件写满为止
+            :param held: 已经读出、排在 text 之后还没有处理的文本，结束文件时一并记入续分位置
+            :param lines: text 由整行组成，只在行尾分割；比一个文件还长的行按字符截断
+            :param keep_rest: 能放进一个新文件的剩余部分不写出，返回给调用方
+            """
+            nonlocal seen_chars
+            while text:
+                token.check()
+                empty = writer.part_chars <= len(header)
+                # 每个字符至少编码为一个字节，字符数超过剩余容量时不必尝试
+                if keep_rest and empty and len(text) <= room():
+                    with metrics.phase("encode"):
+                        state = encoder.getstate()
+                        fits = len(_encode(encoder, text)) + _reset_size(encoder) <= room()
+                        encoder.setstate(state)
+                    if fits:
+                        return text
+                guess = room() * seen_chars // seen_bytes if seen_bytes else room()
+                with metrics.phase("encode"):
+                    n, data = _fit_prefix(encoder, text, room(), guess, lines, token.check)
+                if n:
+                    write(data)
+                    seen_chars += n
+                    text = text[n:]
+                elif not empty:
+                    end_part(text, *held)
+                elif lines:
+                    # 一行比整个文件还长，按字符截断成若干个写满的文件，剩余部分从新文件开头继续
+                    end = text.find("\n") + 1 or len(text)
+                    text = fill(text[:end], (text[end:], *held), keep_rest=True) + text[end:]
+                else:
+                    # 每个文件的字节数比一个字符还小，只好让这个字符单独成为一个文件
+                    write(_encode(encoder, text[0]))
+                    seen_chars += 1
+                    text = text[1:]
+            return ""
+
+        if keep_lines:
+            # 按块读取，每块中的整行一次编码；最后不完整的一行留到下一块
+            held = []
+            for chunk in chain([point.carry], iter(partial(f.read, READ_BLOCK_CHARS), "")):
+                token.check()
+                reporter.update(position())
+                cut = chunk.rfind("\n") + 1
+                if cut:
+                    text = "".join(held) + chunk[:cut]
+                    held = [chunk[cut:]]
+                    fill(text, held, lines=True)
+                else:
+                    held.append(chunk)
+                if sum(map(len, held)) > bytes_per_file:
+                    # 还没读完的一行已经超过一个文件（每个字符至少一个字节），先按字符截断，内存占用有上限
+                    text = "".join(held)
+                    if writer.part_chars > len(header):
+                        end_part(text)
+                    held = [fill(text, keep_rest=True)]
+            # 文件末尾没有换行符的最后一行
+            fill("".join(held), lines=True)
+
+        else:
+            fill(point.carry)
+            while True:
+                token.check()
+                chunk = f.read(READ_BLOCK_CHARS)
+                reporter.update(position())
+                if not chunk:
+                    break
+                fill(chunk)
+
+        # 写入最后一个块
+        if writer.in_part:
+            end_part("")
+
+    tracker.finish()
+    reporter.finish()
+    metrics.chars = seen_chars
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
 
 def split_file_by_regex(input_path, output_dir, regex_pattern, 
                         input_encoding, output_encoding,
                         include_delimiter=False,  # 是否包含分隔符在结果中
-                        progress_callback=None, log_callback=None):
+                        progress_callback=None, log_callback=None,
+                        regex_flags=re.MULTILINE, max_match_length=REGEX_OVERLAP_CHARS,
+                        cancel_token=None, keep_partial=False, resumable=False,
+                        output_compression=None, compression_level=None, index_cache=True,
+                        metrics_callback=None):
     """
     按正则表达式分割文件
+    以大块读取解码后的文本并在滑动窗口中查找，分隔符可以跨越多行；
+    每次保留 max_match_length 个字符的重叠区，内存占用与文件大小无关
     :param input_path: 输入文件路径
     :param output_dir: 输出目录
     :param regex_pattern: 正则表达式模式
@@ -347,79 +831,140 @@ def split_file_by_regex(input_path, output_dir, regex_pattern,
     :param include_delimiter: 是否在分割结果中包含分隔符
     :param progress_callback: 进度回调函数
     :param log_callback: 日志回调函数
+    :param regex_flags: 正则标志，默认 re.MULTILINE 使 ^/$ 匹配每行的行首/行尾
+    :param max_match_length: 单个匹配（含前后断言）的最大长度，更长的匹配会被截断
+    :param cancel_token: CancelToken 取消/暂停令牌
+    :param keep_partial: 取消时是否保留已写完的分割文件
+    :param resumable: 是否写入检查点，并从输出目录中已有的检查点继续分割
+    :param output_compression: 分割文件的压缩格式（gzip/bz2/xz/zstd），None 表示不压缩
+    :param compression_level: 压缩级别，None 使用该格式的默认级别
+    :param index_cache: 是否使用文件索引缓存（编码检测结果、字符数、行数、稀疏行索引）
+    :param metrics_callback: 运行结束后传入本次的性能指标 RunMetrics，指标摘要同时写入日志
     :return: 创建的文件数量
     """
     if not os.path.isfile(input_path):
         raise FileNotFoundError(f"文件不存在: {input_path}")
     
     os.makedirs(output_dir, exist_ok=True)
-    filename = os.path.basename(input_path)
-    base_name, ext = os.path.splitext(filename)
+    base_name, ext = output_name(input_path)
+    compression_level = resolve_level(output_compression, compression_level)
+    ext += output_suffix(output_compression)
     
+    metrics = RunMetrics("split_file_by_regex", input_path)
     # 统一编码判断
-    input_encoding, output_encoding = determine_encodings(
-        input_path, input_encoding, output_encoding, log_callback=log_callback
-    )
+    index = FileIndex.open(input_path, index_cache)
+    with metrics.phase("detect"):
+        input_encoding, output_encoding = determine_encodings(
+            input_path, input_encoding, output_encoding, log_callback=log_callback, index=index
+        )
     
     # 编译正则表达式
     try:
-        pattern = re.compile(regex_pattern)
+        pattern = re.compile(regex_pattern, regex_flags)
     except re.error as e:
         raise ValueError(f"无效的正则表达式: {e}")
     
-    file_count = 1
-    current_chunk = []
+    file_size = os.path.getsize(input_path)
+    reporter = ProgressReporter.wrap(progress_callback, file_size)
+    overlap = max(1, max_match_length)
+    token = cancel_token or CancelToken()
+    checkpoint = _open_checkpoint(
+        resumable, input_path, output_dir, "split_file_by_regex",
+        {"regex_pattern": regex_pattern, "regex_flags": int(regex_flags),
+         "include_delimiter": include_delimiter, "max_match_length": max_match_length,
+         "input_encoding": input_encoding, "output_encoding": output_encoding,
+         "output_compression": output_compression, "compression_level": compression_level},
+        log_callback)
+    tracker = PartTracker(checkpoint)
+    point = checkpoint.resume_point if checkpoint else START
+    done_parts = checkpoint.completed if checkpoint else 0
     
-    with open(input_path, "r", encoding=input_encoding, errors="replace") as f:
+    with metrics.phase("decode"), tracker.cleanup_on_cancel(keep_partial, log_callback), \
+            open_text_input(input_path, input_encoding) as f, \
+            PartWriter(output_dir, base_name, ext, output_encoding, tracker, output_compression,
+                       compression_level, log_callback, done_parts + 1, metrics=metrics) as writer:
+        position = position_reader(f)
         if log_callback:
             log_callback(f"开始按正则表达式分割: {regex_pattern}")
+        _log_compression(output_compression, compression_level, log_callback)
+        writer.write(point.carry)
         
-        for line in f:
-            # 在当前行中查找所有匹配
-            matches = list(pattern.finditer(line))
-            
-            if not matches:
-                current_chunk.append(line)
-                continue
+        # buf[:pos] 是已处理的上下文（供后向断言和 ^ 使用），buf[pos:] 尚未处理
+        buf = seek_resume_point(f, point)[-overlap:]
+        pos = len(buf)
+        search_at = pos
+        # 各读取块在 buf 中的起点 (tell() 位置, 下标)，用于换算检查点的续分位置
+        marks = [(point.offset, pos - point.skip)]
+        
+        def resume_at(index, carry):
+            """buf[index] 对应的续分位置"""
+            if not checkpoint:
+                return None
+            offset, block_start = next(m for m in reversed(marks) if m[1] <= index)
+            return ResumePoint(offset, index - block_start, carry)
+        
+        decoded_chars = 0
+        eof = False
+        while not eof:
+            token.check()
+            if checkpoint:
+                marks.append((f.tell(), len(buf)))
+            block = f.read(REGEX_BLOCK_CHARS)
+            reporter.update(position())
+            if block:
+                buf += block
+                decoded_chars += len(block)
+                # 起点落在重叠区之前的匹配才能确定完整，其余留到下一块
+                limit = len(buf) - overlap
+                if limit <= pos:
+                    continue
+            else:
+                eof = True
+                limit = len(buf)
             
-            last_index = 0
-            for match in matches:
+            while search_at <= len(buf):
+                match = pattern.search(buf, search_at)
+                if not match or match.start() >= limit:
+                    break
                 start, end = match.span()
                 
                 # 添加匹配前的部分
-                if start > last_index:
-                    current_chunk.append(line[last_index:start])
+                writer.write(buf[pos:start])
                 
-                # 处理匹配部分
-                matched_text = line[start:end]
+                # 是否包含分隔符在结果中
+                delimiter = buf[start:end] if include_delimiter else ""
                 
-                # 如果当前块有内容，写入文件
-                if current_chunk:
-                    out_path = os.path.join(output_dir, f"{base_name}_part{file_count}{ext}")
-                    with open(out_path, "w", encoding=output_encoding, errors="replace") as out_f:
-                        out_f.write(''.join(current_chunk))
-                    if log_callback:
-                        log_callback(f"已创建: {os.path.basename(out_path)}")
-                    file_count += 1
-                    current_chunk = []
+                # 如果当前文件有内容，结束该文件
+                if writer.in_part:
+                    token.check()
+                    writer.end_part(resume_at(end, delimiter))
                 
-                # 是否包含分隔符在结果中
-                if include_delimiter:
-                    current_chunk.append(matched_text)
+                writer.write(delimiter)
                 
-                last_index = end
+                pos = end
+                # 空匹配时向后移动一个字符，避免原地重复匹配
+                search_at = end if end > start else end + 1
             
-            # 添加匹配后的剩余部分
-            if last_index < len(line):
-                current_chunk.append(line[last_index:])
+            # 重叠区之前不再有匹配，提交到当前块并丢弃多余的上下文
+            commit = max(pos, limit)
+            writer.write(buf[pos:commit])
+            keep = min(commit, overlap)
+            dropped = commit - keep
+            buf = buf[dropped:]
+            search_at = max(search_at - dropped, keep)
+            pos = keep
+            if checkpoint:
+                marks = [(offset, index - dropped) for offset, index in marks]
+                while len(marks) > 1 and marks[1][1] <= 0:
+                    marks.pop(0)
     
-    # 写入最后一块
-    if current_chunk:
-        out_path = os.path.join(output_dir, f"{base_name}_part{file_count}{ext}")
-        with open(out_path, "w", encoding=output_encoding, errors="replace") as out_f:
-            out_f.write(''.join(current_chunk))
-        if log_callback:
-            log_callback(f"已创建: {os.path.basename(out_path)}")
-        file_count += 1
+        # 写入最后一块
+        writer.end_part(resume_at(len(buf), ""))
     
-    return file_count - 1
\ No newline at end of file
+    tracker.finish()
+    reporter.finish()
+    metrics.chars = decoded_chars
+    start = byte_offset(point, file_size)
+    _report_metrics(metrics, "text", writer.last_part - done_parts, file_size - (start or 0),
+                    log_callback, metrics_callback)
+    return writer.last_part
@@ -1,15 +1,17 @@
 import os,sys
+import re
 import tkinter as tk
 from tkinterdnd2 import DND_FILES
-from tkinter import filedialog, messagebox, ttk
+from tkinter import messagebox, ttk
 import platform
-import subprocess
 import threading
-from .font_settings import FontSettingsDialog
-from .widgets import LabelledEntry, LabelledCombobox, LogWidget
+from .widgets import LabelledEntry, LabelledCombobox, LogWidget, BatchList, parse_drop_paths
 from .styles import StyleManager
-from core.splitter import split_file
+from core.batch import MODES, RUNNING, DONE, BatchQueue, SplitJob
+from core.compression import OUTPUT_LEVELS
 from core.config_manager import ConfigManager
+from core.progress import ProgressReporter, format_snapshot
+from core.cancel import CancelToken, SplitCancelled
 
 
 class FileSplitterApp:
@@ -22,6 +24,10 @@ class FileSplitterApp:
 
         self.config = ConfigManager()
         self.style_manager = StyleManager(root)
+        self.cancel_token = None
+        self.keep_partial = False
+        self.resumable = False
+        self.batch_queue = None
 
         self.main_frame = ttk.Frame(root, padding="15")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -42,11 +48,16 @@ class FileSplitterApp:
         self.chars_entry.entry.bind("<FocusOut>", self.save_settings)
         self.encoding_combo.combo.bind("<<ComboboxSelected>>", self.save_settings)
         self.output_encoding_combo.combo.bind("<<ComboboxSelected>>", self.save_settings)
+        self.compression_combo.combo.bind("<<ComboboxSelected>>", self.save_settings)
         self.line_mode_combo.combo.bind("<<ComboboxSelected>>", self.save_settings)
 
     def on_closing(self):
         """窗口关闭时保存设置再退出"""
-        self.save_settings()          # 把当前输入写进配置文件
+        self.save_settings()          # 把当前输入写进配置
+        self.config.flush()           # 立即写入尚未落盘的修改
+        if self.cancel_token:
+            self.cancel_token.cancel()  # 让仍在运行的分割任务尽快退出
+        self.log_widget.close_log_file()
         self.root.destroy()           # 真正关闭窗口
 
     # ---------- 应用保存的设置 ----------
@@ -71,10 +82,14 @@ class FileSplitterApp:
             val = self.config.get_setting('Settings', 'lines_per_file', '1000')
             self.chars_entry.set_value(val)
             self.chars_entry.set_label_text("每份文件的字符数/行数/份数:")
-        elif mode == "份数分割":
+        elif mode in ("份数分割", "整行份数分割"):
             val = self.config.get_setting('Settings', 'parts_per_file', '4')
             self.chars_entry.set_value(val)
             self.chars_entry.set_label_text("每份文件的字符数/行数/份数:")
+        elif mode in ("按字节分割", "整行字节分割"):
+            val = self.config.get_setting('Settings', 'bytes_per_file', '104857600')
+            self.chars_entry.set_value(val)
+            self.chars_entry.set_label_text("每份文件的字符数/行数/份数:")
         else:   # 按字符 / 严格行 / 灵活行 / 正则表达式
             val = self.config.get_setting('Settings', 'chars_per_file', '1000')
             self.chars_entry.set_value(val)
@@ -85,6 +100,8 @@ class FileSplitterApp:
         out_enc = self.config.get_setting('Settings', 'output_encoding', '同输入编码')
         self.encoding_combo.set_value(in_enc)
         self.output_encoding_combo.set_value(out_enc)
+        self.compression_combo.set_value(
+            self.config.get_setting('Settings', 'output_compression', '不压缩'))
         
         # 5. 恢复正则表达式设置
         regex_val = self.config.get_setting('Settings', 'regex_pattern', '')
@@ -93,6 +110,18 @@ class FileSplitterApp:
         
         include_delim = self.config.get_setting('Settings', 'include_delimiter', 'False') == 'True'
         self.include_delim_var.set(include_delim)
+        self.regex_multiline_var.set(
+            self.config.get_setting('Settings', 'regex_multiline', 'True') == 'True')
+        self.regex_dotall_var.set(
+            self.config.get_setting('Settings', 'regex_dotall', 'False') == 'True')
+        self.keep_partial_var.set(
+            self.config.get_setting('Settings', 'keep_partial', 'False') == 'True')
+        self.resumable_var.set(
+            self.config.get_setting('Settings', 'resumable', 'False') == 'True')
+        self.profile_var.set(
+            self.config.get_setting('Settings', 'profile', 'False') == 'True')
+        self.batch_concurrency_var.set(
+            self.config.get_setting('Settings', 'batch_concurrency', '2'))
     
     def update_ui_for_mode(self, mode):
         """根据分割模式更新界面状态"""
@@ -104,28 +133,40 @@ class FileSplitterApp:
             self.chars_entry.grid()  # 显示字符数输入框
     # ---------- 保存设置 ----------
     def save_settings(self, event=None):
-        mode = self.line_mode_combo.get_value()
-        self.config.set_setting('Settings', 'split_mode', mode)
-
-        if mode == "按行分割":
-            self.config.set_setting('Settings', 'lines_per_file', self.chars_entry.get_value())
-        elif mode == "份数分割":
-            self.config.set_setting('Settings', 'parts_per_file', self.chars_entry.get_value())
-        else:
-            self.config.set_setting('Settings', 'chars_per_file', self.chars_entry.get_value())
-
-        # 补上下面两行
-        self.config.set_setting('Settings', 'input_encoding',  self.encoding_combo.get_value())
-        self.config.set_setting('Settings', 'output_encoding', self.output_encoding_combo.get_value())
+        with self.config.batch():  # 多项设置合并为一次写盘
+            mode = self.line_mode_combo.get_value()
+            self.config.set_setting('Settings', 'split_mode', mode)
+
+            if mode == "按行分割":
+                self.config.set_setting('Settings', 'lines_per_file', self.chars_entry.get_value())
+            elif mode in ("份数分割", "整行份数分割"):
+                self.config.set_setting('Settings', 'parts_per_file', self.chars_entry.get_value())
+            elif mode in ("按字节分割", "整行字节分割"):
+                self.config.set_setting('Settings', 'bytes_per_file', self.chars_entry.get_value())
+            else:
+                self.config.set_setting('Settings', 'chars_per_file', self.chars_entry.get_value())
+
+            # 补上下面两行
+            self.config.set_setting('Settings', 'input_encoding',  self.encoding_combo.get_value())
+            self.config.set_setting('Settings', 'output_encoding', self.output_encoding_combo.get_value())
+            self.config.set_setting('Settings', 'output_compression', self.compression_combo.get_value())
         
-        # 保存正则表达式设置
-        self.config.set_setting('Settings', 'regex_pattern', self.regex_entry.get())
-        self.config.set_setting('Settings', 'include_delimiter', str(self.include_delim_var.get()))
+            # 保存正则表达式设置
+            self.config.set_setting('Settings', 'regex_pattern', self.regex_entry.get())
+            self.config.set_setting('Settings', 'include_delimiter', str(self.include_delim_var.get()))
+            self.config.set_setting('Settings', 'regex_multiline', str(self.regex_multiline_var.get()))
+            self.config.set_setting('Settings', 'regex_dotall', str(self.regex_dotall_var.get()))
+            self.config.set_setting('Settings', 'keep_partial', str(self.keep_partial_var.get()))
+            self.config.set_setting('Settings', 'resumable', str(self.resumable_var.get()))
+            self.config.set_setting('Settings', 'profile', str(self.profile_var.get()))
+            self.config.set_setting('Settings', 'batch_concurrency', self.batch_concurrency_var.get())
 
         self.log_widget.log("设置已自动保存")
 
     # ---------- 浏览/打开 ----------
+    # 文件对话框、subprocess 和字体设置对话框只在用到时才导入，缩短启动时间
     def browse_input_file(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="选择要分割的文件",
             filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")])
@@ -135,7 +176,24 @@ class FileSplitterApp:
                 self.output_entry.set_value(os.path.dirname(path))
             self.log_widget.log(f"已选择输入文件: {path}")
 
+    def browse_batch_files(self):
+        from tkinter import filedialog
+        paths = filedialog.askopenfilenames(
+            title="选择要批量分割的文件",
+            filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")])
+        if paths:
+            self.add_batch_files([p.replace('/', os.sep) for p in paths])
+
+    def add_batch_files(self, paths):
+        """把多个文件加入批量队列"""
+        added = self.batch_list.add_paths(paths)
+        if not self.output_entry.get_value() and paths:
+            self.output_entry.set_value(os.path.dirname(paths[0]))
+        self.notebook.select(self.batch_frame)
+        self.log_widget.log(f"已加入批量队列: {added} 个文件")
+
     def browse_output_dir(self):
+        from tkinter import filedialog
         dir_path = filedialog.askdirectory(title="选择输出目录")
         if dir_path:
             self.output_entry.set_value(dir_path)
@@ -148,10 +206,9 @@ class FileSplitterApp:
                 syst = platform.system()
                 if syst == "Windows":
                     os.startfile(path)
-                elif syst == "Darwin":
-                    subprocess.Popen(["open", path])
                 else:
-                    subprocess.Popen(["xdg-open", path])
+                    import subprocess
+                    subprocess.Popen(["open" if syst == "Darwin" else "xdg-open", path])
                 self.log_widget.log(f"已打开输出目录: {path}")
             except Exception as e:
                 messagebox.showerror("错误", f"无法打开目录: {e}")
@@ -168,7 +225,8 @@ class FileSplitterApp:
         # 输入文件
         self.input_entry = LabelledEntry(
             self.main_frame, "输入文件:",
-            browse_cmd=self.browse_input_file, entry_width=50)
+            browse_cmd=self.browse_input_file, entry_width=50,
+            multi_drop_cmd=self.add_batch_files)
         self.input_entry.grid(row=1, column=0, columnspan=3, sticky="ew", pady=5)
 
         # 输出目录
@@ -189,7 +247,8 @@ class FileSplitterApp:
         ttk.Label(split_frame, text="分割方式:", style="Label.TLabel").pack(side=tk.LEFT, padx=(0, 10))
         self.line_mode_combo = LabelledCombobox(
             split_frame, "", 
-            values=["按字符分割", "按行分割", "严格行分割", "灵活行分割", "份数分割", "按正则分割"],
+            values=["按字符分割", "按行分割", "严格行分割", "灵活行分割", "份数分割", "整行份数分割",
+                    "按字节分割", "整行字节分割", "按正则分割"],
             default_value="按字符分割", width=15)
         self.line_mode_combo.pack(side=tk.LEFT)
         
@@ -211,7 +270,12 @@ class FileSplitterApp:
             self.enc_frame, "输出编码:",
             values=["同输入编码", "utf-8", "gbk", "gb2312", "latin1", "ansi"],
             default_value="同输入编码", width=10)
-        self.output_encoding_combo.pack(side=tk.LEFT)
+        self.output_encoding_combo.pack(side=tk.LEFT, padx=(0, 20))
+        self.compression_combo = LabelledCombobox(
+            self.enc_frame, "输出压缩:",
+            values=["不压缩"] + list(OUTPUT_LEVELS),
+            default_value="不压缩", width=8)
+        self.compression_combo.pack(side=tk.LEFT)
 
         # 正则表达式设置 (初始隐藏)
         self.regex_frame = ttk.Frame(self.main_frame)
@@ -230,6 +294,16 @@ class FileSplitterApp:
             variable=self.include_delim_var)
         self.include_delim_check.pack(side=tk.LEFT)
 
+        # 正则标志：^/$ 匹配每行行首行尾、. 匹配换行（分隔符可跨越多行）
+        self.regex_multiline_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            self.regex_frame, text="^$匹配每行",
+            variable=self.regex_multiline_var).pack(side=tk.LEFT, padx=(10, 0))
+        self.regex_dotall_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.regex_frame, text=".匹配换行",
+            variable=self.regex_dotall_var).pack(side=tk.LEFT, padx=(10, 0))
+
         # 进度条
         self.progress_var = tk.DoubleVar()
         ttk.Progressbar(self.main_frame, variable=self.progress_var, maximum=100,
@@ -246,15 +320,49 @@ class FileSplitterApp:
         btn_frame.grid(row=9, column=0, columnspan=3, pady=15)
         self.start_btn = ttk.Button(btn_frame, text="开始分割", command=self.start_split)
         self.start_btn.pack(side=tk.LEFT, padx=10)
+        self.pause_btn = ttk.Button(btn_frame, text="暂停", state=tk.DISABLED, command=self.toggle_pause)
+        self.pause_btn.pack(side=tk.LEFT, padx=10)
+        self.cancel_btn = ttk.Button(btn_frame, text="取消", state=tk.DISABLED, command=self.cancel_split)
+        self.cancel_btn.pack(side=tk.LEFT, padx=10)
+        self.keep_partial_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="取消时保留已完成的文件",
+                        variable=self.keep_partial_var).pack(side=tk.LEFT, padx=10)
+        self.resumable_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="断点续分",
+                        variable=self.resumable_var).pack(side=tk.LEFT, padx=10)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="性能剖析",
+                        variable=self.profile_var).pack(side=tk.LEFT, padx=10)
         ttk.Button(btn_frame, text="字体设置", command=self.open_font_settings).pack(side=tk.LEFT, padx=10)
         self.open_output_btn = ttk.Button(btn_frame, text="打开输出目录", state=tk.DISABLED,
                                         command=self.open_output_directory)
         self.open_output_btn.pack(side=tk.LEFT, padx=10)
-        ttk.Button(btn_frame, text="退出", command=self.root.quit).pack(side=tk.RIGHT, padx=10)
-
-        # 日志区域
-        self.log_widget = LogWidget(self.main_frame)
-        self.log_widget.grid(row=10, column=0, columnspan=3, sticky="nsew")
+        ttk.Button(btn_frame, text="退出", command=self.on_closing).pack(side=tk.RIGHT, padx=10)
+
+        # 日志和批量队列分两个标签页
+        self.notebook = ttk.Notebook(self.main_frame)
+        self.notebook.grid(row=10, column=0, columnspan=3, sticky="nsew")
+
+        # 日志区域（可在配置文件中用 log_file 指定完整日志的保存路径）
+        self.log_widget = LogWidget(
+            self.notebook, log_file=self.config.get_setting('Settings', 'log_file', ''))
+        self.notebook.add(self.log_widget, text="日志")
+
+        # 批量队列：列表中有文件时，"开始分割"按当前参数分割列表中的全部文件
+        self.batch_frame = ttk.Frame(self.notebook, padding=5)
+        self.batch_list = BatchList(self.batch_frame)
+        self.batch_list.pack(fill=tk.BOTH, expand=True)
+        batch_btns = ttk.Frame(self.batch_frame)
+        batch_btns.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(batch_btns, text="添加文件...", command=self.browse_batch_files).pack(side=tk.LEFT)
+        ttk.Button(batch_btns, text="移除选中",
+                   command=self.batch_list.remove_selected).pack(side=tk.LEFT, padx=5)
+        ttk.Button(batch_btns, text="清空", command=self.batch_list.clear).pack(side=tk.LEFT)
+        ttk.Label(batch_btns, text="同时分割:").pack(side=tk.LEFT, padx=(20, 5))
+        self.batch_concurrency_var = tk.StringVar(value="2")
+        ttk.Spinbox(batch_btns, from_=1, to=16, width=4,
+                    textvariable=self.batch_concurrency_var).pack(side=tk.LEFT)
+        self.notebook.add(self.batch_frame, text="批量队列")
         self.main_frame.columnconfigure(0, weight=1)
         self.main_frame.rowconfigure(10, weight=1)
         
@@ -288,15 +396,17 @@ class FileSplitterApp:
 
     # ---------- 字体设置 ----------
     def open_font_settings(self):
+        from .font_settings import FontSettingsDialog
         FontSettingsDialog(
             self.root, self.style_manager, self.log_widget.log,
             self.log_widget.update_font, on_font_applied=self.save_font_settings)
 
     def save_font_settings(self, font_family, font_size, font_weight, font_slant):
-        self.config.set_setting('Settings', 'font_family', font_family)
-        self.config.set_setting('Settings', 'font_size', str(font_size))
-        self.config.set_setting('Settings', 'font_weight', font_weight)
-        self.config.set_setting('Settings', 'font_slant', font_slant)
+        with self.config.batch():
+            self.config.set_setting('Settings', 'font_family', font_family)
+            self.config.set_setting('Settings', 'font_size', str(font_size))
+            self.config.set_setting('Settings', 'font_weight', font_weight)
+            self.config.set_setting('Settings', 'font_slant', font_slant)
         self.log_widget.log(f"字体设置已保存: {font_family}, {font_size}pt")
 
     # ---------- 开始分割 ----------
@@ -304,172 +414,238 @@ class FileSplitterApp:
         self.save_settings()
         input_path = self.input_entry.get_value()
         output_dir = self.output_entry.get_value()
-        if not input_path or not output_dir:
+        batch_paths = self.batch_list.paths()
+        if not (input_path or batch_paths) or not output_dir:
             messagebox.showerror("错误", "请选择输入文件和输出目录")
             return
 
-        mode = self.line_mode_combo.get_value()
+        spec = self.read_split_spec()
+        if spec is None:
+            return
+        mode, value, options = spec
+        options.update(self.compression_options())
+        # 性能剖析的结果写到输出目录中的 <输入文件名>.prof，完成时提示其路径
+        options["profile"] = self.profile_var.get()
         in_enc = self.encoding_combo.get_value()
         out_enc = self.output_encoding_combo.get_value()
 
-        # --------------- 参数解析 ---------------
-        if mode == "按字符分割":
-            split_by_line = False
-            line_mode = None
-        elif mode == "按行分割":
-            try:
-                lines = int(self.chars_entry.get_value())
-                if lines <= 0:
-                    raise ValueError
-            except ValueError:
-                messagebox.showerror("错误", "请输入有效的行数")
-                return
-
-            self.open_output_btn.config(state=tk.DISABLED)
-            self.start_btn.config(state=tk.DISABLED)
-            self.progress_var.set(0)
-            self.status_var.set("开始按行分割...")
-
-            threading.Thread(
-                target=self.run_split_by_lines,
-                args=(input_path, output_dir, lines, in_enc, out_enc),
-                daemon=True).start()
-            return
-        elif mode == "严格行分割":
-            split_by_line = True
-            line_mode = "strict"
-        elif mode == "灵活行分割":
-            split_by_line = True
-            line_mode = "flexible"
-        elif mode == "份数分割":
+        self.set_running(True)
+        self.progress_var.set(0)
+        if batch_paths:
             try:
-                parts = int(self.chars_entry.get_value())
-                if parts <= 0:
-                    raise ValueError
+                concurrency = max(1, int(self.batch_concurrency_var.get()))
             except ValueError:
-                messagebox.showerror("错误", "请输入有效的份数")
-                return
-
-            self.open_output_btn.config(state=tk.DISABLED)
-            self.start_btn.config(state=tk.DISABLED)
-            self.progress_var.set(0)
-            self.status_var.set("开始按份数分割...")
-
-            threading.Thread(
-                target=self.run_split_by_parts,
-                args=(input_path, output_dir, parts, in_enc, out_enc),
-                daemon=True).start()
-            return
-        elif mode == "按正则分割":
+                concurrency = 2
+            # 整体读取速度上限（MB/s）只能在配置文件中设置，0 表示不限
+            max_rate = float(self.config.get_setting('Settings', 'batch_max_rate', '0') or 0)
+            jobs = [SplitJob(path, output_dir, mode, value, in_enc, out_enc,
+                             keep_partial=self.keep_partial, resumable=self.resumable, **options)
+                    for path in batch_paths]
+            for job in jobs:
+                self.batch_list.update_job(job)
+            self.status_var.set(f"开始批量分割 {len(jobs)} 个文件...")
+            threading.Thread(target=self.run_batch, args=(jobs, concurrency, max_rate),
+                             daemon=True).start()
+        else:
+            job = SplitJob(input_path, output_dir, mode, value, in_enc, out_enc, **options)
+            self.status_var.set(f"开始{MODES[mode]}...")
+            threading.Thread(target=self.run_split_job, args=(job,), daemon=True).start()
+
+    def read_split_spec(self):
+        """
+        读取并校验界面上的分割参数
+        :return: (模式名, 字符数/行数/份数或正则表达式, 其他参数)；参数无效时提示并返回 None
+        """
+        label = self.line_mode_combo.get_value()
+        mode = next((key for key, text in MODES.items() if text == label), None)
+        if mode is None:
+            messagebox.showerror("错误", f"未知的分割模式: {label}")
+            return None
+
+        if mode == "regex":
             regex_pattern = self.regex_entry.get().strip()
             if not regex_pattern:
                 messagebox.showerror("错误", "请输入有效的正则表达式")
-                return
-            include_delim = self.include_delim_var.get()
+                return None
+            regex_flags = 0
+            if self.regex_multiline_var.get():
+                regex_flags |= re.MULTILINE
+            if self.regex_dotall_var.get():
+                regex_flags |= re.DOTALL
+            return mode, regex_pattern, {"include_delimiter": self.include_delim_var.get(),
+                                         "regex_flags": regex_flags}
 
-            self.open_output_btn.config(state=tk.DISABLED)
-            self.start_btn.config(state=tk.DISABLED)
-            self.progress_var.set(0)
-            self.status_var.set("开始按正则表达式分割...")
-
-            threading.Thread(
-                target=self.run_split_by_regex,
-                args=(input_path, output_dir, regex_pattern, in_enc, out_enc, include_delim),
-                daemon=True).start()
-            return
-        else:
-            messagebox.showerror("错误", f"未知的分割模式: {mode}")
-            return
-
-        # --------------- 按字符 / 行模式 ---------------
         try:
-            chars = int(self.chars_entry.get_value())
-            if chars <= 0:
+            value = int(self.chars_entry.get_value())
+            if value <= 0:
                 raise ValueError
         except ValueError:
-            messagebox.showerror("错误", "请输入有效的字符数")
-            return
-
-        self.open_output_btn.config(state=tk.DISABLED)
-        self.start_btn.config(state=tk.DISABLED)
-        self.progress_var.set(0)
-        self.status_var.set("开始分割...")
-
-        threading.Thread(
-            target=self.run_split_in_thread,
-            args=(input_path, output_dir, chars, in_enc, out_enc,
-                split_by_line, line_mode),
-            daemon=True).start()
-    def run_split_in_thread(self, *args):
+            messagebox.showerror("错误", {"lines": "请输入有效的行数",
+                                        "parts": "请输入有效的份数",
+                                        "line_parts": "请输入有效的份数",
+                                        "bytes": "请输入有效的字节数",
+                                        "line_bytes": "请输入有效的字节数"}.get(mode, "请输入有效的字符数"))
+            return None
+        return mode, value, {}
+
+    def compression_options(self):
+        """输出压缩参数；压缩级别只能在配置文件中设置（compression_level），留空使用默认级别"""
+        compression = self.compression_combo.get_value()
+        if compression not in OUTPUT_LEVELS:
+            return {}
+        level = self.config.get_setting('Settings', 'compression_level', '').strip()
+        return {"output_compression": compression,
+                "compression_level": int(level) if level.isdigit() else None}
+
+    def run_split_job(self, job):
         try:
-            num = split_file(*args, progress_callback=self.update_progress,
-                             log_callback=self.log_in_ui_thread)
-            self.root.after(0, self.on_split_completed, num)
-        except Exception as e:
-            self.root.after(0, self.on_split_error, e)
-            
-    def run_split_by_regex(self, *args):
-        try:
-            from core.splitter import split_file_by_regex
-            num = split_file_by_regex(
-                *args,
-                progress_callback=self.update_progress,
-                log_callback=self.log_in_ui_thread)
-            self.root.after(0, self.on_split_completed, num)
+            num = job.run(progress_callback=self.make_progress_reporter(),
+                          log_callback=self.log_in_ui_thread, **self.job_options())
+            self.root.after(0, self.on_split_completed, num, job.profile_path)
+        except SplitCancelled:
+            self.root.after(0, self.on_split_cancelled)
         except Exception as e:
             self.root.after(0, self.on_split_error, e)
 
-    def run_split_by_lines(self, *args):
+    def run_batch(self, jobs, concurrency, max_rate):
+        self.batch_queue = BatchQueue(
+            concurrency=concurrency,
+            max_rate=max_rate * 1024 * 1024 if max_rate > 0 else None,
+            progress_callback=self.update_batch_progress,
+            log_callback=self.log_in_ui_thread,
+            job_callback=lambda job: self.root.after(0, self.batch_list.update_job, job),
+            cancel_token=self.cancel_token)
+        for job in jobs:
+            self.batch_queue.add(job)
         try:
-            from core.splitter import split_file_by_lines
-            num = split_file_by_lines(
-                *args,
-                progress_callback=self.update_progress,
-                log_callback=self.log_in_ui_thread)
-            self.root.after(0, self.on_split_completed, num)
+            self.batch_queue.run()
         except Exception as e:
             self.root.after(0, self.on_split_error, e)
+            return
+        if self.cancel_token.cancelled:
+            self.root.after(0, self.on_split_cancelled)
+        else:
+            self.root.after(0, self.on_batch_completed, jobs)
+
+    def make_progress_reporter(self):
+        """进度汇报器限频回调，避免逐行回调淹没 Tk 事件队列"""
+        return ProgressReporter(self.update_progress, detailed=True)
+
+    def update_progress(self, snapshot):
+        self.root.after(0, lambda: (self.progress_var.set(snapshot.percent),
+                                    self.status_var.set(f"处理中: {format_snapshot(snapshot)}")))
+
+    def update_batch_progress(self, snapshot):
+        """批量队列的整体进度（在任务线程中调用）"""
+        queue = self.batch_queue
 
-    def update_progress(self, p):
-        self.root.after(0, lambda: (self.progress_var.set(p),
-                                    self.status_var.set(f"处理中: {int(p)}%")))
+        def refresh():
+            self.progress_var.set(snapshot.percent)
+            self.status_var.set(f"批量处理中: {queue.finished}/{len(queue.jobs)} 个文件 | "
+                                f"{format_snapshot(snapshot)}")
+            for job in queue.jobs:
+                if job.status == RUNNING:
+                    self.batch_list.update_job(job)
+        self.root.after(0, refresh)
 
     def log_in_ui_thread(self, msg):
-        self.root.after(0, lambda: self.log_widget.log(msg))
+        self.log_widget.post(msg)
 
-    def on_split_completed(self, n):
+    def on_split_completed(self, n, profile_path=None):
+        self.log_widget.flush()
+        self.set_running(False)
         self.progress_var.set(100)
         self.status_var.set("分割完成")
-        messagebox.showinfo("完成", f"共创建 {n} 个文件")
-        self.start_btn.config(state=tk.NORMAL)
+        message = f"共创建 {n} 个文件"
+        if profile_path and os.path.isfile(profile_path):
+            message += f"\n剖析结果: {profile_path}"
+        messagebox.showinfo("完成", message)
+        self.open_output_btn.config(state=tk.NORMAL)
+
+    def on_batch_completed(self, jobs):
+        self.log_widget.flush()
+        self.set_running(False)
+        self.progress_var.set(100)
+        self.status_var.set("批量分割完成")
+        done = [job for job in jobs if job.status == DONE]
+        message = (f"完成 {len(done)}/{len(jobs)} 个文件，"
+                   f"共创建 {sum(job.parts for job in done)} 个分割文件")
+        profiles = [job.profile_path for job in done
+                    if job.profile_path and os.path.isfile(job.profile_path)]
+        if profiles:
+            message += "\n剖析结果: " + ", ".join(profiles)
+        failed = [job.name for job in jobs if job.status != DONE]
+        if failed:
+            message += "\n失败: " + ", ".join(failed)
+            messagebox.showwarning("完成", message)
+        else:
+            messagebox.showinfo("完成", message)
         self.open_output_btn.config(state=tk.NORMAL)
 
     def on_split_error(self, e):
+        self.log_widget.flush()
+        self.set_running(False)
         self.progress_var.set(0)
         self.status_var.set("处理出错")
         messagebox.showerror("错误", str(e))
-        self.start_btn.config(state=tk.NORMAL)
 
-    def run_split_by_parts(self, *args):
-        try:
-            from core.splitter import split_file_by_parts
-            num = split_file_by_parts(
-                *args,
-                progress_callback=self.update_progress,
-                log_callback=self.log_in_ui_thread)
-            self.root.after(0, self.on_split_completed, num)
-        except Exception as e:
-            self.root.after(0, self.on_split_error, e)
+    def on_split_cancelled(self):
+        self.log_widget.flush()
+        self.set_running(False)
+        self.progress_var.set(0)
+        self.status_var.set("已取消")
+        if self.keep_partial_var.get():
+            self.open_output_btn.config(state=tk.NORMAL)
+
+    # ---------- 取消/暂停 ----------
+    def set_running(self, running):
+        """切换任务运行状态下各按钮的可用性，开始任务时创建新的取消令牌"""
+        if running:
+            self.cancel_token = CancelToken()
+            self.keep_partial = self.keep_partial_var.get()
+            self.resumable = self.resumable_var.get()
+            self.open_output_btn.config(state=tk.DISABLED)
+        self.start_btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        self.pause_btn.config(state=tk.NORMAL if running else tk.DISABLED, text="暂停")
+
+    def job_options(self):
+        """传给分割函数的取消令牌等参数（在工作线程中调用，不访问 Tk 变量）"""
+        return {"cancel_token": self.cancel_token, "keep_partial": self.keep_partial,
+                "resumable": self.resumable}
+
+    def cancel_split(self):
+        if self.cancel_token:
+            self.cancel_token.cancel()
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.pause_btn.config(state=tk.DISABLED)
+            self.status_var.set("正在取消...")
+            self.log_widget.log("正在取消分割任务...")
+
+    def toggle_pause(self):
+        if not self.cancel_token:
+            return
+        if self.cancel_token.paused:
+            self.cancel_token.resume()
+            self.pause_btn.config(text="暂停")
+            self.log_widget.log("已继续分割")
+        else:
+            self.cancel_token.pause()
+            self.pause_btn.config(text="继续")
+            self.status_var.set("已暂停")
+            self.log_widget.log("已暂停分割")
 
     def on_drop_to_input(self, event):
-        """拖拽文件或文件夹到窗口任意位置，自动填入输入框"""
-        raw = event.data
-        # 处理 Windows 路径可能带花括号及多个文件
-        paths = [p.strip('{}') for p in raw.split('} {') if p.strip('{}')]
+        """拖拽文件或文件夹到窗口任意位置，自动填入输入框；一次拖入多个文件时加入批量队列"""
+        paths = parse_drop_paths(self.root, event.data)
         if not paths:
-            paths = [raw.strip('{}')]
+            return
+        files = [p for p in paths if os.path.isfile(p)]
+        if len(files) > 1:
+            self.add_batch_files(files)
+            return
 
-        first_path = paths[0].replace('/', os.sep)
+        first_path = paths[0]
         if os.path.isfile(first_path):
             # 是文件 → 填入输入文件
             self.input_entry.set_value(first_path)
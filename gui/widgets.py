@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
 import os
+import queue
 from tkinterdnd2 import DND_FILES
+from core.batch import PENDING
 
 class ImmediateCombobox(ttk.Combobox):
     def __init__(self, parent, *args, **kwargs):
@@ -24,9 +26,19 @@ class ImmediateCombobox(ttk.Combobox):
             self._last_value = current_value
             self.event_generate("<<ImmediateSelect>>")
 
+def parse_drop_paths(widget, data):
+    """解析拖放事件中的路径列表（tk 会给含空格的路径加花括号），只保留存在的文件和目录"""
+    paths = [p.replace('/', os.sep) for p in widget.tk.splitlist(data)]
+    return [p for p in paths if os.path.isfile(p) or os.path.isdir(p)]
+
 class LabelledEntry(ttk.Frame):
-    def __init__(self, parent, label_text, default_value="", browse_cmd=None, entry_width=30, **kwargs):
+    def __init__(self, parent, label_text, default_value="", browse_cmd=None, entry_width=30,
+                 multi_drop_cmd=None, **kwargs):
+        """
+        :param multi_drop_cmd: 一次拖入多个文件时调用，传入路径列表；未设置时只取第一个
+        """
         super().__init__(parent, **kwargs)
+        self.multi_drop_cmd = multi_drop_cmd
 
         self.label = ttk.Label(self, text=label_text)
         self.label.pack(side="left", padx=(0, 5))
@@ -43,11 +55,6 @@ class LabelledEntry(ttk.Frame):
         self.entry.drop_target_register(DND_FILES)
         self.entry.dnd_bind('<<Drop>>', self.on_drop)
 
-    def on_drop(self, event):
-        path = event.data.strip('{}').replace('/', os.sep)
-        if os.path.isfile(path) or os.path.isdir(path):
-            self.entry_var.set(path)
-    
     def get_value(self):
         """获取输入框的值"""
         return self.entry_var.get().strip()
@@ -61,11 +68,11 @@ class LabelledEntry(ttk.Frame):
         self.label.config(text=text)
 
     def on_drop(self, event):
-        path = event.data
-        # 处理 Windows 路径可能带花括号的问题
-        path = path.strip('{}').replace('/', os.sep)
-        if os.path.isfile(path) or os.path.isdir(path):
-            self.entry_var.set(path)
+        paths = parse_drop_paths(self, event.data)
+        if len(paths) > 1 and self.multi_drop_cmd:
+            self.multi_drop_cmd(paths)
+        elif paths:
+            self.entry_var.set(paths[0])
 
 class LabelledCombobox(ttk.Frame):
     def __init__(self, parent, label_text, values, default_value="", width=None, combobox_class=None, **kwargs):
@@ -93,11 +100,74 @@ class LabelledCombobox(ttk.Frame):
         """设置下拉框的值"""
         self.combo_var.set(value)
 
-class LogWidget(tk.Frame):
-    """日志显示组件 - 只读"""
+class BatchList(ttk.Frame):
+    """批量分割的文件列表，显示每个文件的大小、状态、进度和分割数"""
+
+    COLUMNS = (("file", "文件", 300), ("size", "大小", 80), ("status", "状态", 60),
+               ("progress", "进度", 60), ("parts", "分割数", 60))
 
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS],
+                                 show="headings", height=6)
+        for key, text, width in self.COLUMNS:
+            self.tree.heading(key, text=text)
+            self.tree.column(key, width=width, anchor="w" if key == "file" else "center",
+                             stretch=key == "file")
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(self, command=self.tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.config(yscrollcommand=scrollbar.set)
+
+        # 可以把多个文件直接拖到列表中
+        self.tree.drop_target_register(DND_FILES)
+        self.tree.dnd_bind('<<Drop>>', lambda e: self.add_paths(parse_drop_paths(self, e.data)))
+
+    def add_paths(self, paths):
+        """加入文件（忽略目录和重复的文件），返回实际加入的数量"""
+        added = 0
+        for path in paths:
+            if not os.path.isfile(path) or self.tree.exists(path):
+                continue
+            size = f"{os.path.getsize(path) / (1024 * 1024):.1f} MB"
+            self.tree.insert("", tk.END, iid=path, values=(path, size, PENDING, "", ""))
+            added += 1
+        return added
+
+    def paths(self):
+        return list(self.tree.get_children())
+
+    def remove_selected(self):
+        self.tree.delete(*self.tree.selection())
+
+    def clear(self):
+        self.tree.delete(*self.tree.get_children())
+
+    def update_job(self, job):
+        """按 SplitJob 的状态刷新对应行"""
+        if not self.tree.exists(job.input_path):
+            return
+        percent = f"{job.done * 100 // job.size}%" if job.size else ""
+        self.tree.set(job.input_path, "status", job.status)
+        self.tree.set(job.input_path, "progress", percent)
+        self.tree.set(job.input_path, "parts", "" if job.parts is None else job.parts)
+
+class LogWidget(tk.Frame):
+    """
+    日志显示组件 - 只读
+    工作线程通过 post() 写入队列，UI 线程定时批量取出插入，
+    文本框只保留最近 max_lines 行，完整日志可另存到文件
+    """
+
+    def __init__(self, parent, max_lines=5000, flush_interval=100, log_file=None, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.max_lines = max_lines
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self.log_file = None
+        if log_file:
+            self.set_log_file(log_file)
 
         # 日志标签
         self.log_label = ttk.Label(self, text="操作日志:", style="Label.TLabel")
@@ -119,10 +189,56 @@ class LogWidget(tk.Frame):
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.log_text.config(yscrollcommand=self.scrollbar.set)
 
+        self.after(self.flush_interval, self._drain)
+
     def log(self, message):
-        """追加日志（自动滚动到底部）"""
+        """追加日志（UI 线程调用，自动滚动到底部）"""
+        self.flush()                              # 保持与队列中日志的先后顺序
+        self._append([message])
+
+    def post(self, message):
+        """追加日志（任意线程调用），由 UI 线程定时批量显示"""
+        self.queue.put(message)
+
+    def flush(self):
+        """立即显示队列中积压的日志"""
+        messages = []
+        try:
+            while True:
+                messages.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        if messages:
+            self._append(messages)
+
+    def set_log_file(self, path):
+        """设置完整日志的保存文件，传入空值则关闭"""
+        self.close_log_file()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.log_file = open(path, "a", encoding="utf-8")
+
+    def close_log_file(self):
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+
+    def _drain(self):
+        self.flush()
+        self.after(self.flush_interval, self._drain)
+
+    def _append(self, messages):
+        """一次插入一批日志，并裁剪超出上限的旧行"""
+        text = "\n".join(messages) + "\n"
+        if self.log_file:
+            self.log_file.write(text)
+            self.log_file.flush()
+
         self.log_text.config(state="normal")      # 临时可写
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, text)
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > self.max_lines:
+            self.log_text.delete("1.0", f"{line_count - self.max_lines + 1}.0")
         self.log_text.see(tk.END)
         self.log_text.config(state="disabled")    # 恢复只读
 
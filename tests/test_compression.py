@@ -0,0 +1,110 @@
+import gzip
+import os
+import random
+import re
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from core import parallel
+from core.splitter import (split_file, split_file_by_bytes, split_file_by_line_parts,
+                           split_file_by_lines, split_file_by_parts, split_file_by_regex)
+
+
+class CompressedOutputTest(unittest.TestCase):
+    """压缩输出解压后必须与不压缩时逐字节相同，覆盖小文件（主线程直接写出）和中等大小的文件"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.input_path = os.path.join(cls.tmp_dir, "input.txt")
+        rng = random.Random(0)
+        words = ["alpha", "beta", "中文", "分割", "gamma", "δέλτα", "日志"]
+        with open(cls.input_path, "w", encoding="utf-8", newline="\n") as f:
+            for i in range(30000):
+                if i % 500 == 0:
+                    f.write(f"=== RECORD {i // 500} ===\n")
+                f.write(" ".join(rng.choices(words, k=rng.randint(1, 30))) + "\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def read_parts(self, output_dir, count, compression):
+        """按序号读出全部分割文件（压缩的先解压），输出目录中不能有多余或缺少的文件"""
+        suffix = ".txt.gz" if compression else ".txt"
+        names = [f"input_part{n}{suffix}" for n in range(1, count + 1)]
+        self.assertEqual(sorted(os.listdir(output_dir)), sorted(names))
+        parts = []
+        for name in names:
+            opener = gzip.open if compression else open
+            with opener(os.path.join(output_dir, name), "rb") as f:
+                parts.append(f.read())
+        return parts
+
+    def check(self, split, *args, **kwargs):
+        results = []
+        for compression in (None, "gzip"):
+            output_dir = tempfile.mkdtemp(dir=self.tmp_dir)
+            count = split(self.input_path, output_dir, *args, output_compression=compression,
+                          index_cache=False, **kwargs)
+            results.append(self.read_parts(output_dir, count, compression))
+        plain, compressed = results
+        self.assertGreater(len(plain), 1)
+        self.assertEqual([len(part) for part in compressed], [len(part) for part in plain])
+        self.assertEqual(compressed, plain)
+        return plain
+
+    def test_text_engine(self):
+        for size in (20000, 200000):
+            for split_by_line, line_mode in ((False, "strict"), (True, "strict"),
+                                             (True, "flexible")):
+                with self.subTest(size=size, split_by_line=split_by_line, line_mode=line_mode):
+                    self.check(split_file, size, "utf-8", "gbk", split_by_line, line_mode,
+                               workers=1)
+
+    def test_mid_size_parts(self):
+        """64KB 到 1MB 之间的文件由后台线程写出，每个文件都要写到自己的文件名下"""
+        parts = self.check(split_file, 100000, "utf-8", "gbk", workers=1)
+        self.assertTrue(all(len(part) > 64 * 1024 for part in parts[:-1]))
+
+    def test_lines(self):
+        for lines in (500, 5000):
+            for output_encoding in ("utf-8", "gbk"):  # 按字节复制和解码分割
+                with self.subTest(lines=lines, output_encoding=output_encoding):
+                    self.check(split_file_by_lines, lines, "utf-8", output_encoding, workers=1)
+
+    def test_bytes(self):
+        for size in (30000, 300000):
+            for keep_lines in (False, True):
+                for output_encoding in ("utf-8", "gbk"):
+                    with self.subTest(size=size, keep_lines=keep_lines,
+                                      output_encoding=output_encoding):
+                        self.check(split_file_by_bytes, size, "utf-8", output_encoding,
+                                   keep_lines)
+
+    def test_parts(self):
+        for parts in (4, 40):
+            for output_encoding in ("utf-8", "gbk"):
+                with self.subTest(parts=parts, output_encoding=output_encoding):
+                    self.check(split_file_by_parts, parts, "utf-8", output_encoding)
+                    self.check(split_file_by_line_parts, parts, "utf-8", output_encoding,
+                               workers=1)
+
+    def test_regex(self):
+        self.check(split_file_by_regex, r"^=== RECORD \d+ ===$", "utf-8", "gbk",
+                   regex_flags=re.MULTILINE)
+
+    def test_parallel(self):
+        """并行引擎的各工作进程各自压缩写出"""
+        with mock.patch.object(parallel, "PARALLEL_MIN_SIZE", 0):
+            for parts in (4, 40):
+                with self.subTest(parts=parts):
+                    self.check(split_file_by_parts, parts, "utf-8", "gbk")
+                    self.check(split_file_by_line_parts, parts, "utf-8", "gbk", workers=2)
+            self.check(split_file, 50000, "utf-8", "gbk", workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
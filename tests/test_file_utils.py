@@ -0,0 +1,31 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.file_utils import DETECT_SAMPLE_SIZE, DETECT_SAMPLES, detect_encoding
+
+
+class DetectEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_sparse_utf8_tail(self):
+        """开头约 1MB 全是 ASCII、结尾才有中文的 UTF-8 文件，最后一个样本必须读到文件末尾"""
+        tail = "最后几行中文内容，用来检测编码。\n" * 3
+        path = os.path.join(self.tmp_dir, "sparse.txt")
+        # 覆盖 (文件大小 - 样本大小) 除以 (样本数 - 1) 的各种余数
+        for prefix in range(1000000, 1000000 + DETECT_SAMPLES):
+            with open(path, "wb") as f:
+                f.write(b"a" * prefix + b"\n" + tail.encode("utf-8"))
+            size = os.path.getsize(path)
+            with self.subTest(size=size,
+                              remainder=(size - DETECT_SAMPLE_SIZE) % (DETECT_SAMPLES - 1)):
+                self.assertEqual(detect_encoding(path), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
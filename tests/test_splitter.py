@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.cancel import CancelToken, SplitCancelled
+from core.splitter import split_file, split_file_by_bytes, split_file_by_lines
+
+
+class StrictResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.tmp_dir, "long_line.txt")
+        with open(self.input_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("a" * 100 + "\n" + "b" * 2500000 + "\n" + "c" * 10 + "\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def split(self, output_dir, **kwargs):
+        return split_file(self.input_path, output_dir, 1000000, "utf-8", "utf-8", True, "strict",
+                          workers=1, resumable=True, keep_partial=True, index_cache=False,
+                          **kwargs)
+
+    def part_sizes(self, output_dir, count):
+        return [os.path.getsize(os.path.join(output_dir, f"long_line_part{n}.txt"))
+                for n in range(1, count + 1)]
+
+    def test_cancel_inside_long_line(self):
+        """在超长行中间取消后续分，超长行的剩余部分仍写入同一个文件，结果与一次分割完成相同"""
+        full_dir = os.path.join(self.tmp_dir, "full")
+        expected = self.part_sizes(full_dir, self.split(full_dir))
+        self.assertEqual(len(expected), 3)
+
+        resumed_dir = os.path.join(self.tmp_dir, "resumed")
+        token = CancelToken()
+
+        def cancel_after_first_part(message):
+            # 第一个文件在超长行的第一块读出后结束，检查点记录的续分位置在超长行中间
+            if message.startswith("已创建分割文件: long_line_part1"):
+                token.cancel()
+
+        with self.assertRaises(SplitCancelled):
+            self.split(resumed_dir, cancel_token=token, log_callback=cancel_after_first_part)
+        self.assertTrue(os.path.isfile(os.path.join(resumed_dir, "long_line_part1.txt")))
+        self.assertFalse(os.path.exists(os.path.join(resumed_dir, "long_line_part2.txt")))
+
+        self.assertEqual(self.part_sizes(resumed_dir, self.split(resumed_dir)), expected)
+
+
+class NewlineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.tmp_dir, "crlf.txt")
+        with open(self.input_path, "wb") as f:
+            f.write("".join(f"第 {i} 行\r\n" for i in range(100)).encode("utf-8"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def read_parts(self, output_dir, count):
+        data = b""
+        for n in range(1, count + 1):
+            with open(os.path.join(output_dir, f"crlf_part{n}.txt"), "rb") as f:
+                data += f.read()
+        return data
+
+    def test_crlf_same_as_text_engine(self):
+        """输入输出编码相同时按行分割的结果与解码分割一致，换行符都是系统换行符"""
+        expected = "".join(f"第 {i} 行{os.linesep}" for i in range(100)).encode("utf-8")
+        lines_dir = os.path.join(self.tmp_dir, "lines")
+        count = split_file_by_lines(self.input_path, lines_dir, 30, "utf-8", "utf-8",
+                                    workers=1, index_cache=False)
+        self.assertEqual(self.read_parts(lines_dir, count), expected)
+        chars_dir = os.path.join(self.tmp_dir, "chars")
+        count = split_file(self.input_path, chars_dir, 300, "utf-8", "utf-8", True, "strict",
+                           workers=1, index_cache=False)
+        self.assertEqual(self.read_parts(chars_dir, count), expected)
+
+
+class BytesSplitTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.tmp_dir, "short.txt")
+        with open(self.input_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("ab\n中文\nc")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_limit_not_above_bom(self):
+        """每个文件的字节数放不下 BOM 之外的任何内容时报错，而不是一直循环"""
+        for keep_lines in (False, True):
+            for size in (1, 2):
+                with self.subTest(keep_lines=keep_lines, size=size):
+                    with self.assertRaises(ValueError):
+                        split_file_by_bytes(self.input_path, self.tmp_dir, size, "utf-8",
+                                            "utf-16", keep_lines, index_cache=False)
+
+    def test_limit_below_one_char(self):
+        """比 BOM 加一个字符还小时每个字符单独成为一个文件"""
+        for keep_lines in (False, True):
+            with self.subTest(keep_lines=keep_lines):
+                output_dir = os.path.join(self.tmp_dir, f"keep_lines_{keep_lines}")
+                count = split_file_by_bytes(self.input_path, output_dir, 3, "utf-8", "utf-16",
+                                            keep_lines, index_cache=False)
+                self.assertEqual(count, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()